@@ -1,8 +1,23 @@
 """Sistema de cache para dados da API."""
 
 from .cache_manager import CacheManager, get_cache_manager
+from .catalog import CatalogSnapshot
+from .logo_store import LogoStore, get_logo_store
+from .page_cache import PageCache, get_page_cache
+from .redis_backend import RedisCatalogBackend
+from .response_cache import ResponseCache
+from .sheets_state import SheetsState, get_sheets_state
 
 __all__ = [
     "CacheManager",
-    "get_cache_manager"
+    "CatalogSnapshot",
+    "LogoStore",
+    "PageCache",
+    "RedisCatalogBackend",
+    "ResponseCache",
+    "SheetsState",
+    "get_cache_manager",
+    "get_logo_store",
+    "get_page_cache",
+    "get_sheets_state"
 ]
@@ -5,14 +5,20 @@ Implementa cache em JSON com TTL de 24 horas, com suporte opcional
 para Redis/KV para deploy em produção.
 """
 
+import asyncio
+import itertools
 import json
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 import os
 
 from ..models.distro import DistroMetadata
+from .catalog import CatalogSnapshot
+from .file_utils import write_atomic
+from .redis_backend import RedisCatalogBackend
+from .response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -23,26 +29,47 @@ class CacheManager:
     
     Suporta dois backends:
     - JSON: cache local em arquivo (desenvolvimento)
-    - Redis/KV: cache distribuído (produção - futuro)
+    - Redis/KV: cache distribuído (produção), com o snapshot em memória
+      como L1 na frente
     
     TTL padrão: 24 horas (conforme especificação do Módulo 1)
     """
     
     DEFAULT_TTL = 86400  # 24 horas em segundos
+    MAX_STALENESS = int(os.getenv("CACHE_MAX_STALENESS", "259200"))  # 72 horas além do TTL
+    # Um catálogo novo menor que esta fração do atual é tratado como falha da fonte
+    MIN_CATALOG_RATIO = float(os.getenv("CACHE_MIN_CATALOG_RATIO", "0.5"))
     CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "cache"
     DISTROS_CACHE_FILE = "distros_cache.json"
     
-    def __init__(self, use_redis: bool = False):
+    def __init__(
+        self,
+        use_redis: bool = False,
+        redis_client=None,
+        stale_while_revalidate: bool = True
+    ):
         """
         Inicializa o gerenciador de cache.
         
         Args:
-            use_redis: Se deve usar Redis em vez de JSON (futuro).
+            use_redis: Se deve usar Redis em vez de JSON.
+            redis_client: Cliente Redis já criado (ex: fakeredis em testes).
+                Se omitido, conecta em REDIS_URL.
+            stale_while_revalidate: Servir catálogo expirado enquanto uma
+                atualização roda em background.
         """
         self.use_redis = use_redis
-        self.redis_client = None
-        self._memory_cache = {}  # Sempre inicializar com cache em memória como fallback
+        self.stale_while_revalidate = stale_while_revalidate
+        self.redis_client = redis_client
+        self._redis: Optional[RedisCatalogBackend] = None
+        self._catalog: Optional[CatalogSnapshot] = None  # Snapshot em memória (sempre disponível como fallback)
+        self._generations = itertools.count(1)
+        self._refresh_task: Optional[asyncio.Task] = None  # Atualização em curso (single-flight)
+        self.response_cache = ResponseCache(
+            max_entries=int(os.getenv("RESPONSE_CACHE_SIZE", str(ResponseCache.DEFAULT_MAX_ENTRIES)))
+        )
         self._use_file_cache = True  # Flag para saber se pode usar arquivo
+        self._file_mtime: Optional[int] = None  # mtime do arquivo já carregado/gravado por esta instância
         
         # Tentar criar diretório de cache
         try:
@@ -56,92 +83,368 @@ class CacheManager:
             self._init_redis()
     
     def _init_redis(self):
-        """Inicializa cliente Redis (implementação futura)."""
-        # TODO: Implementar quando necessário para produção
-        logger.warning("Redis não implementado ainda, usando JSON como fallback")
-        self.use_redis = False
+        """
+        Inicializa o backend Redis.
+        
+        Em caso de falha (pacote ausente, servidor inacessível), mantém o
+        cache em JSON como fallback.
+        """
+        try:
+            if self.redis_client is not None:
+                backend = RedisCatalogBackend(self.redis_client)
+            else:
+                redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+                backend = RedisCatalogBackend.from_url(redis_url)
+                self.redis_client = backend.client
+            
+            backend.ping()
+            backend.subscribe(self._on_remote_publish)
+            self._redis = backend
+            logger.info("Cache Redis inicializado")
+        except Exception as e:
+            logger.warning(f"Não foi possível inicializar Redis ({e}), usando JSON como fallback")
+            self.use_redis = False
+            self._redis = None
+    
+    def _on_remote_publish(self, message: Dict[str, Any]):
+        """
+        Descarta o snapshot em memória quando outra instância publica.
+        
+        Se o conteúdo publicado é o mesmo do snapshot em memória, ele é
+        mantido (a nova validade é adotada em get_catalog()).
+        
+        Args:
+            message: Mensagem recebida no canal de invalidação.
+        """
+        catalog = self._catalog
+        if catalog is not None and message.get("content_version") == catalog.content_version:
+            logger.info(f"Catálogo publicado por outra instância ({message.get('timestamp')}) sem mudanças, L1 mantido")
+            return
+        
+        self._swap_catalog(None)
+        logger.info(f"Novo catálogo publicado por outra instância ({message.get('timestamp')}), L1 descartado")
+    
+    def close(self):
+        """Libera conexões do backend distribuído."""
+        if self._redis is not None:
+            self._redis.close()
+            self._redis = None
     
     @property
     def cache_file_path(self) -> Path:
         """Caminho do arquivo de cache JSON."""
         return self.CACHE_DIR / self.DISTROS_CACHE_FILE
     
-    def _is_cache_valid(self, cache_data: Dict[str, Any]) -> bool:
+    def _load_file_catalog(self) -> Optional[CatalogSnapshot]:
         """
-        Verifica se o cache ainda é válido (não expirou).
+        Carrega o catálogo do arquivo de cache, validando-o uma única vez.
         
-        Args:
-            cache_data: Dados do cache.
+        Returns:
+            Snapshot do arquivo (mesmo expirado) ou None se inexistente.
+        """
+        if not self._use_file_cache:
+            return None
+        
+        try:
+            mtime = self.cache_file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            logger.info("Cache em arquivo não encontrado")
+            return None
+        
+        with open(self.cache_file_path, 'r', encoding='utf-8') as f:
+            cache_data = json.load(f)
+        
+        if not cache_data.get("timestamp"):
+            logger.warning("Cache em arquivo sem timestamp, ignorando")
+            return None
+        
+        self._file_mtime = mtime
+        return CatalogSnapshot.from_cache_data(
+            cache_data,
+            default_ttl=self.DEFAULT_TTL,
+            generation=next(self._generations)
+        )
+    
+    def _load_redis_catalog(self) -> Optional[CatalogSnapshot]:
+        """
+        Carrega o catálogo compartilhado do Redis.
         
         Returns:
-            True se o cache é válido, False caso contrário.
+            Snapshot do Redis (mesmo expirado) ou None se indisponível.
         """
-        timestamp_str = cache_data.get("timestamp")
-        if not timestamp_str:
-            return False
+        if self._redis is None:
+            return None
         
         try:
-            cache_time = datetime.fromisoformat(timestamp_str)
-            expiry_time = cache_time + timedelta(seconds=self.DEFAULT_TTL)
-            return datetime.utcnow() < expiry_time
+            cache_data = self._redis.load()
         except Exception as e:
-            logger.warning(f"Erro ao validar cache: {e}")
-            return False
+            logger.warning(f"Erro ao ler cache do Redis: {e}")
+            return None
+        
+        if not cache_data or not cache_data.get("timestamp"):
+            logger.info("Cache Redis vazio")
+            return None
+        
+        return CatalogSnapshot.from_cache_data(
+            cache_data,
+            default_ttl=self.DEFAULT_TTL,
+            generation=next(self._generations)
+        )
     
-    def get_distros_cache(self) -> Optional[List[DistroMetadata]]:
+    def _load_shared_catalog(self) -> Optional[CatalogSnapshot]:
         """
-        Recupera lista de distribuições do cache.
+        Carrega o catálogo do backend persistente (Redis, depois arquivo).
         
         Returns:
-            Lista de DistroMetadata ou None se cache inválido/inexistente.
+            Snapshot (mesmo expirado) ou None se inexistente.
+        """
+        catalog = self._load_redis_catalog()
+        if catalog is None:
+            catalog = self._load_file_catalog()
+        return catalog
+    
+    def _persisted_is_newer(self, catalog: CatalogSnapshot) -> bool:
+        """
+        Verifica, sem reconstruir nada, se o cache persistente mudou.
+        
+        Redis: compara a validade gravada nos metadados com a do snapshot.
+        Se só a validade mudou (mesmo content_version, ex: renew_catalog()
+        de outra instância), ela é adotada no snapshot em memória e não há
+        o que recarregar.
+        Arquivo: compara o mtime com o do arquivo que esta instância já
+        carregou ou gravou.
+        
+        Args:
+            catalog: Snapshot em memória.
+        
+        Returns:
+            True se vale a pena recarregar o catálogo persistente.
+        """
+        if self._redis is not None:
+            try:
+                meta = self._redis.load_meta()
+            except Exception as e:
+                logger.warning(f"Erro ao ler metadados do Redis: {e}")
+                meta = None
+            if meta and meta.get("timestamp"):
+                expiry = datetime.fromisoformat(meta["timestamp"]) + timedelta(
+                    seconds=meta.get("ttl_seconds", self.DEFAULT_TTL)
+                )
+                if expiry <= catalog.expiry:
+                    return False
+                if meta.get("content_version") != catalog.content_version:
+                    return True
+                
+                # Mesmos dados: estender a validade, mantendo respostas em cache
+                ttl_seconds = int((expiry - catalog.timestamp).total_seconds())
+                self._catalog = catalog.renewed(ttl_seconds=ttl_seconds)
+                logger.info(f"Validade do catálogo estendida por outra instância até {expiry.isoformat()}")
+                return False
+        
+        if self._use_file_cache:
+            try:
+                mtime = self.cache_file_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                return False
+            return mtime != self._file_mtime
+        
+        return False
+    
+    def _swap_catalog(self, catalog: Optional[CatalogSnapshot]):
+        """
+        Troca o snapshot em memória e descarta as respostas do anterior.
+        
+        Args:
+            catalog: Novo snapshot (ou None para descartar o L1).
+        """
+        self._catalog = catalog
+        self.response_cache.clear()
+    
+    def get_catalog(self, allow_stale: bool = False) -> Optional[CatalogSnapshot]:
+        """
+        Recupera o snapshot atual do catálogo.
+        
+        O snapshot em memória é devolvido diretamente, sem revalidar os
+        registros. Redis/arquivo só são lidos quando não há snapshot em
+        memória, ou quando ele expirou e o cache persistente foi gravado
+        depois dele (outra instância ou o job); caso contrário o chamador
+        segue direto para a atualização, sem reconstruir o mesmo catálogo.
+        
+        Args:
+            allow_stale: Aceitar catálogo expirado há menos de MAX_STALENESS.
+        
+        Returns:
+            CatalogSnapshot válido ou None se cache inválido/inexistente.
         """
+        grace_seconds = self.MAX_STALENESS if allow_stale else 0
+        
         try:
             # Sempre tentar cache em memória primeiro
-            if "distros" in self._memory_cache:
-                cache_data = self._memory_cache["distros"]
-                if self._is_cache_valid(cache_data):
-                    distros_data = cache_data.get("distros", [])
-                    distros = [
-                        DistroMetadata(**distro_dict) 
-                        for distro_dict in distros_data
-                    ]
-                    logger.info(f"Cache em memória recuperado: {len(distros)} distribuições")
-                    return distros
+            catalog = self._catalog
+            if catalog is not None:
+                if catalog.is_valid(grace_seconds=grace_seconds):
+                    return catalog
+                if not self._persisted_is_newer(catalog):
+                    # Pode ter sido renovado a partir dos metadados
+                    catalog = self._catalog
+                    if catalog is not None and catalog.is_valid(grace_seconds=grace_seconds):
+                        return catalog
+                    return None
             
-            # Se não há cache em memória, tentar arquivo
-            if not self._use_file_cache:
+            # Se não há cache em memória (ou o persistente é mais novo), tentar Redis/arquivo
+            catalog = self._load_shared_catalog()
+            if catalog is None:
                 logger.info("Nenhum cache disponível")
                 return None
             
-            if not self.cache_file_path.exists():
-                logger.info("Cache em arquivo não encontrado")
-                return None
-            
-            with open(self.cache_file_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
-            # Verificar validade do cache
-            if not self._is_cache_valid(cache_data):
-                logger.info("Cache em arquivo expirado")
+            if not catalog.is_valid(grace_seconds=grace_seconds):
+                # Guardado mesmo expirado: serve de fallback e evita que as
+                # próximas chamadas reconstruam o mesmo catálogo
+                self._swap_catalog(catalog)
+                logger.info("Cache persistente expirado")
                 return None
             
-            # Converter dicionários para objetos DistroMetadata
-            distros_data = cache_data.get("distros", [])
-            distros = [
-                DistroMetadata(**distro_dict) 
-                for distro_dict in distros_data
-            ]
-            
             # Salvar em memória também
-            self._memory_cache["distros"] = cache_data
-            
-            logger.info(f"Cache em arquivo recuperado: {len(distros)} distribuições")
-            return distros
+            self._swap_catalog(catalog)
+            logger.info(f"Cache persistente recuperado: {len(catalog)} distribuições")
+            return catalog
             
         except Exception as e:
             logger.error(f"Erro ao ler cache: {e}")
             return None
     
+    def get_distros_cache(self) -> Optional[List[DistroMetadata]]:
+        """
+        Recupera lista de distribuições do cache.
+        
+        Returns:
+            Lista de DistroMetadata ou None se cache inválido/inexistente.
+        """
+        catalog = self.get_catalog()
+        if catalog is None:
+            return None
+        return list(catalog.distros)
+    
+    def last_catalog(self) -> Optional[CatalogSnapshot]:
+        """
+        Último snapshot conhecido, mesmo expirado.
+        
+        Returns:
+            Snapshot em memória ou persistente, ou None se não há nenhum.
+        """
+        if self._catalog is not None:
+            return self._catalog
+        try:
+            return self._load_shared_catalog()
+        except Exception as e:
+            logger.warning(f"Não foi possível carregar o catálogo anterior: {e}")
+            return None
+    
+    def publish_catalog(self, distros: List[DistroMetadata]) -> CatalogSnapshot:
+        """
+        Cria um novo snapshot do catálogo e o publica no cache.
+        
+        O snapshot em memória é substituído de uma só vez; requisições em
+        andamento continuam usando o snapshot anterior. Registros iguais
+        aos do snapshot anterior mantêm seu `last_updated` (e ETag).
+        
+        Um catálogo vazio, ou que encolheu abaixo de MIN_CATALOG_RATIO do
+        snapshot atual, não é publicado: uma fonte com problema não pode
+        substituir um catálogo bom.
+        
+        Args:
+            distros: Lista de distribuições já validadas.
+        
+        Returns:
+            Snapshot publicado.
+        
+        Raises:
+            ValueError: Catálogo vazio ou encolhido demais.
+        """
+        previous = self.last_catalog()
+        
+        if not distros:
+            raise ValueError("Catálogo vazio não será publicado")
+        if previous is not None and len(distros) < len(previous) * self.MIN_CATALOG_RATIO:
+            raise ValueError(
+                f"Catálogo com {len(distros)} distribuições não será publicado "
+                f"(atual tem {len(previous)}, mínimo {self.MIN_CATALOG_RATIO:.0%})"
+            )
+        
+        catalog = CatalogSnapshot(
+            distros,
+            timestamp=datetime.utcnow(),
+            ttl_seconds=self.DEFAULT_TTL,
+            generation=next(self._generations),
+            previous=previous
+        )
+        
+        # Sempre salvar em memória
+        self._swap_catalog(catalog)
+        logger.info(f"Cache em memória atualizado: {len(catalog)} distribuições")
+        
+        self._persist_catalog(catalog)
+        return catalog
+    
+    def renew_catalog(self, catalog: CatalogSnapshot) -> CatalogSnapshot:
+        """
+        Estende a validade de um catálogo cuja fonte não mudou.
+        
+        O snapshot é reaproveitado com um novo TTL (contado a partir de
+        agora); registros, índices, ETags e respostas em cache continuam
+        valendo, pois os dados são os mesmos.
+        
+        Args:
+            catalog: Snapshot confirmado como atual pela fonte.
+        
+        Returns:
+            Snapshot renovado.
+        """
+        age = int((datetime.utcnow() - catalog.timestamp).total_seconds())
+        renewed = catalog.renewed(ttl_seconds=max(age, 0) + self.DEFAULT_TTL)
+        
+        # Mesmos dados e mesma geração: as respostas em cache continuam válidas
+        self._catalog = renewed
+        logger.info(f"Catálogo sem alterações na fonte, validade estendida até {renewed.expiry.isoformat()}")
+        
+        self._persist_catalog(renewed, renewal=True)
+        return renewed
+    
+    def _persist_catalog(self, catalog: CatalogSnapshot, renewal: bool = False):
+        """
+        Grava o snapshot no Redis e no arquivo (falhas só são registradas).
+        
+        Args:
+            catalog: Snapshot a gravar.
+            renewal: Só a validade mudou: no Redis, atualizar apenas os
+                metadados, sem avisar as outras instâncias.
+        """
+        cache_data = catalog.to_cache_data()
+        
+        # Publicar no Redis (avisa as outras instâncias)
+        if self._redis is not None:
+            try:
+                if renewal and self._redis.renew(catalog.to_cache_meta()):
+                    logger.info(f"Validade do cache Redis estendida: {len(catalog)} distribuições")
+                else:
+                    self._redis.save(cache_data)
+                    logger.info(f"Cache Redis atualizado: {len(catalog)} distribuições")
+            except Exception as e:
+                logger.warning(f"Não foi possível salvar cache no Redis: {e}. Cache em memória OK.")
+        
+        # Tentar salvar em arquivo também
+        if self._use_file_cache:
+            try:
+                # Arquivo temporário + os.replace: leitores nunca veem um cache pela metade
+                write_atomic(
+                    self.cache_file_path,
+                    json.dumps(cache_data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+                )
+                self._file_mtime = self.cache_file_path.stat().st_mtime_ns
+                logger.info(f"Cache em arquivo atualizado: {len(catalog)} distribuições")
+            except Exception as e:
+                logger.warning(f"Não foi possível salvar cache em arquivo: {e}. Cache em memória OK.")
+    
     def set_distros_cache(self, distros: List[DistroMetadata]) -> bool:
         """
         Salva lista de distribuições no cache.
@@ -153,31 +456,8 @@ class CacheManager:
             True se salvou com sucesso, False caso contrário.
         """
         try:
-            cache_data = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "ttl_seconds": self.DEFAULT_TTL,
-                "count": len(distros),
-                "distros": [
-                    distro.model_dump(mode='json') 
-                    for distro in distros
-                ]
-            }
-            
-            # Sempre salvar em memória
-            self._memory_cache["distros"] = cache_data
-            logger.info(f"Cache em memória atualizado: {len(distros)} distribuições")
-            
-            # Tentar salvar em arquivo também
-            if self._use_file_cache:
-                try:
-                    with open(self.cache_file_path, 'w', encoding='utf-8') as f:
-                        json.dump(cache_data, f, indent=2, ensure_ascii=False, default=str)
-                    logger.info(f"Cache em arquivo atualizado: {len(distros)} distribuições")
-                except Exception as e:
-                    logger.warning(f"Não foi possível salvar cache em arquivo: {e}. Cache em memória OK.")
-            
+            self.publish_catalog(distros)
             return True
-            
         except Exception as e:
             logger.error(f"Erro ao salvar cache: {e}")
             return False
@@ -190,27 +470,18 @@ class CacheManager:
             Dicionário com metadados do cache ou None.
         """
         try:
-            if not self.cache_file_path.exists():
+            catalog = self._catalog
+            if catalog is None:
+                catalog = self._load_shared_catalog()
+            if catalog is None:
                 return None
             
-            with open(self.cache_file_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
-            timestamp_str = cache_data.get("timestamp")
-            timestamp = datetime.fromisoformat(timestamp_str) if timestamp_str else None
-            
-            is_valid = self._is_cache_valid(cache_data)
-            
-            expiry = None
-            if timestamp:
-                expiry = timestamp + timedelta(seconds=self.DEFAULT_TTL)
-            
             return {
-                "valid": is_valid,
-                "timestamp": timestamp,
-                "expiry": expiry,
-                "count": cache_data.get("count", 0),
-                "ttl_seconds": cache_data.get("ttl_seconds", self.DEFAULT_TTL)
+                "valid": catalog.is_valid(),
+                "timestamp": catalog.timestamp,
+                "expiry": catalog.expiry,
+                "count": len(catalog),
+                "ttl_seconds": catalog.ttl_seconds
             }
             
         except Exception as e:
@@ -225,9 +496,9 @@ class CacheManager:
             True se invalidou com sucesso.
         """
         try:
-            # Se usando cache em memória
-            if self._memory_cache is not None:
-                self._memory_cache.clear()
+            # Descartar snapshot em memória
+            if self._catalog is not None:
+                self._swap_catalog(None)
                 logger.info("Cache em memória invalidado")
                 return True
             
@@ -239,37 +510,112 @@ class CacheManager:
             logger.error(f"Erro ao invalidar cache: {e}")
             return False
     
-    def get_or_fetch(
+    def _start_refresh(self, fetch_func: Callable[[], Awaitable[CatalogSnapshot]]) -> asyncio.Task:
+        """
+        Inicia a atualização do catálogo, ou reaproveita a que já está em curso.
+        
+        Args:
+            fetch_func: Função assíncrona que busca os dados e publica o catálogo.
+        
+        Returns:
+            Task da atualização em andamento.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._refresh_task
+        
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return task
+        
+        task = loop.create_task(fetch_func())
+        task.add_done_callback(self._on_refresh_done)
+        self._refresh_task = task
+        return task
+    
+    def _on_refresh_done(self, task: asyncio.Task):
+        """Libera o slot de atualização e registra falhas."""
+        if self._refresh_task is task:
+            self._refresh_task = None
+        
+        if task.cancelled():
+            logger.warning("Atualização do catálogo cancelada")
+        elif task.exception() is not None:
+            logger.error(f"Erro ao atualizar catálogo: {task.exception()}")
+    
+    async def refresh(self, fetch_func: Callable[[], Awaitable[CatalogSnapshot]]) -> CatalogSnapshot:
+        """
+        Atualiza o catálogo (single-flight).
+        
+        Chamadas concorrentes aguardam a mesma atualização em vez de
+        disparar buscas paralelas na fonte de dados.
+        
+        Args:
+            fetch_func: Função assíncrona que busca os dados e publica o catálogo.
+        
+        Returns:
+            Snapshot publicado pela atualização.
+        """
+        # shield: o cancelamento de uma requisição não cancela a busca compartilhada
+        return await asyncio.shield(self._start_refresh(fetch_func))
+    
+    def schedule_refresh(self, fetch_func: Callable[[], Awaitable[CatalogSnapshot]]) -> bool:
+        """
+        Agenda uma atualização em background, se nenhuma estiver em curso.
+        
+        Args:
+            fetch_func: Função assíncrona que busca os dados e publica o catálogo.
+        
+        Returns:
+            True se uma nova atualização foi iniciada.
+        """
+        in_flight = self._refresh_task
+        task = self._start_refresh(fetch_func)
+        started = task is not in_flight
+        if started:
+            logger.info("Catálogo expirado, atualização iniciada em background")
+        return started
+    
+    async def get_or_fetch(
         self, 
-        fetch_func: callable,
+        fetch_func: Callable[[], Awaitable[CatalogSnapshot]],
         force_refresh: bool = False
-    ) -> List[DistroMetadata]:
+    ) -> CatalogSnapshot:
         """
         Retorna dados do cache ou busca novos se necessário.
         
+        Com STALE_WHILE_REVALIDATE ativo, um catálogo expirado continua
+        sendo servido (até MAX_STALENESS) enquanto uma única atualização
+        roda em background. Sem catálogo utilizável, a requisição aguarda
+        a atualização compartilhada; se ela falhar, o último catálogo
+        conhecido é servido mesmo além de MAX_STALENESS (stale-if-error).
+        
         Args:
-            fetch_func: Função assíncrona para buscar dados novos.
+            fetch_func: Função assíncrona que busca os dados e publica o catálogo.
             force_refresh: Se deve forçar atualização mesmo com cache válido.
         
         Returns:
-            Lista de distribuições.
+            Snapshot do catálogo (use is_valid() para saber se está expirado).
         """
-        # Se forçar refresh, invalidar cache
         if force_refresh:
-            self.invalidate_cache()
+            return await self.refresh(fetch_func)
+        
+        catalog = self.get_catalog(allow_stale=self.stale_while_revalidate)
         
-        # Tentar recuperar do cache
-        cached_distros = self.get_distros_cache()
+        if catalog is None:
+            # Cache inválido/inexistente, buscar novos dados
+            logger.info("Buscando novos dados...")
+            try:
+                return await self.refresh(fetch_func)
+            except Exception as e:
+                fallback = self.last_catalog()
+                if fallback is None or not len(fallback):
+                    raise
+                logger.warning(f"Atualização falhou ({e}), servindo catálogo antigo de {fallback.timestamp.isoformat()}")
+                return fallback
         
-        if cached_distros is not None:
-            return cached_distros
+        if not catalog.is_valid():
+            self.schedule_refresh(fetch_func)
         
-        # Cache inválido/inexistente, buscar novos dados
-        logger.info("Buscando novos dados...")
-        # Nota: fetch_func deve ser chamada com await no contexto async
-        # Esta função será usada de forma síncrona, então retornamos None
-        # para indicar que precisa buscar
-        return None
+        return catalog
 
 
 # Singleton do gerenciador de cache
@@ -288,6 +634,10 @@ def get_cache_manager() -> CacheManager:
     if _cache_manager_instance is None:
         # Verificar se deve usar Redis via variável de ambiente
         use_redis = os.getenv("USE_REDIS_CACHE", "false").lower() == "true"
-        _cache_manager_instance = CacheManager(use_redis=use_redis)
+        stale_while_revalidate = os.getenv("CACHE_STALE_WHILE_REVALIDATE", "true").lower() == "true"
+        _cache_manager_instance = CacheManager(
+            use_redis=use_redis,
+            stale_while_revalidate=stale_while_revalidate
+        )
     
     return _cache_manager_instance
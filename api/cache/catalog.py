@@ -0,0 +1,571 @@
+"""
+Snapshot imutável do catálogo de distribuições.
+
+O snapshot é construído (e validado) uma única vez, quando o cache é
+gravado ou carregado, e depois apenas lido pelas requisições.
+"""
+
+import hashlib
+import re
+from collections import defaultdict
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from pydantic import TypeAdapter
+
+from ..models.distro import DistroMetadata, DistroFamily, DesktopEnvironment
+from .search_index import SearchIndex, normalize_text
+
+
+# Chaves de ordenação suportadas -> valor de ordenação (None vai para o fim)
+SORT_KEYS: Dict[str, Callable[[DistroMetadata], Any]] = {
+    "name": lambda d: d.name.lower(),
+    "release_date": lambda d: d.latest_release_date,
+    "ranking": lambda d: d.ranking,
+    "rating": lambda d: d.rating,
+}
+
+
+_DATETIME_ADAPTER = TypeAdapter(Optional[datetime])
+
+
+def _digest(data: bytes) -> str:
+    """Hash curto e estável usado em ETags e versões do catálogo."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def alias_keys(value: str) -> List[str]:
+    """
+    Variações de um id ou nome usadas no índice de aliases.
+
+    Ex: "Pop!_OS" -> ["pop!_os", "pop-os", "popos"].
+
+    Args:
+        value: Id, slug antigo ou nome da distribuição.
+
+    Returns:
+        Chaves normalizadas (sem repetição).
+    """
+    slug = re.sub(r"[^a-z0-9]+", "-", normalize_text(value)).strip("-")
+    keys = [value.strip().casefold(), slug, slug.replace("-", "")]
+    return [key for key in dict.fromkeys(keys) if key]
+
+
+def content_digest(distro: DistroMetadata) -> str:
+    """
+    Hash do conteúdo de um registro, ignorando `last_updated`.
+
+    Args:
+        distro: Registro do catálogo.
+
+    Returns:
+        Hash hexadecimal.
+    """
+    return _digest(distro.model_dump_json(exclude={"last_updated"}).encode("utf-8"))
+
+
+def catalog_digest(digests: Iterable[str]) -> str:
+    """
+    Hash do conteúdo de um catálogo (sem timestamp).
+
+    Args:
+        digests: content_digest() de cada registro, na ordem do catálogo.
+
+    Returns:
+        Hash hexadecimal.
+    """
+    return _digest("\n".join(digests).encode("utf-8"))
+
+
+class CatalogSnapshot:
+    """
+    Catálogo de distribuições pronto para servir.
+
+    Os registros são guardados em uma tupla e os atributos são somente
+    leitura. Uma atualização do catálogo cria um novo snapshot, que
+    substitui o anterior de forma atômica no CacheManager.
+
+    Índices invertidos (família e ambiente gráfico -> posições na tupla)
+    e permutações pré-ordenadas para cada chave de SORT_KEYS (nos dois
+    sentidos) são montados junto com o snapshot, de modo que os filtros
+    viram interseções de conjuntos e nenhuma requisição precisa ordenar.
+    O índice de busca textual (SearchIndex) também é montado aqui, assim
+    como os mapas id -> posição e alias -> posição usados nas buscas por
+    id em tempo constante.
+
+    Cada registro tem um ETag derivado do seu conteúdo, e o snapshot tem
+    uma `version` derivada dos registros e do timestamp; ambos são iguais
+    em todas as instâncias que servem os mesmos dados.
+
+    O JSON de cada registro é codificado uma única vez (serializador do
+    pydantic-core, o mesmo usado pelo FastAPI), e as respostas são
+    montadas juntando esses fragmentos.
+
+    Os objetos DistroMetadata são compartilhados entre requisições e
+    não devem ser modificados.
+    """
+
+    __slots__ = (
+        "_distros", "_timestamp", "_ttl_seconds", "_generation",
+        "_family_index", "_desktop_index", "_orderings", "_order_ranks",
+        "_search_index", "_content_digests", "_record_etags", "_version",
+        "_id_index", "_alias_index", "_record_json", "_timestamp_json"
+    )
+
+    def __init__(
+        self,
+        distros: Iterable[DistroMetadata],
+        timestamp: datetime,
+        ttl_seconds: int,
+        generation: int = 0,
+        previous: Optional["CatalogSnapshot"] = None
+    ):
+        """
+        Cria o snapshot a partir de registros já validados.
+
+        Args:
+            distros: Distribuições do catálogo.
+            timestamp: Momento em que os dados foram gerados.
+            ttl_seconds: Tempo de vida do catálogo em segundos.
+            generation: Número sequencial do snapshot neste processo.
+            previous: Snapshot anterior; registros com o mesmo conteúdo
+                reaproveitam o objeto anterior (e seu `last_updated`),
+                para que o ETag do registro só mude quando os dados mudam.
+        """
+        self._timestamp = timestamp
+        self._ttl_seconds = ttl_seconds
+        self._generation = generation
+        self._build_digests(distros, previous)
+        self._build_indexes()
+        self._build_lookup()
+        self._build_orderings()
+        self._search_index = SearchIndex(self._distros)
+    
+    def _build_digests(
+        self,
+        distros: Iterable[DistroMetadata],
+        previous: Optional["CatalogSnapshot"]
+    ):
+        """Calcula hashes de conteúdo, ETags por registro e a versão do snapshot."""
+        previous_by_id: Dict[str, Tuple[DistroMetadata, str]] = {}
+        if previous is not None:
+            previous_by_id = {
+                distro.id: (distro, digest)
+                for distro, digest in zip(previous._distros, previous._content_digests)
+            }
+
+        records: List[DistroMetadata] = []
+        content_digests: List[str] = []
+        record_etags: List[str] = []
+        record_json: List[bytes] = []
+
+        for distro in distros:
+            digest = content_digest(distro)
+            previous_record = previous_by_id.get(distro.id)
+            if previous_record is not None and previous_record[1] == digest:
+                distro = previous_record[0]
+
+            records.append(distro)
+            content_digests.append(digest)
+            record_etags.append(_digest(f"{digest}:{distro.last_updated.isoformat()}".encode("utf-8")))
+            record_json.append(distro.__pydantic_serializer__.to_json(distro))
+
+        self._distros: Tuple[DistroMetadata, ...] = tuple(records)
+        self._record_json: Tuple[bytes, ...] = tuple(record_json)
+        self._timestamp_json: bytes = _DATETIME_ADAPTER.dump_json(self._timestamp)
+        self._content_digests: Tuple[str, ...] = tuple(content_digests)
+        self._record_etags: Tuple[str, ...] = tuple(record_etags)
+        self._version = _digest(
+            "\n".join((self._timestamp.isoformat(), *record_etags)).encode("utf-8")
+        )
+
+    def _build_indexes(self):
+        """Monta os índices invertidos de família e ambiente gráfico."""
+        family_index: Dict[DistroFamily, List[int]] = defaultdict(list)
+        desktop_index: Dict[DesktopEnvironment, List[int]] = defaultdict(list)
+
+        for position, distro in enumerate(self._distros):
+            family_index[distro.family].append(position)
+            for desktop_env in set(distro.desktop_environments):
+                desktop_index[desktop_env].append(position)
+
+        self._family_index: Mapping[DistroFamily, FrozenSet[int]] = MappingProxyType({
+            family: frozenset(positions) for family, positions in family_index.items()
+        })
+        self._desktop_index: Mapping[DesktopEnvironment, FrozenSet[int]] = MappingProxyType({
+            desktop_env: frozenset(positions) for desktop_env, positions in desktop_index.items()
+        })
+
+    @classmethod
+    def from_cache_data(
+        cls,
+        cache_data: Dict[str, Any],
+        default_ttl: int,
+        generation: int = 0
+    ) -> "CatalogSnapshot":
+        """
+        Constrói o snapshot a partir do formato serializado do cache.
+
+        É o único ponto em que os registros passam pela validação do
+        Pydantic ao ler o cache.
+
+        Args:
+            cache_data: Dicionário no formato gravado em arquivo.
+            default_ttl: TTL usado se o cache não informar um.
+            generation: Número sequencial do snapshot.
+
+        Returns:
+            Snapshot validado.
+        """
+        distros = [
+            DistroMetadata(**distro_dict)
+            for distro_dict in cache_data.get("distros", [])
+        ]
+        return cls(
+            distros,
+            timestamp=datetime.fromisoformat(cache_data["timestamp"]),
+            ttl_seconds=cache_data.get("ttl_seconds", default_ttl),
+            generation=generation
+        )
+
+    def to_cache_data(self) -> Dict[str, Any]:
+        """
+        Serializa o snapshot no formato gravado em arquivo.
+
+        Returns:
+            Dicionário serializável em JSON.
+        """
+        cache_data = self.to_cache_meta()
+        cache_data["distros"] = [
+            distro.model_dump(mode='json')
+            for distro in self._distros
+        ]
+        return cache_data
+
+    def to_cache_meta(self) -> Dict[str, Any]:
+        """
+        Metadados do snapshot (to_cache_data() sem os registros).
+
+        Returns:
+            Dicionário serializável em JSON.
+        """
+        return {
+            "timestamp": self._timestamp.isoformat(),
+            "ttl_seconds": self._ttl_seconds,
+            "count": len(self._distros),
+            "content_version": self.content_version
+        }
+
+    @property
+    def distros(self) -> Tuple[DistroMetadata, ...]:
+        """Distribuições do catálogo, na ordem de origem."""
+        return self._distros
+
+    @property
+    def timestamp(self) -> datetime:
+        """Momento em que os dados foram gerados."""
+        return self._timestamp
+
+    @property
+    def ttl_seconds(self) -> int:
+        """Tempo de vida do catálogo em segundos."""
+        return self._ttl_seconds
+
+    @property
+    def expiry(self) -> datetime:
+        """Momento em que o catálogo expira."""
+        return self._timestamp + timedelta(seconds=self._ttl_seconds)
+
+    @property
+    def generation(self) -> int:
+        """Número sequencial do snapshot neste processo."""
+        return self._generation
+
+    @property
+    def version(self) -> str:
+        """Hash dos registros e do timestamp (igual entre instâncias)."""
+        return self._version
+
+    @property
+    def content_version(self) -> str:
+        """Hash só do conteúdo dos registros (não muda com o timestamp)."""
+        return catalog_digest(self._content_digests)
+
+    def record_digest(self, position: int) -> str:
+        """
+        Hash do conteúdo do registro na posição indicada (content_digest()).
+
+        Args:
+            position: Posição em `distros`.
+
+        Returns:
+            Hash hexadecimal.
+        """
+        return self._content_digests[position]
+
+    def renewed(self, ttl_seconds: int) -> "CatalogSnapshot":
+        """
+        Cópia do snapshot com outro TTL.
+
+        Registros, índices, fragmentos JSON, ETags e `version` são
+        compartilhados: usado quando a fonte confirma que os dados não
+        mudaram, sem reconstruir nada.
+
+        Args:
+            ttl_seconds: Novo tempo de vida, contado a partir de `timestamp`.
+
+        Returns:
+            Novo snapshot.
+        """
+        snapshot = object.__new__(type(self))
+        for slot in self.__slots__:
+            setattr(snapshot, slot, getattr(self, slot))
+        snapshot._ttl_seconds = ttl_seconds
+        return snapshot
+
+    def record_etag(self, position: int) -> str:
+        """
+        Hash do registro na posição indicada (muda só quando ele muda).
+
+        Args:
+            position: Posição em `distros`.
+
+        Returns:
+            Hash hexadecimal (sem aspas).
+        """
+        return self._record_etags[position]
+
+    def _build_lookup(self):
+        """Monta os mapas id -> posição e alias -> posição."""
+        id_index: Dict[str, int] = {}
+        alias_index: Dict[str, int] = {}
+
+        for position, distro in enumerate(self._distros):
+            id_index.setdefault(distro.id, position)
+
+        # Aliases: id e nome normalizados (slugs antigos, ids gerados pelo nome).
+        # Em conflito, vence o registro que aparece primeiro no catálogo.
+        for position, distro in enumerate(self._distros):
+            for key in alias_keys(distro.id) + alias_keys(distro.name):
+                alias_index.setdefault(key, position)
+
+        self._id_index: Mapping[str, int] = MappingProxyType(id_index)
+        self._alias_index: Mapping[str, int] = MappingProxyType(alias_index)
+
+    def _build_orderings(self):
+        """Pré-calcula as permutações de ordenação de cada chave e sentido."""
+        orderings: Dict[Tuple[str, bool], Tuple[int, ...]] = {}
+        order_ranks: Dict[Tuple[str, bool], Tuple[int, ...]] = {}
+
+        for sort_by, key_func in SORT_KEYS.items():
+            values = [key_func(distro) for distro in self._distros]
+            present = [i for i, value in enumerate(values) if value is not None]
+            missing = [i for i, value in enumerate(values) if value is None]
+
+            for descending in (False, True):
+                # sorted() é estável nos dois sentidos; registros sem valor ficam no fim
+                ordering = tuple(
+                    sorted(present, key=values.__getitem__, reverse=descending) + missing
+                )
+                ranks = [0] * len(ordering)
+                for rank, position in enumerate(ordering):
+                    ranks[position] = rank
+
+                orderings[(sort_by, descending)] = ordering
+                order_ranks[(sort_by, descending)] = tuple(ranks)
+
+        self._orderings: Mapping[Tuple[str, bool], Tuple[int, ...]] = MappingProxyType(orderings)
+        self._order_ranks: Mapping[Tuple[str, bool], Tuple[int, ...]] = MappingProxyType(order_ranks)
+
+    def record_json(self, position: int) -> bytes:
+        """
+        JSON pré-codificado do registro (igual a DistroMetadata.model_dump_json()).
+
+        Args:
+            position: Posição em `distros`.
+
+        Returns:
+            Bytes UTF-8.
+        """
+        return self._record_json[position]
+
+    def render_page(
+        self,
+        positions: Sequence[int],
+        total: int,
+        page: int,
+        page_size: int
+    ) -> bytes:
+        """
+        Monta o JSON de DistroListResponse a partir dos fragmentos.
+
+        O resultado é idêntico, byte a byte, a
+        DistroListResponse(...).model_dump_json().
+
+        Args:
+            positions: Posições dos registros da página, já ordenadas.
+            total: Total de registros após os filtros.
+            page: Número da página.
+            page_size: Tamanho da página.
+
+        Returns:
+            Corpo JSON (bytes UTF-8).
+        """
+        record_json = self._record_json
+        return b"".join((
+            b'{"distros":[',
+            b",".join([record_json[position] for position in positions]),
+            b'],"total":%d,"page":%d,"page_size":%d,"cache_timestamp":' % (total, page, page_size),
+            self._timestamp_json,
+            b"}",
+        ))
+
+    def find(self, distro_id: str) -> Optional[int]:
+        """
+        Localiza um registro pelo id ou por um alias, em tempo constante.
+
+        Args:
+            distro_id: Id atual, slug antigo ou nome da distribuição.
+
+        Returns:
+            Posição em `distros` ou None se não encontrado.
+        """
+        position = self._id_index.get(distro_id)
+        if position is not None:
+            return position
+
+        for key in alias_keys(distro_id):
+            position = self._alias_index.get(key)
+            if position is not None:
+                return position
+
+        return None
+
+    def get(self, distro_id: str) -> Optional[DistroMetadata]:
+        """
+        Retorna o registro pelo id ou alias.
+
+        Args:
+            distro_id: Id atual, slug antigo ou nome da distribuição.
+
+        Returns:
+            DistroMetadata ou None.
+        """
+        position = self.find(distro_id)
+        return self._distros[position] if position is not None else None
+
+    def filter_positions(
+        self,
+        family: Optional[DistroFamily] = None,
+        desktop_env: Optional[DesktopEnvironment] = None
+    ) -> Optional[FrozenSet[int]]:
+        """
+        Seleciona as posições que atendem aos filtros usando os índices.
+
+        Args:
+            family: Filtro por família/base.
+            desktop_env: Filtro por ambiente gráfico.
+
+        Returns:
+            Conjunto de posições em `distros`, ou None se nenhum filtro
+            foi informado (todas as posições).
+        """
+        selected: Optional[FrozenSet[int]] = None
+
+        if family is not None:
+            selected = self._family_index.get(family, frozenset())
+
+        if desktop_env is not None:
+            positions = self._desktop_index.get(desktop_env, frozenset())
+            selected = positions if selected is None else selected & positions
+
+        return selected
+
+    def ordered_positions(
+        self,
+        positions: Optional[FrozenSet[int]],
+        sort_by: Optional[str],
+        descending: bool = False
+    ) -> Sequence[int]:
+        """
+        Devolve as posições selecionadas na ordem pedida, sem ordenar.
+
+        Args:
+            positions: Posições selecionadas (None para todas).
+            sort_by: Chave de SORT_KEYS; outra chave mantém a ordem de origem.
+            descending: Ordem decrescente.
+
+        Returns:
+            Sequência de posições em `distros` (não modificar).
+        """
+        ordering = self._orderings.get((sort_by, descending))
+
+        if ordering is None:
+            return range(len(self._distros)) if positions is None else sorted(positions)
+
+        if positions is None:
+            return ordering
+
+        # Seleções pequenas: ordenar só os selecionados pelo rank pré-calculado
+        if len(positions) * 8 < len(ordering):
+            return sorted(positions, key=self._order_ranks[(sort_by, descending)].__getitem__)
+
+        return [position for position in ordering if position in positions]
+
+    def search(
+        self,
+        query: str,
+        positions: Optional[FrozenSet[int]] = None
+    ) -> Dict[int, float]:
+        """
+        Busca textual em nome, resumo e descrição.
+
+        Args:
+            query: Texto da busca.
+            positions: Restringir às posições selecionadas (None para todas).
+
+        Returns:
+            Posição -> pontuação de relevância.
+        """
+        hits = self._search_index.search(query)
+        if positions is not None:
+            hits = {position: score for position, score in hits.items() if position in positions}
+        return hits
+
+    def rank_by_relevance(self, hits: Dict[int, float]) -> List[int]:
+        """
+        Ordena resultados da busca por relevância (empate: ordem de nome).
+
+        Args:
+            hits: Resultado de search().
+
+        Returns:
+            Posições ordenadas.
+        """
+        name_ranks = self._order_ranks[("name", False)]
+        return sorted(hits, key=lambda position: (-hits[position], name_ranks[position]))
+
+    def is_valid(self, now: Optional[datetime] = None, grace_seconds: int = 0) -> bool:
+        """
+        Verifica se o snapshot ainda não expirou.
+
+        Args:
+            now: Momento de referência (padrão: agora, em UTC).
+            grace_seconds: Tolerância além do TTL (catálogo "stale").
+
+        Returns:
+            True se o snapshot está dentro do TTL (mais a tolerância).
+        """
+        deadline = self.expiry + timedelta(seconds=grace_seconds)
+        return (now or datetime.utcnow()) < deadline
+
+    def __len__(self) -> int:
+        return len(self._distros)
+
+    def __repr__(self) -> str:
+        return (
+            f"CatalogSnapshot(count={len(self._distros)}, "
+            f"generation={self._generation}, "
+            f"timestamp={self._timestamp.isoformat()})"
+        )
@@ -0,0 +1,34 @@
+"""
+Utilitários de escrita de arquivos do cache.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_atomic(path: Path, data: bytes):
+    """
+    Grava um arquivo de forma atômica.
+
+    O conteúdo vai para um arquivo temporário no mesmo diretório e só
+    então substitui o destino via os.replace; leitores (e um processo
+    interrompido no meio da escrita) nunca veem um arquivo parcial.
+
+    Args:
+        path: Arquivo de destino.
+        data: Conteúdo completo.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,421 @@
+"""
+Armazenamento local das logos das distribuições.
+
+As logos são baixadas no refresh do catálogo (não na requisição do
+cliente) e guardadas por conteúdo: blobs/<hash>.<ext>. O mesmo hash
+sempre tem os mesmos bytes, então /logos/<hash>.<ext> pode ser servido
+com cache imutável. Com Pillow instalado, são geradas também variantes
+redimensionadas (LOGO_SIZES) em PNG.
+
+O índice (index.json) liga cada distribuição à origem da logo, aos
+validadores HTTP da origem (para revalidar com requisição condicional)
+e aos hashes do original e das variantes.
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from .file_utils import write_atomic
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow é opcional: sem ele, só o original é servido
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Tipos aceitos -> extensão do blob
+CONTENT_TYPES = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/gif": "gif",
+    "image/webp": "webp",
+    "image/svg+xml": "svg",
+    "image/x-icon": "ico",
+    "image/vnd.microsoft.icon": "ico",
+}
+MEDIA_TYPES = {ext: content_type for content_type, ext in CONTENT_TYPES.items()}
+MEDIA_TYPES["ico"] = "image/x-icon"
+
+BLOB_NAME = re.compile(r"^[0-9a-f]{32}\.(png|jpg|gif|webp|svg|ico)$")
+
+
+def logo_source(distro) -> Optional[str]:
+    """
+    URL de origem da logo de uma distribuição.
+
+    Args:
+        distro: DistroMetadata.
+
+    Returns:
+        logo_url (planilha) ou logo (DistroWatch), se houver.
+    """
+    return distro.logo_url or distro.logo
+
+
+class LogoStore:
+    """
+    Logos endereçadas por conteúdo, com variantes redimensionadas.
+
+    Layout do diretório:
+    - index.json -> {distro_id: {source, etag, last_modified, original,
+      variants: {tamanho: blob}, fetched_at}}
+    - blobs/<hash>.<ext> -> bytes da imagem
+
+    Se o diretório não puder ser criado, o store fica desativado e o
+    endpoint de imagem redireciona para a origem.
+    """
+
+    STORE_DIR = Path(os.getenv(
+        "LOGO_STORE_DIR",
+        str(Path(__file__).parent.parent.parent / "data" / "logos")
+    ))
+    SIZES = [int(size) for size in os.getenv("LOGO_SIZES", "32,64,128").split(",") if size.strip()]
+    CONCURRENCY = int(os.getenv("LOGO_CONCURRENCY", "4"))
+    MAX_BYTES = int(os.getenv("LOGO_MAX_BYTES", str(1024 * 1024)))
+    TIMEOUT = 15.0
+
+    def __init__(self, directory: Optional[Path] = None):
+        """
+        Inicializa o store.
+
+        Args:
+            directory: Diretório do store (padrão: STORE_DIR).
+        """
+        self.directory = Path(directory) if directory is not None else self.STORE_DIR
+        self.blobs_dir = self.directory / "blobs"
+        self.index_path = self.directory / "index.json"
+        self.enabled = True
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._index_mtime: Optional[int] = None
+        self._sync_task: Optional[asyncio.Task] = None
+
+        try:
+            self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            logger.warning(f"Não é possível usar o store de logos ({e}), desativado")
+            self.enabled = False
+            return
+
+        self._load_index()
+
+    def _load_index(self):
+        """Relê o índice se outro processo (ex: o job) o regravou."""
+        try:
+            mtime = self.index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime == self._index_mtime:
+            return
+
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self._index = json.load(f)
+            self._index_mtime = mtime
+        except Exception as e:
+            logger.warning(f"Índice de logos ilegível: {e}")
+
+    def lookup(self, distro_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Entrada de uma distribuição.
+
+        Args:
+            distro_id: ID da distribuição.
+
+        Returns:
+            Entrada do índice ou None se a logo não foi baixada.
+        """
+        if not self.enabled:
+            return None
+        self._load_index()
+        return self._index.get(distro_id)
+
+    def blob_path(self, name: str) -> Optional[Path]:
+        """
+        Caminho de um blob.
+
+        Args:
+            name: Nome do blob (<hash>.<ext>).
+
+        Returns:
+            Caminho, ou None se o nome é inválido ou o blob não existe.
+        """
+        if not self.enabled or not BLOB_NAME.match(name):
+            return None
+        path = self.blobs_dir / name
+        return path if path.exists() else None
+
+    @staticmethod
+    def pick(entry: Dict[str, Any], size: Optional[int] = None) -> str:
+        """
+        Blob mais adequado para um tamanho.
+
+        Args:
+            entry: Entrada do índice.
+            size: Lado em pixels desejado (None = original).
+
+        Returns:
+            Menor variante com lado >= size, ou o original.
+        """
+        if size:
+            candidates = sorted(
+                (int(side), name) for side, name in entry.get("variants", {}).items() if int(side) >= size
+            )
+            if candidates:
+                return candidates[0][1]
+        return entry["original"]
+
+    def _write_blob(self, data: bytes, ext: str) -> str:
+        name = f"{hashlib.blake2b(data, digest_size=16).hexdigest()}.{ext}"
+        path = self.blobs_dir / name
+        if not path.exists():
+            write_atomic(path, data)
+        return name
+
+    def _make_variants(self, data: bytes) -> Dict[str, str]:
+        """Gera as variantes PNG menores que o original (requer Pillow)."""
+        if Image is None:
+            return {}
+
+        variants = {}
+        with Image.open(io.BytesIO(data)) as image:
+            image.load()
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+            for size in self.SIZES:
+                if max(image.size) <= size:
+                    continue
+                variant = image.copy()
+                variant.thumbnail((size, size), Image.LANCZOS)
+                buffer = io.BytesIO()
+                variant.save(buffer, format="PNG", optimize=True)
+                variants[str(size)] = self._write_blob(buffer.getvalue(), "png")
+        return variants
+
+    def _save_index(self):
+        write_atomic(
+            self.index_path,
+            json.dumps(self._index, ensure_ascii=False, indent=1).encode("utf-8")
+        )
+
+    async def _read_limited(self, response: httpx.Response) -> bytes:
+        """
+        Lê o corpo de uma resposta em streaming, até MAX_BYTES.
+
+        Args:
+            response: Resposta aberta com stream=True.
+
+        Returns:
+            Corpo completo.
+
+        Raises:
+            ValueError: Se o corpo (declarado ou lido) passa de MAX_BYTES.
+        """
+        declared = response.headers.get("content-length", "")
+        if declared.isdigit() and int(declared) > self.MAX_BYTES:
+            raise ValueError(f"imagem grande demais ({declared} bytes)")
+
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            # Sem Content-Length (ou com um valor falso): parar assim que passar do limite
+            if size > self.MAX_BYTES:
+                raise ValueError(f"imagem grande demais (mais de {self.MAX_BYTES} bytes)")
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    async def _sync_one(self, client: httpx.AsyncClient, distro_id: str, source: str) -> str:
+        """
+        Baixa (ou revalida) a logo de uma distribuição.
+
+        Returns:
+            'downloaded', 'unchanged', 'not_modified' ou 'failed'.
+        """
+        # Importação tardia: api.services importa api.cache
+        from ..services.resilience import get_resilience
+
+        previous = self._index.get(distro_id)
+        if previous and self.blob_path(previous.get("original", "")) is None:
+            previous = None  # blob sumiu: baixar de novo
+        headers = {}
+        if previous and previous.get("source") == source:
+            if previous.get("etag"):
+                headers["If-None-Match"] = previous["etag"]
+            if previous.get("last_modified"):
+                headers["If-Modified-Since"] = previous["last_modified"]
+
+        try:
+            async with get_resilience().stream(client, source, headers=headers) as response:
+                if response.status_code == 304 and previous:
+                    self._index[distro_id] = dict(previous, fetched_at=datetime.utcnow().isoformat())
+                    return "not_modified"
+                response.raise_for_status()
+
+                content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+                ext = CONTENT_TYPES.get(content_type)
+                if ext is None:
+                    raise ValueError(f"tipo de conteúdo não suportado: {content_type or '?'}")
+
+                content = await self._read_limited(response)
+                etag = response.headers.get("etag")
+                last_modified = response.headers.get("last-modified")
+
+            original = await asyncio.to_thread(self._write_blob, content, ext)
+            if previous and previous.get("original") == original:
+                variants = previous.get("variants", {})
+                status = "unchanged"
+            else:
+                try:
+                    variants = {} if ext == "svg" else await asyncio.to_thread(self._make_variants, content)
+                except Exception as e:
+                    logger.warning(f"Não foi possível redimensionar a logo de {distro_id}: {e}")
+                    variants = {}
+                status = "downloaded"
+
+            self._index[distro_id] = {
+                "source": source,
+                "etag": etag,
+                "last_modified": last_modified,
+                "original": original,
+                "variants": variants,
+                "fetched_at": datetime.utcnow().isoformat(),
+            }
+            return status
+
+        except Exception as e:
+            logger.warning(f"Erro ao baixar logo de {distro_id} ({source}): {e}")
+            return "failed"
+
+    async def sync(
+        self,
+        distros: List[Any],
+        client: Optional[httpx.AsyncClient] = None,
+        http_clients: Optional[Any] = None
+    ) -> Dict[str, int]:
+        """
+        Baixa ou revalida as logos do catálogo.
+
+        Logos que falharem mantêm a versão anterior; entradas de
+        distribuições que saíram do catálogo são removidas.
+
+        Args:
+            distros: Registros do catálogo (DistroMetadata).
+            client: Cliente httpx (padrão: cliente "logos" de http_clients).
+            http_clients: Clientes HTTP da aplicação ou do job (HttpClients;
+                padrão: get_http_clients()).
+
+        Returns:
+            Contagens downloaded/unchanged/not_modified/failed/removed.
+        """
+        report = {"downloaded": 0, "unchanged": 0, "not_modified": 0, "failed": 0, "removed": 0}
+        if not self.enabled:
+            return report
+
+        self._load_index()
+        sources = {distro.id: logo_source(distro) for distro in distros if logo_source(distro)}
+        semaphore = asyncio.Semaphore(self.CONCURRENCY)
+        if client is None:
+            # Importação tardia: api.services importa api.cache
+            from ..services.http_clients import get_http_clients
+            client = (http_clients or get_http_clients()).client("logos", timeout=self.TIMEOUT, follow_redirects=True)
+
+        async def sync_one(distro_id: str, source: str):
+            async with semaphore:
+                report[await self._sync_one(client, distro_id, source)] += 1
+
+        await asyncio.gather(*(sync_one(distro_id, source) for distro_id, source in sources.items()))
+
+        for distro_id in list(self._index):
+            if distro_id not in sources:
+                del self._index[distro_id]
+                report["removed"] += 1
+
+        try:
+            self._save_index()
+            self._index_mtime = self.index_path.stat().st_mtime_ns
+        except Exception as e:
+            logger.warning(f"Não foi possível gravar o índice de logos: {e}")
+
+        self.prune()
+        logger.info(
+            f"Logos: {report['downloaded']} baixadas, {report['unchanged']} iguais, "
+            f"{report['not_modified']} não modificadas, {report['failed']} falhas"
+        )
+        return report
+
+    def schedule_sync(self, distros: List[Any], http_clients: Optional[Any] = None) -> bool:
+        """
+        Sincroniza as logos em background, se nenhuma sincronização estiver em curso.
+
+        Args:
+            distros: Registros do catálogo.
+            http_clients: Repassado a sync().
+
+        Returns:
+            True se uma nova sincronização foi iniciada.
+        """
+        if not self.enabled:
+            return False
+
+        task = self._sync_task
+        if task is not None and not task.done():
+            return False
+
+        self._sync_task = asyncio.get_running_loop().create_task(self.sync(distros, http_clients=http_clients))
+        return True
+
+    def prune(self) -> int:
+        """
+        Remove blobs que nenhuma entrada referencia mais.
+
+        Returns:
+            Número de arquivos removidos.
+        """
+        if not self.enabled:
+            return 0
+
+        referenced = set()
+        for entry in self._index.values():
+            referenced.add(entry.get("original"))
+            referenced.update(entry.get("variants", {}).values())
+
+        removed = 0
+        for path in self.blobs_dir.iterdir():
+            if path.name not in referenced and BLOB_NAME.match(path.name):
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+
+        return removed
+
+
+# Instância global do store de logos
+_logo_store: Optional[LogoStore] = None
+
+
+def get_logo_store() -> LogoStore:
+    """
+    Retorna a instância global do store de logos.
+
+    Returns:
+        Instância do LogoStore.
+    """
+    global _logo_store
+
+    if _logo_store is None:
+        _logo_store = LogoStore()
+
+    return _logo_store
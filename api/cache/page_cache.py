@@ -0,0 +1,298 @@
+"""
+Cache em disco das páginas HTML baixadas do DistroWatch.
+
+Cada URL tem uma entrada com os validadores HTTP (ETag, Last-Modified),
+o hash do corpo e, opcionalmente, o resultado do parsing daquele corpo.
+Os corpos são guardados por conteúdo (bodies/<hash>.html), então páginas
+idênticas ocupam um único arquivo.
+
+Em um refresh a página é pedida com If-None-Match/If-Modified-Since;
+em um 304, ou em um 200 com o mesmo hash, o parsing salvo é reutilizado.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .file_utils import write_atomic
+
+logger = logging.getLogger(__name__)
+
+
+def body_digest(body: bytes) -> str:
+    """
+    Hash do corpo de uma página.
+
+    Args:
+        body: Corpo bruto da resposta.
+
+    Returns:
+        Hash hexadecimal (blake2b, 16 bytes).
+    """
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class PageCache:
+    """
+    Cache de páginas endereçado por conteúdo.
+
+    Layout do diretório:
+    - entries/<hash da URL>.json -> url, etag, last_modified, body_hash,
+      encoding, fetched_at, parsed_version, parsed
+    - bodies/<body_hash>.html -> corpo bruto
+
+    Se o diretório não puder ser criado (ex: sistema de arquivos somente
+    leitura), o cache fica desativado e todas as buscas são misses.
+    """
+
+    CACHE_DIR = Path(os.getenv(
+        "PAGE_CACHE_DIR",
+        str(Path(__file__).parent.parent.parent / "data" / "pages")
+    ))
+
+    def __init__(self, directory: Optional[Path] = None):
+        """
+        Inicializa o cache.
+
+        Args:
+            directory: Diretório do cache (padrão: CACHE_DIR).
+        """
+        self.directory = Path(directory) if directory is not None else self.CACHE_DIR
+        self.entries_dir = self.directory / "entries"
+        self.bodies_dir = self.directory / "bodies"
+        self.enabled = True
+
+        try:
+            self.entries_dir.mkdir(parents=True, exist_ok=True)
+            self.bodies_dir.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            logger.warning(f"Não é possível usar o cache de páginas ({e}), desativado")
+            self.enabled = False
+
+    def _entry_path(self, url: str) -> Path:
+        return self.entries_dir / f"{hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()}.json"
+
+    def _body_path(self, digest: str) -> Path:
+        return self.bodies_dir / f"{digest}.html"
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Recupera a entrada de uma URL.
+
+        Args:
+            url: URL da página.
+
+        Returns:
+            Entrada (dict) ou None se a URL nunca foi baixada.
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            with open(self._entry_path(url), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Entrada do cache de páginas ilegível para {url}: {e}")
+            return None
+
+        return entry if entry.get("url") == url else None
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Headers de requisição condicional para revalidar uma entrada.
+
+        Args:
+            entry: Entrada de lookup() (ou None).
+
+        Returns:
+            Headers If-None-Match / If-Modified-Since (pode ser vazio).
+        """
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def read_body(self, entry: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Lê o corpo guardado de uma entrada.
+
+        Args:
+            entry: Entrada de lookup().
+
+        Returns:
+            Corpo bruto ou None se o arquivo sumiu.
+        """
+        try:
+            return self._body_path(entry["body_hash"]).read_bytes()
+        except (KeyError, OSError):
+            return None
+
+    def _write_entry(self, entry: Dict[str, Any]):
+        write_atomic(
+            self._entry_path(entry["url"]),
+            json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        )
+
+    def store(
+        self,
+        url: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        encoding: Optional[str] = None,
+        previous: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Guarda uma página recém-baixada (200).
+
+        Se o hash do corpo for igual ao da entrada anterior, o parsing
+        salvo é mantido.
+
+        Args:
+            url: URL da página.
+            body: Corpo bruto.
+            etag: Header ETag da resposta.
+            last_modified: Header Last-Modified da resposta.
+            encoding: Encoding do corpo.
+            previous: Entrada anterior da URL, se houver.
+
+        Returns:
+            Nova entrada.
+        """
+        digest = body_digest(body)
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body_hash": digest,
+            "encoding": encoding,
+            "fetched_at": datetime.utcnow().isoformat(),
+        }
+        if previous and previous.get("body_hash") == digest:
+            entry["parsed_version"] = previous.get("parsed_version")
+            entry["parsed"] = previous.get("parsed")
+
+        if not self.enabled:
+            return entry
+
+        try:
+            body_path = self._body_path(digest)
+            if not body_path.exists():
+                write_atomic(body_path, body)
+            self._write_entry(entry)
+        except Exception as e:
+            logger.warning(f"Não foi possível gravar {url} no cache de páginas: {e}")
+
+        return entry
+
+    def revalidated(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Registra um 304 (página sem mudanças).
+
+        Args:
+            entry: Entrada de lookup().
+
+        Returns:
+            Entrada com fetched_at atualizado.
+        """
+        entry = dict(entry, fetched_at=datetime.utcnow().isoformat())
+        if self.enabled:
+            try:
+                self._write_entry(entry)
+            except Exception as e:
+                logger.warning(f"Não foi possível atualizar {entry['url']} no cache de páginas: {e}")
+        return entry
+
+    @staticmethod
+    def parsed_result(entry: Optional[Dict[str, Any]], version: int) -> Optional[Any]:
+        """
+        Parsing salvo para o corpo atual da entrada.
+
+        Args:
+            entry: Entrada da URL.
+            version: Versão atual do parser (parsing de outra versão é ignorado).
+
+        Returns:
+            Resultado salvo ou None.
+        """
+        if entry and entry.get("parsed_version") == version:
+            return entry.get("parsed")
+        return None
+
+    def store_parsed(self, entry: Dict[str, Any], parsed: Any, version: int) -> Dict[str, Any]:
+        """
+        Guarda o resultado do parsing do corpo atual da entrada.
+
+        Args:
+            entry: Entrada da URL.
+            parsed: Resultado serializável em JSON.
+            version: Versão do parser.
+
+        Returns:
+            Entrada atualizada.
+        """
+        entry = dict(entry, parsed_version=version, parsed=parsed)
+        if self.enabled:
+            try:
+                self._write_entry(entry)
+            except Exception as e:
+                logger.warning(f"Não foi possível gravar o parsing de {entry['url']}: {e}")
+        return entry
+
+    def prune(self) -> int:
+        """
+        Remove corpos que nenhuma entrada referencia mais.
+
+        Returns:
+            Número de arquivos removidos.
+        """
+        if not self.enabled:
+            return 0
+
+        referenced = set()
+        for path in self.entries_dir.glob("*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    referenced.add(json.load(f).get("body_hash"))
+            except Exception:
+                continue
+
+        removed = 0
+        for path in self.bodies_dir.glob("*.html"):
+            if path.stem not in referenced:
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+
+        return removed
+
+
+# Instância global do cache de páginas
+_page_cache: Optional[PageCache] = None
+
+
+def get_page_cache() -> PageCache:
+    """
+    Retorna a instância global do cache de páginas.
+
+    Returns:
+        Instância do PageCache.
+    """
+    global _page_cache
+
+    if _page_cache is None:
+        _page_cache = PageCache()
+
+    return _page_cache
@@ -0,0 +1,186 @@
+"""
+Backend Redis/KV para o cache do catálogo.
+
+Guarda o catálogo serializado e seus metadados em chaves versionadas,
+compartilhadas entre todas as instâncias da API, e avisa as demais
+instâncias via pub/sub quando um novo catálogo é publicado.
+"""
+
+import json
+import logging
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCatalogBackend:
+    """
+    Armazenamento do catálogo em Redis.
+
+    Layout das chaves (SCHEMA_VERSION muda quando o formato muda):
+    - <prefix>:v<schema>:distros:meta  -> JSON com timestamp, ttl, count e
+      content_version
+    - <prefix>:v<schema>:distros:data  -> JSON com a lista de distros
+    - <prefix>:v<schema>:distros:invalidate -> canal de pub/sub
+
+    Leituras e escritas usam pipeline (uma ida e volta ao servidor) e a
+    escrita é transacional, para que meta e dados nunca fiquem
+    desencontrados.
+    """
+
+    KEY_PREFIX = "distrowiki"
+    SCHEMA_VERSION = 1
+    RETENTION_SECONDS = 7 * 86400  # Manter dados além do TTL lógico do catálogo
+
+    def __init__(self, client, key_prefix: Optional[str] = None):
+        """
+        Inicializa o backend.
+
+        Args:
+            client: Cliente redis-py (ou compatível, ex: fakeredis).
+            key_prefix: Prefixo das chaves (padrão: KEY_PREFIX).
+        """
+        self.client = client
+        self.instance_id = uuid.uuid4().hex
+
+        base = f"{key_prefix or self.KEY_PREFIX}:v{self.SCHEMA_VERSION}:distros"
+        self.meta_key = f"{base}:meta"
+        self.data_key = f"{base}:data"
+        self.channel = f"{base}:invalidate"
+
+        self._pubsub = None
+        self._pubsub_thread = None
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisCatalogBackend":
+        """
+        Cria o backend a partir de uma URL redis://.
+
+        Args:
+            url: URL de conexão do Redis.
+
+        Returns:
+            Instância do backend.
+        """
+        import redis
+
+        client = redis.Redis.from_url(url, socket_timeout=5, socket_connect_timeout=5)
+        return cls(client, **kwargs)
+
+    def ping(self) -> bool:
+        """Verifica a conexão com o servidor."""
+        return bool(self.client.ping())
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Lê o catálogo serializado.
+
+        Returns:
+            Dicionário no mesmo formato do cache JSON ou None se vazio.
+        """
+        pipe = self.client.pipeline(transaction=False)
+        pipe.get(self.meta_key)
+        pipe.get(self.data_key)
+        raw_meta, raw_data = pipe.execute()
+
+        if raw_meta is None or raw_data is None:
+            return None
+
+        cache_data = json.loads(raw_meta)
+        cache_data["distros"] = json.loads(raw_data)
+        return cache_data
+
+    def load_meta(self) -> Optional[Dict[str, Any]]:
+        """
+        Lê só os metadados do catálogo (timestamp, ttl, count, content_version).
+
+        Returns:
+            Metadados ou None se vazio.
+        """
+        raw_meta = self.client.get(self.meta_key)
+        return json.loads(raw_meta) if raw_meta is not None else None
+
+    def save(self, cache_data: Dict[str, Any]) -> None:
+        """
+        Grava o catálogo e avisa as outras instâncias.
+
+        Args:
+            cache_data: Dicionário no formato do cache JSON.
+        """
+        meta = {key: value for key, value in cache_data.items() if key != "distros"}
+        retention = self._retention(meta)
+
+        pipe = self.client.pipeline(transaction=True)
+        pipe.set(self.data_key, json.dumps(cache_data.get("distros", []), ensure_ascii=False), ex=retention)
+        pipe.set(self.meta_key, json.dumps(meta, ensure_ascii=False), ex=retention)
+        pipe.publish(self.channel, json.dumps({
+            "instance": self.instance_id,
+            "timestamp": meta.get("timestamp"),
+            "content_version": meta.get("content_version")
+        }))
+        pipe.execute()
+
+    def renew(self, meta: Dict[str, Any]) -> bool:
+        """
+        Grava só os metadados de um catálogo cujos dados não mudaram.
+
+        Os dados não são reenviados e as outras instâncias não são
+        avisadas: elas adotam a nova validade ao consultar os metadados.
+
+        Args:
+            meta: Metadados do catálogo (sem 'distros').
+
+        Returns:
+            False se os dados não estão mais no Redis (use save()).
+        """
+        retention = self._retention(meta)
+
+        pipe = self.client.pipeline(transaction=True)
+        pipe.expire(self.data_key, retention)
+        pipe.set(self.meta_key, json.dumps(meta, ensure_ascii=False), ex=retention)
+        data_exists, _ = pipe.execute()
+        return bool(data_exists)
+
+    def _retention(self, meta: Dict[str, Any]) -> int:
+        """Tempo de vida das chaves (além do TTL lógico do catálogo)."""
+        return max(self.RETENTION_SECONDS, int(meta.get("ttl_seconds", 0)))
+
+    def delete(self) -> None:
+        """Remove o catálogo compartilhado."""
+        self.client.delete(self.meta_key, self.data_key)
+
+    def subscribe(self, on_invalidate: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Escuta publicações de outras instâncias em uma thread daemon.
+
+        Args:
+            on_invalidate: Chamado com a mensagem quando outra instância
+                publica um novo catálogo.
+        """
+        def handle(message):
+            try:
+                payload = json.loads(message["data"])
+            except (TypeError, ValueError):
+                return
+
+            if payload.get("instance") == self.instance_id:
+                return
+
+            on_invalidate(payload)
+
+        self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self.channel: handle})
+        self._pubsub_thread = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def close(self) -> None:
+        """Encerra a assinatura de pub/sub e a conexão."""
+        if self._pubsub_thread is not None:
+            self._pubsub_thread.stop()
+            self._pubsub_thread = None
+
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+
+        self.client.close()
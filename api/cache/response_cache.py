@@ -0,0 +1,81 @@
+"""
+Cache LRU de respostas já serializadas.
+
+Guarda o corpo JSON pronto de respostas frequentes (ex: as combinações
+mais comuns de filtros de /distros) para que um acerto pule filtragem,
+ordenação, construção do modelo e codificação JSON.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class ResponseCache:
+    """
+    LRU limitado de corpos de resposta (bytes).
+
+    As chaves devem incluir a geração do snapshot do catálogo, de modo
+    que uma resposta nunca seja servida para outro catálogo; além disso,
+    o CacheManager limpa o cache inteiro ao publicar um novo snapshot.
+    """
+
+    DEFAULT_MAX_ENTRIES = 256
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Inicializa o cache.
+
+        Args:
+            max_entries: Número máximo de respostas guardadas.
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._lock = threading.Lock()  # clear() pode vir da thread de pub/sub
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """
+        Recupera um corpo de resposta.
+
+        Args:
+            key: Chave normalizada da requisição.
+
+        Returns:
+            Corpo serializado ou None.
+        """
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def set(self, key: Hashable, body: bytes) -> None:
+        """
+        Guarda um corpo de resposta, descartando o menos usado se cheio.
+
+        Args:
+            key: Chave normalizada da requisição.
+            body: Corpo serializado.
+        """
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove todas as respostas."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,172 @@
+"""
+Índice de busca textual do catálogo.
+
+Montado uma vez por snapshot a partir de nome, resumo e descrição das
+distribuições. O texto é normalizado (minúsculas e sem acentos, para
+que "edicao" encontre "Edição") e quebrado em palavras; um índice de
+n-gramas sobre o vocabulário permite achar palavras que contêm o termo
+buscado sem varrer o catálogo.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set
+
+from ..models.distro import DistroMetadata
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """
+    Normaliza texto para busca: remove acentos, aplica casefold e troca
+    pontuação por espaços.
+
+    Args:
+        text: Texto original.
+
+    Returns:
+        Texto normalizado (pode ser vazio).
+    """
+    if not text:
+        return ""
+
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _NON_WORD.sub(" ", stripped.casefold()).strip()
+
+
+class SearchIndex:
+    """
+    Índice invertido com n-gramas (1 a 3 caracteres) sobre o vocabulário.
+
+    - word_docs: palavra -> {posição do registro: soma dos pesos dos
+      campos onde a palavra aparece}
+    - gram_words: n-grama -> ids das palavras do vocabulário que o contêm
+
+    Termos de até 3 caracteres são resolvidos direto no índice de
+    n-gramas; termos maiores intersectam as listas de trigramas e
+    confirmam a substring apenas nas palavras candidatas.
+    """
+
+    # Campo -> peso na relevância
+    FIELD_WEIGHTS = {
+        "name": 10.0,
+        "summary": 3.0,
+        "description": 1.0,
+    }
+    MAX_GRAM = 3
+
+    def __init__(self, distros: Sequence[DistroMetadata]):
+        """
+        Monta o índice.
+
+        Args:
+            distros: Registros do catálogo (a posição na sequência é o id).
+        """
+        self._names: List[str] = []
+
+        word_docs: Dict[str, Dict[int, int]] = defaultdict(dict)
+
+        for position, distro in enumerate(distros):
+            name = normalize_text(distro.name)
+            self._names.append(name)
+
+            texts = (name, normalize_text(distro.summary), normalize_text(distro.description))
+            for field_bit, text in enumerate(texts):
+                for word in set(text.split()):
+                    postings = word_docs[word]
+                    postings[position] = postings.get(position, 0) | (1 << field_bit)
+
+        field_weights = list(self.FIELD_WEIGHTS.values())
+        mask_weights = [
+            sum(weight for bit, weight in enumerate(field_weights) if mask & (1 << bit))
+            for mask in range(1 << len(field_weights))
+        ]
+
+        self._vocabulary: List[str] = list(word_docs)
+        self._word_docs: List[Dict[int, float]] = [
+            {position: mask_weights[mask] for position, mask in word_docs[word].items()}
+            for word in self._vocabulary
+        ]
+
+        gram_words: Dict[str, Set[int]] = defaultdict(set)
+        for word_id, word in enumerate(self._vocabulary):
+            for size in range(1, self.MAX_GRAM + 1):
+                for start in range(len(word) - size + 1):
+                    gram_words[word[start:start + size]].add(word_id)
+
+        self._gram_words: Dict[str, FrozenSet[int]] = {
+            gram: frozenset(word_ids) for gram, word_ids in gram_words.items()
+        }
+
+    def _matching_words(self, term: str) -> List[int]:
+        """Ids das palavras do vocabulário que contêm o termo."""
+        if len(term) <= self.MAX_GRAM:
+            return list(self._gram_words.get(term, ()))
+
+        grams = [term[i:i + self.MAX_GRAM] for i in range(len(term) - self.MAX_GRAM + 1)]
+        postings = sorted((self._gram_words.get(gram, frozenset()) for gram in grams), key=len)
+        if not postings[0]:
+            return []
+
+        candidates = postings[0].intersection(*postings[1:])
+        return [word_id for word_id in candidates if term in self._vocabulary[word_id]]
+
+    def search(self, query: str) -> Dict[int, float]:
+        """
+        Busca registros que contêm todos os termos da consulta.
+
+        Args:
+            query: Texto digitado pelo usuário.
+
+        Returns:
+            Posição do registro -> pontuação de relevância (maior é melhor).
+        """
+        normalized = normalize_text(query)
+        terms = list(dict.fromkeys(normalized.split()))
+        if not terms:
+            return {}
+
+        scores: Optional[Dict[int, float]] = None
+
+        for term in terms:
+            term_scores: Dict[int, float] = {}
+
+            for word_id in self._matching_words(term):
+                word = self._vocabulary[word_id]
+                # Palavra exata > prefixo > substring
+                if word == term:
+                    quality = 1.0
+                elif word.startswith(term):
+                    quality = 0.75
+                else:
+                    quality = 0.5
+
+                for position, weight in self._word_docs[word_id].items():
+                    score = weight * quality
+                    if score > term_scores.get(position, 0.0):
+                        term_scores[position] = score
+
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    position: score + term_scores[position]
+                    for position, score in scores.items()
+                    if position in term_scores
+                }
+
+            if not scores:
+                return {}
+
+        # Bônus para o nome igual à consulta ou começando por ela
+        for position in scores:
+            name = self._names[position]
+            if name == normalized:
+                scores[position] += 100.0
+            elif name.startswith(normalized):
+                scores[position] += 20.0
+
+        return scores
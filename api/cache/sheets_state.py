@@ -0,0 +1,106 @@
+"""
+Estado da última leitura da planilha do Google Sheets.
+
+Guarda o que é preciso para o próximo refresh evitar trabalho repetido:
+os validadores HTTP devolvidos pelo export (ETag, Last-Modified), o hash
+do corpo, o hash do cabeçalho e, para cada linha, o hash das células e
+o id/hash de conteúdo do registro que ela gerou. Com isso uma linha que
+não mudou reaproveita o registro do catálogo atual em vez de ser
+convertida e validada de novo.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .file_utils import write_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class SheetsState:
+    """
+    Estado persistido em um arquivo JSON:
+    {url, etag, last_modified, body_hash, header_hash, content_version,
+    rows: {hash da linha: [id, content_digest]}, fetched_at}
+
+    Se o arquivo não puder ser gravado, o estado fica só em memória.
+    """
+
+    STATE_FILE = Path(os.getenv(
+        "SHEETS_STATE_FILE",
+        str(Path(__file__).parent.parent.parent / "data" / "cache" / "sheets_state.json")
+    ))
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Inicializa o estado.
+
+        Args:
+            path: Arquivo do estado (padrão: STATE_FILE).
+        """
+        self.path = Path(path) if path is not None else self.STATE_FILE
+        self._state: Dict[str, Any] = {}
+        self._mtime: Optional[int] = None
+
+    def load(self, url: str) -> Dict[str, Any]:
+        """
+        Estado da última leitura de uma URL.
+
+        Args:
+            url: URL do export da planilha.
+
+        Returns:
+            Estado (vazio se a URL nunca foi lida ou o arquivo é ilegível).
+        """
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        # Reler só se outro processo (ou instância) regravou o arquivo
+        if mtime is not None and mtime != self._mtime:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._state = json.load(f)
+                self._mtime = mtime
+            except Exception as e:
+                logger.warning(f"Estado da planilha ilegível: {e}")
+
+        return self._state if self._state.get("url") == url else {}
+
+    def save(self, state: Dict[str, Any]):
+        """
+        Grava o estado da leitura mais recente.
+
+        Args:
+            state: Estado completo (com 'url').
+        """
+        self._state = state
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(self.path, json.dumps(state, ensure_ascii=False).encode("utf-8"))
+            self._mtime = self.path.stat().st_mtime_ns
+        except Exception as e:
+            logger.warning(f"Não foi possível gravar o estado da planilha: {e}")
+
+
+# Instância global do estado da planilha
+_sheets_state: Optional[SheetsState] = None
+
+
+def get_sheets_state() -> SheetsState:
+    """
+    Retorna a instância global do estado da planilha.
+
+    Returns:
+        Instância do SheetsState.
+    """
+    global _sheets_state
+
+    if _sheets_state is None:
+        _sheets_state = SheetsState()
+
+    return _sheets_state
@@ -0,0 +1,179 @@
+"""
+Journal de checkpoints do job de atualização.
+
+Cada distribuição obtida é anexada (JSONL) a um journal local assim que
+o scraping dela termina. Se o job cair ou o tempo da função serverless
+acabar no meio, a próxima execução retoma do journal: usa o mesmo
+ranking e só busca as distribuições que ainda faltam. O journal é
+apagado depois que o catálogo final é publicado.
+
+Formato (uma linha JSON por evento):
+    {"type": "run", "started_at": "...", "ranking": [...]}
+    {"type": "distro", "slug": "cachyos", "record": {...}}
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from api.models.distro import DistroMetadata
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeJournal:
+    """
+    Journal append-only de uma execução do scraping.
+
+    Uma execução com mais de MAX_AGE segundos não é retomada (o ranking
+    já estaria velho); nesse caso o journal é descartado.
+    """
+
+    JOURNAL_DIR = Path(os.getenv(
+        "SCRAPE_JOURNAL_DIR",
+        str(Path(__file__).parent.parent.parent / "data" / "jobs")
+    ))
+    JOURNAL_FILE = "update_distros.journal.jsonl"
+    MAX_AGE = int(os.getenv("SCRAPE_JOURNAL_MAX_AGE", "43200"))  # 12 horas
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Inicializa o journal.
+
+        Args:
+            path: Arquivo do journal (padrão: JOURNAL_DIR/JOURNAL_FILE).
+        """
+        self.path = Path(path) if path is not None else self.JOURNAL_DIR / self.JOURNAL_FILE
+        self.enabled = True
+        self._file = None
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            logger.warning(f"Não é possível usar o journal ({e}), execução não será retomável")
+            self.enabled = False
+
+    def resume(self) -> Optional[Dict[str, Any]]:
+        """
+        Lê uma execução interrompida.
+
+        Linhas incompletas no fim (escrita cortada pela queda) são
+        ignoradas.
+
+        Returns:
+            {'started_at', 'ranking', 'records': {slug: DistroMetadata}}
+            ou None se não há execução a retomar.
+        """
+        if not self.enabled or not self.path.exists():
+            return None
+
+        run = None
+        records: Dict[str, DistroMetadata] = {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+                    if event.get("type") == "run":
+                        run = event
+                    elif event.get("type") == "distro" and run is not None:
+                        records[event["slug"]] = DistroMetadata.model_validate(event["record"])
+        except Exception as e:
+            logger.warning(f"Journal ilegível ({e}), descartando")
+            self.discard()
+            return None
+
+        if run is None:
+            self.discard()
+            return None
+
+        started_at = datetime.fromisoformat(run["started_at"])
+        age = (datetime.utcnow() - started_at).total_seconds()
+        if age > self.MAX_AGE:
+            logger.info(f"Journal de {started_at.isoformat()} é antigo demais ({age / 3600:.1f}h), descartando")
+            self.discard()
+            return None
+
+        return {"started_at": started_at, "ranking": run["ranking"], "records": records}
+
+    def start(self, ranking: List[Dict[str, Any]]):
+        """
+        Inicia uma nova execução (apaga qualquer journal anterior).
+
+        Args:
+            ranking: Lista do ranking que esta execução vai processar.
+        """
+        if not self.enabled:
+            return
+
+        self.close()
+        try:
+            self._file = open(self.path, "w", encoding="utf-8")
+            self._append({"type": "run", "started_at": datetime.utcnow().isoformat(), "ranking": ranking})
+        except Exception as e:
+            logger.warning(f"Não foi possível criar o journal ({e}), execução não será retomável")
+            self.close()
+
+    def reopen(self):
+        """Continua anexando a um journal retomado."""
+        if not self.enabled or self._file is not None:
+            return
+
+        try:
+            # Uma linha cortada pela queda não pode "grudar" na próxima
+            with open(self.path, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                truncated = size > 0 and f.seek(size - 1) >= 0 and f.read(1) != b"\n"
+
+            self._file = open(self.path, "a", encoding="utf-8")
+            if truncated:
+                self._file.write("\n")
+        except Exception as e:
+            logger.warning(f"Não foi possível reabrir o journal ({e}), execução não será retomável")
+            self.close()
+
+    def _append(self, event: Dict[str, Any]):
+        self._file.write(json.dumps(event, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def record(self, item: Dict[str, Any], distro: Optional[DistroMetadata]):
+        """
+        Registra o resultado do scraping de uma distribuição.
+
+        Falhas não são registradas: serão tentadas de novo numa retomada.
+
+        Args:
+            item: Item do ranking.
+            distro: Registro obtido (ou None se falhou).
+        """
+        if distro is None or self._file is None:
+            return
+
+        try:
+            self._append({"type": "distro", "slug": item["slug"], "record": distro.model_dump(mode="json")})
+        except Exception as e:
+            logger.warning(f"Não foi possível registrar {item.get('slug')} no journal: {e}")
+
+    def close(self):
+        """Fecha o arquivo do journal (sem apagá-lo)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self):
+        """Apaga o journal (execução concluída ou inválida)."""
+        self.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Não foi possível apagar o journal: {e}")
@@ -7,6 +7,7 @@ para atualizar o cache de distribuições 1x por dia.
 
 import asyncio
 import logging
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -15,7 +16,11 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from api.services.distrowatch_service import DistroWatchService
+from api.services.http_clients import HttpClients
+from api.services.parse_executor import get_parse_executor
 from api.cache.cache_manager import get_cache_manager
+from api.cache.logo_store import get_logo_store
+from api.jobs.journal import ScrapeJournal
 from api.models.distro import DistroMetadata
 
 logging.basicConfig(
@@ -24,15 +29,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Modo incremental: reaproveita registros recentes do catálogo atual
+INCREMENTAL = os.getenv("DISTROWATCH_INCREMENTAL", "true").lower() == "true"
 
-async def fetch_and_update_distros():
+
+async def fetch_and_update_distros(full: bool = not INCREMENTAL):
     """
     Busca dados atualizados de distribuições e atualiza o cache.
     
     Processo:
     1. Buscar ranking do DistroWatch (Last 1 month)
-    2. Scraping completo de cada distribuição
-    3. Atualizar cache JSON com TTL de 24h
+    2. Scraping de cada distribuição (no modo incremental, só das novas,
+       antigas ou expiradas; as demais só têm ranking/hits atualizados),
+       com checkpoint de cada uma em um journal local
+    3. Atualizar cache JSON com TTL de 24h (publicação atômica) e
+       descartar o journal
+    4. Baixar/revalidar as logos no store local (servidas pela API)
+    
+    Se uma execução anterior foi interrompida, ela é retomada do journal.
+    
+    Args:
+        full: Refazer o scraping de todas as distribuições.
     """
     start_time = datetime.utcnow()
     logger.info("=" * 60)
@@ -40,45 +57,60 @@ async def fetch_and_update_distros():
     logger.info(f"⏰ Timestamp: {start_time.isoformat()}")
     logger.info("=" * 60)
     
-    distrowatch_service = DistroWatchService()
+    # Clientes HTTP do job, fechados ao final da execução
+    http_clients = HttpClients()
+    distrowatch_service = DistroWatchService(http_clients=http_clients)
     cache_manager = get_cache_manager()
+    journal = ScrapeJournal()
     
     try:
-        # 1. Buscar ranking do DistroWatch
-        logger.info("📥 Buscando ranking do DistroWatch (Last 1 month)...")
-        ranking = await distrowatch_service.fetch_ranking_list()
-        logger.info(f"✅ {len(ranking)} distribuições encontradas no ranking")
-        
-        # 2. Scraping completo de cada distribuição
-        logger.info("� Realizando scraping detalhado de cada distribuição...")
-        distros = []
-        errors = 0
-        
-        for i, item in enumerate(ranking, 1):
-            try:
-                slug = item['slug']
-                rank = item['rank']
-                logger.info(f"  [{i}/{len(ranking)}] #{rank} {slug}...")
-                
-                distro = await distrowatch_service.fetch_distro_by_slug(slug)
-                
+        # 1. Retomar execução interrompida ou buscar ranking do DistroWatch
+        resumed = journal.resume()
+        
+        if resumed:
+            ranking = resumed["ranking"]
+            checkpointed = resumed["records"]
+            journal.reopen()
+            logger.info(
+                f"♻️  Retomando execução de {resumed['started_at'].isoformat()}: "
+                f"{len(checkpointed)}/{len(ranking)} distribuições já concluídas"
+            )
+        else:
+            logger.info("📥 Buscando ranking do DistroWatch (Last 1 month)...")
+            ranking = await distrowatch_service.fetch_ranking_list()
+            logger.info(f"✅ {len(ranking)} distribuições encontradas no ranking")
+            checkpointed = {}
+            journal.start(ranking)
+        
+        # 2. Scraping das distribuições (pipeline fetch -> parse -> build do
+        # serviço, com limite de taxa); cada distribuição concluída vai para o journal
+        current = None if full else cache_manager.get_catalog(allow_stale=True)
+        
+        if current is None:
+            logger.info("🔍 Realizando scraping detalhado de cada distribuição...")
+            pending = [item for item in ranking if item['slug'] not in checkpointed]
+            results = await distrowatch_service.fetch_ranked_distros(pending, on_result=journal.record)
+            scraped = dict(zip((item['slug'] for item in pending), results))
+            
+            distros = []
+            for item in ranking:
+                distro = checkpointed.get(item['slug']) or scraped.get(item['slug'])
                 if distro:
-                    # Garantir que o ranking esteja atualizado
-                    if not distro.ranking:
-                        distro.ranking = rank
                     distros.append(distro)
-                    logger.info(f"  ✓ {distro.name} obtida com sucesso")
-                else:
-                    logger.warning(f"  ✗ Falhou ao obter {slug}")
-                    errors += 1
-                
-                # Rate limiting: 1.5s entre requests
-                if i < len(ranking):
-                    await asyncio.sleep(1.5)
-                    
-            except Exception as e:
-                logger.warning(f"  ⚠️  Erro ao processar {item.get('slug', '?')}: {e}")
-                errors += 1
+            
+            errors = sum(1 for distro in results if distro is None)
+            report = {"ranked": len(ranking), "reused": 0, "scraped": len(results) - errors, "failed": errors}
+        else:
+            logger.info(f"🔍 Refresh incremental sobre {len(current)} distribuições em cache...")
+            # Registros do journal são recentes: o modo incremental os reaproveita
+            known = {distro.id: distro for distro in current.distros}
+            known.update(checkpointed)
+            distros, report = await distrowatch_service.fetch_incremental(
+                ranking, list(known.values()), on_result=journal.record
+            )
+            errors = report["failed"]
+        
+        report["resumed"] = len(checkpointed)
         
         logger.info(f"✅ Scraping concluído: {len(distros)} distros, {errors} erros")
         
@@ -88,10 +120,19 @@ async def fetch_and_update_distros():
         
         if success:
             logger.info("✅ Cache atualizado com sucesso")
+            # Execução concluída: nada mais a retomar
+            journal.discard()
         else:
             logger.error("❌ Erro ao atualizar cache")
             raise Exception("Falha ao salvar cache")
         
+        # Descartar corpos de páginas que não são mais referenciados
+        distrowatch_service.page_cache.prune()
+        
+        # Logos servidas pela API (/logo/{id}/image): baixar só o que mudou
+        logger.info("🖼️  Sincronizando logos...")
+        logos = await get_logo_store().sync(distros, http_clients=http_clients)
+        
         # 4. Estatísticas finais
         end_time = datetime.utcnow()
         duration = (end_time - start_time).total_seconds()
@@ -101,6 +142,18 @@ async def fetch_and_update_distros():
         logger.info("=" * 60)
         logger.info(f"  Total de distribuições: {len(distros)}")
         logger.info(f"  Erros encontrados: {errors}")
+        logger.info(
+            f"  Páginas de detalhes: {report['scraped']} com scraping, "
+            f"{report['reused']} reaproveitadas do catálogo, "
+            f"{report['resumed']} retomadas do journal"
+        )
+        stats = distrowatch_service.fetch_stats
+        logger.info(
+            f"  Páginas: {stats['downloaded']} novas, {stats['unchanged']} iguais, "
+            f"{stats['not_modified']} não modificadas (304), "
+            f"{stats['bytes_downloaded'] / 1024:.0f} KiB baixados"
+        )
+        logger.info(f"  Parsings reaproveitados do cache: {stats['parses_skipped']}")
         logger.info(f"  Duração: {duration:.2f}s ({duration/60:.1f} min)")
         logger.info(f"  Timestamp início: {start_time.isoformat()}")
         logger.info(f"  Timestamp fim: {end_time.isoformat()}")
@@ -126,6 +179,10 @@ async def fetch_and_update_distros():
             "success": True,
             "distros_count": len(distros),
             "errors": errors,
+            "incremental": current is not None,
+            "scrape": report,
+            "pages": dict(distrowatch_service.fetch_stats),
+            "logos": logos,
             "duration_seconds": duration,
             "timestamp": end_time.isoformat()
         }
@@ -135,13 +192,16 @@ async def fetch_and_update_distros():
         raise
         
     finally:
+        journal.close()
         await distrowatch_service.close()
+        await http_clients.aclose()
+        get_parse_executor().shutdown()
 
 
-async def main():
+async def main(full: bool = not INCREMENTAL):
     """Função principal do job."""
     try:
-        result = await fetch_and_update_distros()
+        result = await fetch_and_update_distros(full=full)
         return result
     except Exception as e:
         logger.error(f"Job falhou: {e}")
@@ -181,7 +241,7 @@ if __name__ == "__main__":
     print("\n🚀 DistroWiki - Job de Atualização de Distribuições\n")
     
     try:
-        result = asyncio.run(main())
+        result = asyncio.run(main(full="--full" in sys.argv or not INCREMENTAL))
         print("\n✅ Job executado com sucesso!")
         print(f"📊 Resultado: {result}\n")
     except KeyboardInterrupt:
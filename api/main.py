@@ -15,6 +15,8 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from .routes import distros_router, logo_router, enrich_sheets_router
+from .cache import get_cache_manager
+from .services import HttpClients, get_http_clients, get_parse_executor
 
 # Configurar logging
 logging.basicConfig(
@@ -35,10 +37,19 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Iniciando DistroWiki API...")
     logger.info("📦 Módulo 1: Catálogo de Distros")
     
+    # Clientes HTTP das fontes externas, da aplicação: as rotas os repassam
+    # aos serviços, e as conexões ficam abertas entre requisições e refreshes
+    app.state.http_clients = HttpClients()
+    
     yield
     
     # Shutdown
     logger.info("👋 Encerrando DistroWiki API...")
+    await app.state.http_clients.aclose()
+    # Clientes criados por quem não recebeu os da aplicação
+    await get_http_clients().aclose()
+    get_parse_executor().shutdown(wait=False)
+    get_cache_manager().close()
 
 
 # Criar aplicação FastAPI
@@ -132,10 +143,12 @@ async def health_check():
     
     Útil para monitoramento e verificação de disponibilidade.
     """
+    cache_manager = get_cache_manager()
+    
     return {
         "status": "healthy",
         "module": "catalog",
-        "cache_backend": "json"
+        "cache_backend": "redis" if cache_manager.use_redis else "json"
     }
 
 
@@ -60,6 +60,7 @@ class DistroMetadata(BaseModel):
     - category: categorias (Desktop, Server, etc)
     - status: status (Active, Dormant, etc)
     - ranking: posição no ranking do DistroWatch
+    - hits_per_day: acessos por dia no DistroWatch
     - rating: avaliação média dos usuários
     - homepage: site oficial
     """
@@ -142,6 +143,12 @@ class DistroMetadata(BaseModel):
         example=1
     )
     
+    hits_per_day: Optional[int] = Field(
+        None,
+        description="Acessos por dia no DistroWatch (média do último mês)",
+        example=4342
+    )
+    
     rating: Optional[float] = Field(
         None,
         description="Avaliação média dos usuários (0-10)",
@@ -236,6 +243,7 @@ class DistroMetadata(BaseModel):
                 "price": "R$ 0,00",
                 "package_manager": "pacman",
                 "ranking": 1,
+                "hits_per_day": 4342,
                 "rating": 8.1,
                 "homepage": "https://cachyos.org/",
                 "latest_release_date": "2024-10-01T00:00:00Z",
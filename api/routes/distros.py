@@ -5,9 +5,10 @@ Implementa o endpoint GET /distros conforme especificação do Módulo 1.
 """
 
 import logging
-from typing import Optional, List
-from fastapi import APIRouter, Query, HTTPException, BackgroundTasks
-from datetime import datetime
+from functools import partial
+from typing import Optional
+from fastapi import APIRouter, Query, HTTPException, BackgroundTasks, Request, Response
+from fastapi.responses import FileResponse, RedirectResponse
 
 from ..models.distro import (
     DistroListResponse, 
@@ -16,7 +17,18 @@ from ..models.distro import (
     DesktopEnvironment
 )
 from ..services.google_sheets_service import GoogleSheetsService
+from ..services.http_clients import HttpClients
 from ..cache.cache_manager import get_cache_manager
+from ..cache.catalog import CatalogSnapshot
+from ..cache.logo_store import LogoStore, MEDIA_TYPES, get_logo_store, logo_source
+from ..cache.search_index import normalize_text
+from .http_cache import (
+    IMMUTABLE_CACHE_CONTROL,
+    make_etag,
+    is_not_modified,
+    not_modified_response,
+    set_validators
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,29 +36,140 @@ router = APIRouter(prefix="/distros", tags=["Distribuições"])
 logo_router = APIRouter(tags=["Logos"])
 
 
-async def fetch_and_cache_distros() -> List[DistroMetadata]:
+def app_http_clients(request: Request) -> Optional[HttpClients]:
+    """
+    Clientes HTTP criados no lifespan da aplicação.
+    
+    Args:
+        request: Requisição em curso.
+    
+    Returns:
+        Registro de clientes ou None fora do lifespan (os serviços usam
+        então get_http_clients()).
+    """
+    return getattr(request.app.state, "http_clients", None)
+
+
+async def fetch_and_cache_distros(http_clients: Optional[HttpClients] = None) -> CatalogSnapshot:
     """
     Busca distribuições do Google Sheets e atualiza cache.
     
+    Args:
+        http_clients: Clientes HTTP da aplicação (conexões com o Google
+            reaproveitadas entre refreshes).
+    
     Returns:
-        Lista de distribuições.
+        Snapshot do catálogo publicado no cache.
     """
-    sheets_service = GoogleSheetsService()
+    sheets_service = GoogleSheetsService(http_clients=http_clients)
+    cache_manager = get_cache_manager()
+    previous = cache_manager.last_catalog()
     
-    try:
-        # Buscar distribuições do Google Sheets
-        logger.info("Buscando distribuições do Google Sheets...")
-        distros = await sheets_service.fetch_all_distros()
-        
+    # Buscar distribuições do Google Sheets (linhas iguais reaproveitam o catálogo atual)
+    logger.info("Buscando distribuições do Google Sheets...")
+    distros = await sheets_service.fetch_updated_distros(previous)
+    
+    if distros is None:
+        # Planilha sem alterações: só estender a validade do catálogo
+        catalog = cache_manager.renew_catalog(previous)
+    else:
         # Salvar no cache
-        cache_manager = get_cache_manager()
-        cache_manager.set_distros_cache(distros)
-        
-        logger.info(f"Total de {len(distros)} distribuições processadas e em cache")
-        return distros
-        
-    finally:
-        await sheets_service.close()
+        catalog = cache_manager.publish_catalog(distros)
+    
+    # Baixar/revalidar as logos em background, fora da requisição
+    get_logo_store().schedule_sync(catalog.distros, http_clients=http_clients)
+    
+    logger.info(f"Total de {len(catalog)} distribuições processadas e em cache")
+    return catalog
+
+
+async def load_catalog(request: Request, force_refresh: bool = False) -> CatalogSnapshot:
+    """
+    Recupera o catálogo do cache, atualizando-o quando necessário.
+    
+    Requisições concorrentes compartilham uma única atualização; um
+    catálogo expirado continua sendo servido enquanto ela roda.
+    
+    Args:
+        request: Requisição em curso (para os clientes HTTP da aplicação).
+        force_refresh: Aguardar uma atualização mesmo com cache válido.
+    
+    Returns:
+        Snapshot do catálogo.
+    """
+    cache_manager = get_cache_manager()
+    fetch = partial(fetch_and_cache_distros, app_http_clients(request))
+    return await cache_manager.get_or_fetch(fetch, force_refresh=force_refresh)
+
+
+def set_cache_status_header(response: Response, catalog: CatalogSnapshot):
+    """
+    Indica no header X-Cache-Status se o catálogo servido está expirado.
+    
+    Args:
+        response: Resposta da rota.
+        catalog: Snapshot utilizado.
+    """
+    response.headers["X-Cache-Status"] = "fresh" if catalog.is_valid() else "stale"
+
+
+def build_distro_list_body(
+    catalog: CatalogSnapshot,
+    page: int,
+    page_size: int,
+    family: Optional[DistroFamily],
+    desktop_env: Optional[DesktopEnvironment],
+    search: Optional[str],
+    sort_by: str,
+    descending: bool
+) -> bytes:
+    """
+    Filtra, ordena, pagina e serializa uma página do catálogo.
+    
+    Args:
+        catalog: Snapshot do catálogo.
+        page: Número da página.
+        page_size: Tamanho da página.
+        family: Filtro por família/base.
+        desktop_env: Filtro por ambiente gráfico.
+        search: Busca textual.
+        sort_by: Campo para ordenação (ou "relevance").
+        descending: Ordem decrescente.
+    
+    Returns:
+        Corpo JSON de DistroListResponse.
+    """
+    # Filtros por família e ambiente gráfico via índices do snapshot
+    positions = catalog.filter_positions(family=family, desktop_env=desktop_env)
+    
+    # Ordenação: permutações pré-calculadas no snapshot
+    # (o snapshot do cache nunca é modificado)
+    if search:
+        # Busca textual via índice do snapshot
+        hits = catalog.search(search, positions)
+        if sort_by == "relevance":
+            ordered_positions = catalog.rank_by_relevance(hits)
+        else:
+            ordered_positions = catalog.ordered_positions(
+                frozenset(hits), sort_by=sort_by, descending=descending
+            )
+    else:
+        ordered_positions = catalog.ordered_positions(
+            positions, sort_by=sort_by, descending=descending
+        )
+    
+    # Paginação
+    total = len(ordered_positions)
+    start_idx = (page - 1) * page_size
+    end_idx = start_idx + page_size
+    
+    # Junta os fragmentos JSON pré-codificados de cada registro
+    return catalog.render_page(
+        ordered_positions[start_idx:end_idx],
+        total=total,
+        page=page,
+        page_size=page_size
+    )
 
 
 @router.get(
@@ -71,12 +194,16 @@ async def fetch_and_cache_distros() -> List[DistroMetadata]:
 )
 async def list_distros(
     background_tasks: BackgroundTasks,
+    request: Request,
     page: int = Query(1, ge=1, description="Número da página"),
     page_size: int = Query(20, ge=1, le=100, description="Itens por página"),
     family: Optional[DistroFamily] = Query(None, description="Filtrar por família/base"),
     desktop_env: Optional[DesktopEnvironment] = Query(None, description="Filtrar por ambiente gráfico"),
-    search: Optional[str] = Query(None, description="Buscar por nome"),
-    sort_by: Optional[str] = Query("name", description="Ordenar por: name, release_date"),
+    search: Optional[str] = Query(None, description="Buscar por nome, resumo ou descrição (ignora acentos)"),
+    sort_by: Optional[str] = Query(
+        None,
+        description="Ordenar por: name, release_date, ranking, rating, relevance (padrão: relevance com busca, name sem busca)"
+    ),
     order: Optional[str] = Query("asc", description="Ordem: asc, desc"),
     force_refresh: bool = Query(False, description="Forçar atualização do cache")
 ) -> DistroListResponse:
@@ -85,88 +212,60 @@ async def list_distros(
     
     Args:
         background_tasks: Tarefas em background do FastAPI.
+        request: Requisição (para If-None-Match / If-Modified-Since).
         page: Número da página.
         page_size: Tamanho da página.
         family: Filtro por família/base.
         desktop_env: Filtro por ambiente gráfico.
-        search: Busca por nome.
+        search: Busca textual (nome, resumo e descrição).
         sort_by: Campo para ordenação.
         order: Ordem de ordenação.
         force_refresh: Forçar atualização do cache.
     
     Returns:
-        Lista paginada de distribuições.
+        Lista paginada de distribuições (JSON de DistroListResponse).
     """
     try:
+        catalog = await load_catalog(request, force_refresh=force_refresh)
         cache_manager = get_cache_manager()
         
-        # Tentar recuperar do cache
-        distros = None
-        cache_timestamp = None
-        
-        if not force_refresh:
-            distros = cache_manager.get_distros_cache()
-            if distros:
-                cache_info = cache_manager.get_cache_info()
-                cache_timestamp = cache_info.get("timestamp") if cache_info else None
-        
-        # Se não há cache válido, buscar dados
-        if distros is None:
-            logger.info("Cache inválido ou forçado refresh, buscando dados...")
-            distros = await fetch_and_cache_distros()
-            cache_timestamp = datetime.utcnow()
-        
-        # Aplicar filtros
-        filtered_distros = distros
-        
-        # Filtro por família
-        if family:
-            filtered_distros = [
-                d for d in filtered_distros 
-                if d.family == family
-            ]
-        
-        # Filtro por ambiente gráfico
-        if desktop_env:
-            filtered_distros = [
-                d for d in filtered_distros 
-                if desktop_env in d.desktop_environments
-            ]
-        
-        # Busca por nome
-        if search:
-            search_lower = search.lower()
-            filtered_distros = [
-                d for d in filtered_distros
-                if search_lower in d.name.lower() or 
-                   (d.summary and search_lower in d.summary.lower())
-            ]
-        
-        # Ordenação
-        reverse = (order.lower() == "desc")
+        # Chave normalizada dos parâmetros + geração do snapshot
+        descending = (order or "asc").lower() == "desc"
+        search_key = normalize_text(search) or None
+        # Busca sem nenhum termo (só espaços ou pontuação): sem filtro textual
+        if search_key is None:
+            search = None
+        effective_sort = sort_by or ("relevance" if search else "name")
+        cache_key = (
+            catalog.generation, page, page_size, family, desktop_env,
+            search_key, effective_sort, descending
+        )
         
-        if sort_by == "name":
-            filtered_distros.sort(key=lambda d: d.name.lower(), reverse=reverse)
-        elif sort_by == "release_date":
-            # Colocar None no final
-            filtered_distros.sort(
-                key=lambda d: d.latest_release_date or datetime.min,
-                reverse=reverse
+        # ETag: versão do snapshot (igual entre instâncias) + parâmetros
+        etag = make_etag(catalog.version, *cache_key[1:])
+        if is_not_modified(request, etag, catalog.timestamp):
+            response = not_modified_response(etag, catalog.timestamp)
+            set_cache_status_header(response, catalog)
+            return response
+        
+        body = cache_manager.response_cache.get(cache_key)
+        if body is None:
+            body = build_distro_list_body(
+                catalog,
+                page=page,
+                page_size=page_size,
+                family=family,
+                desktop_env=desktop_env,
+                search=search,
+                sort_by=effective_sort,
+                descending=descending
             )
+            cache_manager.response_cache.set(cache_key, body)
         
-        # Paginação
-        total = len(filtered_distros)
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_distros = filtered_distros[start_idx:end_idx]
-        
-        return DistroListResponse(
-            distros=paginated_distros,
-            total=total,
-            page=page,
-            page_size=page_size,
-            cache_timestamp=cache_timestamp
-        )
+        response = Response(content=body, media_type="application/json")
+        set_validators(response, etag, catalog.timestamp)
+        set_cache_status_header(response, catalog)
+        return response
         
     except Exception as e:
         logger.error(f"Erro ao listar distribuições: {e}", exc_info=True)
@@ -182,37 +281,44 @@ async def list_distros(
     summary="Obter detalhes de uma distribuição",
     description="Retorna informações detalhadas de uma distribuição específica."
 )
-async def get_distro(distro_id: str) -> DistroMetadata:
+async def get_distro(distro_id: str, request: Request) -> DistroMetadata:
     """
     Obtém detalhes de uma distribuição específica.
     
     Args:
         distro_id: ID (slug) da distribuição.
+        request: Requisição (para If-None-Match / If-Modified-Since).
     
     Returns:
-        Objeto DistroMetadata com detalhes.
+        JSON de DistroMetadata com detalhes.
     """
     try:
-        cache_manager = get_cache_manager()
-        
-        # Buscar do cache
-        distros = cache_manager.get_distros_cache()
+        # Buscar do cache (ou aguardar a atualização compartilhada)
+        catalog = await load_catalog(request)
         
-        if distros is None:
-            # Cache inválido, buscar dados
-            logger.info("Cache inválido, buscando dados...")
-            distros = await fetch_and_cache_distros()
+        # Procurar distribuição específica (id ou alias, O(1))
+        position = catalog.find(distro_id)
         
-        # Procurar distribuição específica
-        distro = next((d for d in distros if d.id == distro_id), None)
-        
-        if distro is None:
+        if position is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Distribuição '{distro_id}' não encontrada"
             )
         
-        return distro
+        # ETag por registro: só muda quando os dados desta distro mudam
+        distro = catalog.distros[position]
+        etag = make_etag(catalog.record_etag(position))
+        
+        if is_not_modified(request, etag, distro.last_updated):
+            not_modified = not_modified_response(etag, distro.last_updated)
+            set_cache_status_header(not_modified, catalog)
+            return not_modified
+        
+        # JSON do registro já codificado no snapshot
+        response = Response(content=catalog.record_json(position), media_type="application/json")
+        set_validators(response, etag, distro.last_updated)
+        set_cache_status_header(response, catalog)
+        return response
         
     except HTTPException:
         raise
@@ -229,19 +335,21 @@ async def get_distro(distro_id: str) -> DistroMetadata:
     summary="Atualizar cache",
     description="Força atualização do cache de distribuições (admin only)."
 )
-async def refresh_cache(background_tasks: BackgroundTasks):
+async def refresh_cache(request: Request, background_tasks: BackgroundTasks):
     """
     Força atualização do cache de distribuições.
     
-    Útil para atualização manual ou via cron job.
+    Útil para atualização manual ou via cron job. O catálogo atual
+    continua sendo servido até o novo ser publicado.
     """
     try:
-        # Invalidar cache atual
         cache_manager = get_cache_manager()
-        cache_manager.invalidate_cache()
         
-        # Buscar novos dados em background
-        background_tasks.add_task(fetch_and_cache_distros)
+        # Buscar novos dados em background (junta-se a uma atualização em curso)
+        background_tasks.add_task(
+            cache_manager.refresh,
+            partial(fetch_and_cache_distros, app_http_clients(request))
+        )
         
         return {
             "status": "success",
@@ -289,37 +397,160 @@ async def get_cache_info():
         )
 
 
+# A imagem de uma distribuição pode mudar num refresh; o blob por hash não
+LOGO_IMAGE_CACHE_CONTROL = "public, max-age=86400"
+
+
+def image_response(path, etag: str, cache_control: str) -> Response:
+    """
+    Resposta com os bytes de uma logo do store.
+    
+    O arquivo é lido fora do event loop (FileResponse), e o ETag do hash
+    do conteúdo prevalece sobre o que ela derivaria do mtime.
+    Logos vêm de terceiros: SVGs não podem executar scripts na origem da API.
+    """
+    response = FileResponse(path, media_type=MEDIA_TYPES[path.suffix[1:]])
+    set_validators(response, etag, cache_control=cache_control)
+    response.headers["X-Content-Type-Options"] = "nosniff"
+    response.headers["Content-Security-Policy"] = "default-src 'none'; style-src 'unsafe-inline'; sandbox"
+    return response
+
+
+def find_distro(catalog: CatalogSnapshot, distro_id: str):
+    """
+    Localiza uma distribuição no catálogo.
+    
+    Returns:
+        Tupla (posição, distro) ou (None, None).
+    """
+    position = catalog.find(distro_id) if catalog else None
+    if position is None:
+        return None, None
+    return position, catalog.distros[position]
+
+
 @logo_router.get("/logo/{distro_id}")
-async def get_distro_logo(distro_id: str):
+async def get_distro_logo(distro_id: str, request: Request, response: Response):
     """
     Retorna logo de uma distribuição.
     
+    Além da URL de origem, indica as URLs servidas pela própria API
+    (imagem e variantes redimensionadas) quando a logo já está no store.
+    
     Args:
         distro_id: ID da distribuição
+        request: Requisição (para If-None-Match / If-Modified-Since)
+        response: Resposta (para headers de cache)
         
     Returns:
         Informações do logo ou erro
     """
     try:
-        cache_manager = get_cache_manager()
-        distros = cache_manager.get_distros_cache()
+        catalog = await load_catalog(request)
+        position, distro = find_distro(catalog, distro_id)
         
-        if not distros:
-            raise HTTPException(status_code=404, detail="Distribuição não encontrada")
+        if not distro or not logo_source(distro):
+            raise HTTPException(status_code=404, detail="Logo não encontrada")
         
-        distro = next((d for d in distros if d.id == distro_id), None)
+        entry = get_logo_store().lookup(distro.id)
+        stored = entry.get("original") if entry else None
         
-        if not distro or not distro.logo_url:
-            raise HTTPException(status_code=404, detail="Logo não encontrada")
+        etag = make_etag("logo", catalog.record_etag(position), stored, entry and sorted(entry.get("variants", {}).items()))
+        if is_not_modified(request, etag, distro.last_updated):
+            response = not_modified_response(etag, distro.last_updated)
+            set_cache_status_header(response, catalog)
+            return response
         
-        return {
-            "id": distro_id,
+        set_validators(response, etag, distro.last_updated)
+        set_cache_status_header(response, catalog)
+        
+        result = {
+            "id": distro.id,
             "name": distro.name,
-            "logo_url": distro.logo_url
+            "logo_url": logo_source(distro),
+            "image_url": f"/logo/{distro.id}/image"
         }
+        if stored:
+            result["original"] = f"/logos/{stored}"
+            result["variants"] = {
+                size: f"/logos/{name}" for size, name in entry.get("variants", {}).items()
+            }
+        return result
                 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Erro ao buscar logo de {distro_id}: {e}")
         raise HTTPException(status_code=500, detail=f"Erro ao buscar logo: {str(e)}")
+
+
+@logo_router.get("/logo/{distro_id}/image")
+async def get_distro_logo_image(
+    distro_id: str,
+    request: Request,
+    size: Optional[int] = Query(None, ge=1, le=1024, description="Lado desejado em pixels")
+):
+    """
+    Serve a imagem da logo de uma distribuição.
+    
+    A imagem vem do store local (a menor variante com lado >= size, ou o
+    original). Se a logo ainda não foi baixada, redireciona para a origem.
+    
+    Args:
+        distro_id: ID da distribuição
+        request: Requisição (para If-None-Match)
+        size: Lado desejado em pixels (opcional)
+        
+    Returns:
+        Bytes da imagem, 304 ou redirecionamento para a origem
+    """
+    try:
+        catalog = await load_catalog(request)
+        _, distro = find_distro(catalog, distro_id)
+        
+        if not distro or not logo_source(distro):
+            raise HTTPException(status_code=404, detail="Logo não encontrada")
+        
+        store = get_logo_store()
+        entry = store.lookup(distro.id)
+        name = LogoStore.pick(entry, size) if entry else None
+        path = store.blob_path(name) if name else None
+        
+        if path is None:
+            return RedirectResponse(logo_source(distro), status_code=307, headers={"Cache-Control": "no-cache"})
+        
+        # O nome do blob é o hash do conteúdo
+        etag = f'"{name.split(".")[0]}"'
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, cache_control=LOGO_IMAGE_CACHE_CONTROL)
+        
+        return image_response(path, etag, LOGO_IMAGE_CACHE_CONTROL)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Erro ao servir logo de {distro_id}: {e}")
+        raise HTTPException(status_code=500, detail=f"Erro ao servir logo: {str(e)}")
+
+
+@logo_router.get("/logos/{name}")
+async def get_logo_blob(name: str, request: Request):
+    """
+    Serve uma logo pelo hash do conteúdo (cache imutável).
+    
+    Args:
+        name: Nome do blob (<hash>.<ext>), como em /logo/{distro_id}
+        request: Requisição (para If-None-Match)
+        
+    Returns:
+        Bytes da imagem ou 304
+    """
+    path = get_logo_store().blob_path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Logo não encontrada")
+    
+    etag = f'"{path.stem}"'
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, cache_control=IMMUTABLE_CACHE_CONTROL)
+    
+    return image_response(path, etag, IMMUTABLE_CACHE_CONTROL)
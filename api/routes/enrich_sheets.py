@@ -1,8 +1,9 @@
 
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, Body, Request
 from fastapi.responses import JSONResponse
 from ..services.google_sheets_service import GoogleSheetsService
 from ..services.groq_service import enrich_distros_with_groq
+from .distros import app_http_clients
 
 router = APIRouter(prefix="/enrich-sheets", tags=["Enriquecimento Sheets"])
 
@@ -19,19 +20,16 @@ async def enrich_by_name_endpoint(names: list[str] = Body(..., embed=True)):
     return JSONResponse(content={"results": enriched})
 
 @router.post("/")
-async def enrich_sheets_endpoint():
+async def enrich_sheets_endpoint(request: Request):
     """
     Enriquecimento manual dos dados do Google Sheets via Groq.
     Busca nomes das distros, enriquece via IA e retorna dados para atualização manual.
     """
-    sheets_service = GoogleSheetsService()
-    try:
-        # Busca todas as distros da planilha
-        distros = await sheets_service.fetch_all_distros()
-        # Extrai os nomes das distros
-        distro_names = [distro.name for distro in distros if distro.name]
-        # Enriquecimento via Groq
-        enriched = await enrich_distros_with_groq(distro_names)
-        return JSONResponse(content={"results": enriched})
-    finally:
-        await sheets_service.close()
+    sheets_service = GoogleSheetsService(http_clients=app_http_clients(request))
+    # Busca todas as distros da planilha
+    distros = await sheets_service.fetch_all_distros()
+    # Extrai os nomes das distros
+    distro_names = [distro.name for distro in distros if distro.name]
+    # Enriquecimento via Groq
+    enriched = await enrich_distros_with_groq(distro_names)
+    return JSONResponse(content={"results": enriched})
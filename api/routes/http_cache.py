@@ -0,0 +1,142 @@
+"""
+Suporte a requisições condicionais (ETag / Last-Modified).
+
+Permite que clientes e a edge do Vercel revalidem respostas do catálogo
+e recebam 304 Not Modified sem que o corpo seja montado.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+# Clientes sempre revalidam; com ETag a revalidação custa um 304
+CACHE_CONTROL = "public, no-cache"
+# Conteúdo endereçado por hash nunca muda sob a mesma URL
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Monta um ETag forte a partir das partes informadas.
+
+    Args:
+        parts: Valores que identificam a representação (versão, parâmetros...).
+
+    Returns:
+        ETag entre aspas.
+    """
+    raw = "\x1f".join(str(part) for part in parts).encode("utf-8")
+    return f'"{hashlib.blake2b(raw, digest_size=16).hexdigest()}"'
+
+
+def http_date(value: datetime) -> str:
+    """
+    Formata um datetime (UTC, naive ou aware) como data HTTP.
+
+    Args:
+        value: Data/hora.
+
+    Returns:
+        Data no formato IMF-fixdate.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Compara If-None-Match com o ETag (comparação fraca, RFC 9110)."""
+    if header.strip() == "*":
+        return True
+
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+
+    return False
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """
+    Verifica se o cliente já tem a representação atual.
+
+    If-None-Match tem precedência; If-Modified-Since só é usado quando
+    o cliente não envia ETag.
+
+    Args:
+        request: Requisição recebida.
+        etag: ETag atual da representação.
+        last_modified: Data da última modificação (UTC).
+
+    Returns:
+        True se a resposta pode ser 304.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        modified = last_modified
+        if modified.tzinfo is None:
+            modified = modified.replace(tzinfo=timezone.utc)
+
+        # Datas HTTP têm resolução de segundos
+        return modified.replace(microsecond=0) <= since
+
+    return False
+
+
+def set_validators(
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = CACHE_CONTROL
+):
+    """
+    Adiciona ETag, Last-Modified e Cache-Control à resposta.
+
+    Args:
+        response: Resposta da rota.
+        etag: ETag da representação.
+        last_modified: Data da última modificação (UTC).
+        cache_control: Valor do Cache-Control (padrão: CACHE_CONTROL).
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified)
+
+
+def not_modified_response(
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = CACHE_CONTROL
+) -> Response:
+    """
+    Cria uma resposta 304 com os mesmos validadores.
+
+    Args:
+        etag: ETag da representação.
+        last_modified: Data da última modificação (UTC).
+        cache_control: Valor do Cache-Control (padrão: CACHE_CONTROL).
+
+    Returns:
+        Resposta 304 sem corpo.
+    """
+    response = Response(status_code=304)
+    set_validators(response, etag, last_modified, cache_control)
+    return response
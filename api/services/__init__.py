@@ -2,8 +2,22 @@
 
 from .distrowatch_service import DistroWatchService
 from .google_sheets_service import GoogleSheetsService
+from .http_clients import HttpClients, get_http_clients
+from .parse_executor import ParseExecutor, get_parse_executor
+from .pipeline import Pipeline, Stage
+from .resilience import CircuitOpenError, DeadlineExceededError, Resilience, get_resilience
 
 __all__ = [
     "DistroWatchService",
-    "GoogleSheetsService"
+    "GoogleSheetsService",
+    "HttpClients",
+    "get_http_clients",
+    "ParseExecutor",
+    "get_parse_executor",
+    "Pipeline",
+    "Stage",
+    "Resilience",
+    "get_resilience",
+    "CircuitOpenError",
+    "DeadlineExceededError"
 ]
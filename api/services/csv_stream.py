@@ -0,0 +1,161 @@
+"""
+Leitura incremental de CSV (RFC 4180).
+
+O texto chega em pedaços (ex: response.aiter_text() do httpx) e as linhas
+completas de cada pedaço são entregues ao módulo csv da biblioteca padrão
+(parser em C). Células entre aspas podem conter vírgulas, quebras de
+linha e aspas escapadas ("").
+
+Quando um registro continua no próximo pedaço (célula entre aspas com
+quebra de linha cortada no meio), as linhas já lidas dele voltam para a
+fila e o registro é lido de novo quando o restante chegar; só registros
+que cruzam a fronteira entre pedaços pagam essa releitura.
+"""
+
+import csv
+from collections import deque
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List
+
+
+class _NeedMoreData(Exception):
+    """O registro em leitura continua em um pedaço que ainda não chegou."""
+
+
+class _LineFeed:
+    """Iterador de linhas alimentado aos poucos (entrada do csv.reader)."""
+
+    def __init__(self):
+        self.lines = deque()
+        self.taken: List[str] = []  # Linhas consumidas pelo registro em leitura
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if not self.lines:
+            # Fim do texto: o csv.reader encerra o registro como no arquivo
+            if self.closed:
+                raise StopIteration
+            raise _NeedMoreData
+        line = self.lines.popleft()
+        self.taken.append(line)
+        return line
+
+
+class CsvRowReader:
+    """
+    Parser de CSV alimentado por pedaços de texto.
+
+    Uso:
+        reader = CsvRowReader()
+        for chunk in chunks:
+            for row in reader.feed(chunk):
+                ...
+        for row in reader.close():
+            ...
+
+    Produz os mesmos registros que csv.reader sobre o texto inteiro,
+    exceto linhas em branco, que são ignoradas.
+    """
+
+    def __init__(self, **fmtparams):
+        """
+        Inicializa o parser.
+
+        Args:
+            fmtparams: Parâmetros de formato do módulo csv (ex: delimiter).
+        """
+        self._feed = _LineFeed()
+        self._reader = csv.reader(self._feed, **fmtparams)
+        self._partial = ""  # Trecho após o último '\n'
+
+    def _drain(self) -> List[List[str]]:
+        rows: List[List[str]] = []
+        feed = self._feed
+
+        while feed.lines:
+            feed.taken.clear()
+            try:
+                row = next(self._reader)
+            except _NeedMoreData:
+                # Devolver as linhas do registro incompleto para a fila
+                feed.lines.extendleft(reversed(feed.taken))
+                break
+            except StopIteration:
+                break
+            if row:
+                rows.append(row)
+
+        return rows
+
+    def feed(self, text: str) -> List[List[str]]:
+        """
+        Processa mais um pedaço do texto.
+
+        Args:
+            text: Próximo pedaço (pode cortar linhas ou células no meio).
+
+        Returns:
+            Registros completados por este pedaço.
+        """
+        if not text:
+            return []
+
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        self._feed.lines.extend(line + "\n" for line in lines)
+
+        return self._drain()
+
+    def close(self) -> List[List[str]]:
+        """
+        Finaliza a leitura (último registro sem '\\n' no fim).
+
+        Uma célula entre aspas sem fechamento vai até o fim do texto,
+        como no módulo csv.
+
+        Returns:
+            Registros restantes.
+        """
+        if self._partial:
+            self._feed.lines.append(self._partial)
+            self._partial = ""
+        self._feed.closed = True
+        return self._drain()
+
+
+def iter_csv_rows(chunks: Iterable[str], **fmtparams) -> Iterator[List[str]]:
+    """
+    Registros de um CSV recebido em pedaços.
+
+    Args:
+        chunks: Pedaços do texto.
+        fmtparams: Parâmetros de formato do módulo csv.
+
+    Yields:
+        Cada registro como lista de células.
+    """
+    reader = CsvRowReader(**fmtparams)
+    for chunk in chunks:
+        yield from reader.feed(chunk)
+    yield from reader.close()
+
+
+async def aiter_csv_rows(chunks: AsyncIterable[str], **fmtparams) -> AsyncIterator[List[str]]:
+    """
+    Versão assíncrona de iter_csv_rows() (ex: sobre response.aiter_text()).
+
+    Args:
+        chunks: Pedaços do texto.
+        fmtparams: Parâmetros de formato do módulo csv.
+
+    Yields:
+        Cada registro como lista de células.
+    """
+    reader = CsvRowReader(**fmtparams)
+    async for chunk in chunks:
+        for row in reader.feed(chunk):
+            yield row
+    for row in reader.close():
+        yield row
@@ -0,0 +1,329 @@
+"""
+Parser das páginas do DistroWatch.
+
+Funções puras (HTML -> dict) sobre lxml: a árvore é montada uma única
+vez e todos os campos da página de uma distribuição (metadados, nome,
+rating, homepage, descrição e logo) são extraídos em uma só travessia.
+Sem estado nem I/O, podem rodar em qualquer thread ou processo.
+"""
+
+import re
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import lxml.html
+from lxml.etree import ParserError
+
+# Incrementar quando a saída mudar (invalida parsings salvos no cache de páginas)
+PARSER_VERSION = 1
+
+# Rótulos do <ul> de metadados -> campo do dicionário
+METADATA_FIELDS = (
+    ("os type", "os_type"),
+    ("based on", "based_on"),
+    ("origin", "origin"),
+    ("architecture", "architecture"),
+    ("desktop", "desktop"),
+    ("category", "category"),
+    ("status", "status"),
+    ("popularity", "popularity"),
+)
+
+# Palavras que identificam o parágrafo de descrição
+DESCRIPTION_KEYWORDS = ("distribution", "linux", "based on", "operating system", "focuses on")
+DESCRIPTION_MIN_LENGTH = 50
+DESCRIPTION_MAX_LENGTH = 500
+
+# Tags que encerram a busca pela descrição após o </ul>
+_DESCRIPTION_STOP_TAGS = frozenset(("br", "b", "table"))
+
+_DECIMAL = re.compile(r"(\d+\.\d+)")
+_LEADING_INT = re.compile(r"^(\d+)")
+_INT = re.compile(r"(\d+)")
+
+
+def _text(element) -> str:
+    """Texto do elemento com cada trecho sem espaços nas pontas (como get_text(strip=True))."""
+    return "".join(part.strip() for part in element.itertext())
+
+
+def _has_class(element, name: str) -> bool:
+    """Verifica se o atributo class do elemento contém `name`."""
+    classes = element.get("class")
+    return bool(classes) and name in classes.split()
+
+
+def _parse_document(html: Union[str, bytes], encoding: Optional[str] = None):
+    """Monta a árvore lxml do documento (None se vazio/inválido)."""
+    try:
+        if isinstance(html, bytes) and encoding:
+            # Sem encoding explícito o libxml2 assume latin-1 quando não há <meta charset>
+            return lxml.html.document_fromstring(html, parser=lxml.html.HTMLParser(encoding=encoding))
+        return lxml.html.document_fromstring(html)
+    except (ParserError, ValueError, LookupError):
+        return None
+
+
+def _is_metadata_list(ul) -> bool:
+    """O <ul> de metadados tem no primeiro <li> um <b>OS Type:</b> (ou Based on)."""
+    first_li = ul.find(".//li")
+    if first_li is None:
+        return False
+
+    label = first_li.find(".//b")
+    if label is None:
+        return False
+
+    label_text = label.text_content()
+    return "OS Type" in label_text or "Based on" in label_text
+
+
+def _parse_metadata_list(ul) -> Dict[str, Any]:
+    """Extrai os campos do <ul> de metadados."""
+    data: Dict[str, Any] = {}
+
+    for li in ul.iter("li"):
+        label_tag = li.find(".//b")
+        if label_tag is None:
+            continue
+
+        label = _text(label_tag).replace(":", "").lower()
+
+        # Valor = links filhos diretos do <li>
+        value = ", ".join(
+            text for text in (_text(child) for child in li if child.tag == "a") if text
+        )
+
+        for key, field in METADATA_FIELDS:
+            if key not in label:
+                continue
+
+            if field == "status":
+                # Status costuma vir dentro de <font>
+                font_tag = li.find(".//font")
+                data["status"] = _text(font_tag) if font_tag is not None else value
+            elif field == "popularity":
+                # "1 (4,342 hits per day)" -> ranking = 1
+                rank_match = _LEADING_INT.search(value)
+                if rank_match:
+                    data["ranking"] = int(rank_match.group(1))
+            else:
+                data[field] = value
+            break
+
+    return data
+
+
+def _following_nodes(element) -> Iterator[Union[str, Any]]:
+    """Irmãos seguintes do elemento, intercalando textos (tails) e elementos."""
+    if element.tail:
+        yield element.tail
+
+    sibling = element.getnext()
+    while sibling is not None:
+        yield sibling
+        if sibling.tail:
+            yield sibling.tail
+        sibling = sibling.getnext()
+
+
+def _parse_description(metadata_ul) -> Optional[str]:
+    """
+    A descrição é o texto logo após o </ul> de metadados, antes do <br><br>.
+
+    Exemplo no HTML:
+    </ul>
+    CachyOS is a Linux distribution based on Arch Linux...
+    <br><br>
+    """
+    for index, node in enumerate(_following_nodes(metadata_ul)):
+        if isinstance(node, str):
+            text = node.strip()
+            if len(text) > DESCRIPTION_MIN_LENGTH and any(
+                keyword in text.lower() for keyword in DESCRIPTION_KEYWORDS
+            ):
+                if len(text) > DESCRIPTION_MAX_LENGTH:
+                    return text[:DESCRIPTION_MAX_LENGTH] + "..."
+                return text
+        elif index and node.tag in _DESCRIPTION_STOP_TAGS:
+            # Parar no <br><br> ou em outra tag relevante
+            break
+
+    return None
+
+
+def _parse_rating(b_tag) -> Optional[float]:
+    """Rating em <b>8.1</b> dentro de um trecho que fala de "visitor rating"."""
+    text = b_tag.text_content()
+    if "/" in text:
+        return None
+
+    rating_match = _DECIMAL.search(text)
+    if not rating_match:
+        return None
+
+    parent = b_tag.getparent()
+    if parent is None or "visitor rating" not in parent.text_content().lower():
+        return None
+
+    return float(rating_match.group(1))
+
+
+def _parse_homepage_row(th) -> Optional[str]:
+    """Link da linha "Home Page" da tabela Info."""
+    if not _has_class(th, "Info") or "home page" not in th.text_content().lower():
+        return None
+
+    row = th.getparent()
+    table = next(th.iterancestors("table"), None)
+    if row is None or table is None or not _has_class(table, "Info"):
+        return None
+
+    for td in row.iter("td"):
+        if _has_class(td, "Info"):
+            for link in td.iter("a"):
+                href = link.get("href")
+                if href is not None:
+                    return href
+            return None
+
+    return None
+
+
+def _is_logo(src: str) -> bool:
+    """Logos das distros ficam em images/yvzhuwbpy/."""
+    return "images/yvzhuwbpy/" in src or (src.startswith("images/") and not src.endswith(".gif"))
+
+
+def parse_distro_page(html: Union[str, bytes], encoding: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Extrai os dados da página de uma distribuição (table.php?distribution=...).
+
+    Campos possíveis: name, os_type, based_on, origin, architecture,
+    desktop, category, status, ranking, rating, homepage, description e
+    logo (src como está na página). Os valores são strings cruas; o
+    mapeamento para família/desktops fica com o DistroWatchService.
+
+    Args:
+        html: HTML da página (texto ou bytes crus da resposta).
+        encoding: Encoding dos bytes (ex: charset da resposta HTTP).
+
+    Returns:
+        Dicionário com os dados extraídos, ou vazio se a página não tem
+        a lista de metadados.
+    """
+    root = _parse_document(html, encoding)
+    if root is None:
+        return {}
+
+    metadata_ul = None
+    name = None
+    rating = None
+    homepage = None
+    logo = None
+
+    # Uma única travessia do documento
+    for element in root.iter("ul", "h1", "b", "th", "img"):
+        tag = element.tag
+
+        if tag == "ul":
+            if metadata_ul is None and _is_metadata_list(element):
+                metadata_ul = element
+        elif tag == "b":
+            if rating is None:
+                rating = _parse_rating(element)
+        elif tag == "th":
+            if homepage is None:
+                homepage = _parse_homepage_row(element)
+        elif tag == "h1":
+            if name is None:
+                name = _text(element)
+        elif logo is None:
+            src = element.get("src", "")
+            if _is_logo(src):
+                logo = src
+
+    if metadata_ul is None:
+        return {}
+
+    data = _parse_metadata_list(metadata_ul)
+    if name is not None:
+        data["name"] = name
+    if rating is not None:
+        data["rating"] = rating
+    data["homepage"] = homepage
+    data["description"] = _parse_description(metadata_ul)
+    data["logo"] = logo
+
+    return data
+
+
+def parse_ranking_page(
+    html: Union[str, bytes],
+    limit: Optional[int] = None,
+    encoding: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Extrai o Page Hit Ranking (tabela "Last 1 month") de dwres.php?resource=popularity.
+
+    Args:
+        html: HTML da página de ranking (texto ou bytes crus da resposta).
+        limit: Número máximo de distribuições.
+        encoding: Encoding dos bytes (ex: charset da resposta HTTP).
+
+    Returns:
+        Lista de dicionários com {'rank', 'slug', 'name', 'hpd'} na ordem do ranking.
+    """
+    root = _parse_document(html, encoding)
+    if root is None:
+        return []
+
+    target_table = None
+    for th in root.iter("th"):
+        if _has_class(th, "Invert") and "Last 1 month" in th.text_content():
+            target_table = next(th.iterancestors("table"), None)
+            break
+
+    if target_table is None:
+        return []
+
+    distros: List[Dict[str, Any]] = []
+
+    for row in target_table.iter("tr"):
+        rank_cell = name_cell = hpd_cell = None
+        for cell in row.iter("th", "td"):
+            if rank_cell is None and cell.tag == "th" and _has_class(cell, "phr1"):
+                rank_cell = cell
+            elif name_cell is None and cell.tag == "td" and _has_class(cell, "phr2"):
+                name_cell = cell
+            elif hpd_cell is None and cell.tag == "td" and _has_class(cell, "phr3"):
+                hpd_cell = cell
+
+        if rank_cell is None or name_cell is None or hpd_cell is None:
+            continue
+
+        try:
+            rank = int(_text(rank_cell))
+        except ValueError:
+            continue
+
+        link = name_cell.find(".//a")
+        if link is None:
+            continue
+
+        # "https://distrowatch.com/cachyos" -> "cachyos"
+        slug = link.get("href", "").split("/")[-1]
+
+        # Hits per day: manter só os dígitos iniciais
+        hpd_match = _INT.search(_text(hpd_cell))
+
+        distros.append({
+            "rank": rank,
+            "slug": slug,
+            "name": _text(link),
+            "hpd": int(hpd_match.group(1)) if hpd_match else 0,
+        })
+
+        if limit and len(distros) >= limit:
+            break
+
+    return distros
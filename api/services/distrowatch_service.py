@@ -5,16 +5,22 @@ Busca dados de distribuições Linux do DistroWatch.com,
 fonte autorizada e atualizada com ranking mensal.
 """
 
-import asyncio
 import logging
+import os
 import re
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Callable
 from datetime import datetime
-from pathlib import Path
+from urllib.parse import urljoin
 import httpx
-from bs4 import BeautifulSoup
 
+from ..cache.page_cache import PageCache, get_page_cache
 from ..models.distro import DistroMetadata, DistroFamily, DesktopEnvironment
+from .distrowatch_parser import PARSER_VERSION
+from .http_clients import HttpClients, get_http_clients
+from .parse_executor import ParseExecutor, get_parse_executor
+from .pipeline import Pipeline, Stage
+from .rate_limiter import AdaptiveRateLimiter
+from .resilience import Resilience, get_resilience
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +28,22 @@ logger = logging.getLogger(__name__)
 class DistroWatchService:
     """Serviço para buscar dados do DistroWatch via scraping."""
     
-    BASE_URL = "http://distrowatch.com"
+    BASE_URL = os.getenv("DISTROWATCH_BASE_URL", "http://distrowatch.com")
     USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     TIMEOUT = 30.0
+    LOGO_URL = "https://distrowatch.com/images/yvzhuwbpy/{slug}.png"
+    
+    # Politeness: requisições simultâneas e requisições por segundo
+    CONCURRENCY = int(os.getenv("DISTROWATCH_CONCURRENCY", "4"))
+    RATE_LIMIT = float(os.getenv("DISTROWATCH_RATE_LIMIT", "2.0"))
+    
+    # Pipeline de scraping: páginas parseadas ao mesmo tempo (0 = workers
+    # do executor) e profundidade das filas entre estágios (0 = 2x workers)
+    PARSE_CONCURRENCY = int(os.getenv("DISTROWATCH_PARSE_CONCURRENCY", "0"))
+    QUEUE_SIZE = int(os.getenv("DISTROWATCH_QUEUE_SIZE", "0"))
+    
+    # Refresh incremental: idade máxima de um registro antes de novo scraping
+    MAX_RECORD_AGE = int(os.getenv("DISTROWATCH_MAX_RECORD_AGE", str(7 * 86400)))  # 7 dias
     
     # Mapeamento de famílias
     FAMILY_MAPPING = {
@@ -58,18 +77,153 @@ class DistroWatchService:
         "sway": DesktopEnvironment.SWAY,
     }
     
-    def __init__(self):
-        """Inicializa o serviço do DistroWatch."""
-        self.client = httpx.AsyncClient(
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        http_clients: Optional[HttpClients] = None,
+        parse_executor: Optional[ParseExecutor] = None,
+        page_cache: Optional[PageCache] = None,
+        resilience: Optional[Resilience] = None
+    ):
+        """
+        Inicializa o serviço do DistroWatch.
+        
+        Args:
+            base_url: URL base (padrão: BASE_URL; útil para um servidor local de testes).
+            concurrency: Máximo de requisições simultâneas (padrão: CONCURRENCY).
+            rate_limit: Requisições por segundo (padrão: RATE_LIMIT).
+            transport: Transporte httpx alternativo (ex: httpx.MockTransport);
+                cria um cliente próprio, fechado em close().
+            client: Cliente httpx (padrão: cliente "distrowatch" de http_clients).
+            http_clients: Clientes HTTP da aplicação ou do job (padrão:
+                get_http_clients()).
+            parse_executor: Executor do parsing de HTML (padrão: global).
+            page_cache: Cache em disco das páginas (padrão: global).
+            resilience: Retries/circuit breakers (padrão: global).
+        """
+        self.base_url = (base_url or self.BASE_URL).rstrip('/')
+        client_options = dict(
             timeout=self.TIMEOUT,
             headers={"User-Agent": self.USER_AGENT},
             follow_redirects=True,
-            http2=False  # Desabilitar HTTP/2 para evitar problemas de conexão
+            http2=False,  # Desabilitar HTTP/2 para evitar problemas de conexão
+        )
+        self._owns_client = client is None and transport is not None
+        if client is not None:
+            self.client = client
+        elif transport is not None:
+            self.client = httpx.AsyncClient(transport=transport, **client_options)
+        else:
+            # Conexões reaproveitadas entre execuções do job e refreshes
+            self.client = (http_clients or get_http_clients()).client("distrowatch", **client_options)
+        self.limiter = AdaptiveRateLimiter(
+            max_rate=rate_limit or self.RATE_LIMIT,
+            concurrency=concurrency or self.CONCURRENCY
         )
+        self.parser = parse_executor or get_parse_executor()
+        self.page_cache = page_cache or get_page_cache()
+        self.resilience = resilience or get_resilience()
+        
+        # Trabalho evitado pelo cache de páginas
+        self.fetch_stats = {
+            "downloaded": 0,        # 200 com corpo novo
+            "unchanged": 0,         # 200 com o mesmo corpo da última vez
+            "not_modified": 0,      # 304
+            "bytes_downloaded": 0,
+            "parses_skipped": 0,    # parsing reaproveitado do cache
+        }
     
     async def close(self):
-        """Fecha o cliente HTTP."""
-        await self.client.aclose()
+        """Fecha o cliente HTTP, se for próprio (o compartilhado continua aberto)."""
+        if self._owns_client:
+            await self.client.aclose()
+    
+    async def _get(self, url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """
+        GET respeitando o limitador de taxa, com retries e circuit breaker.
+        
+        A requisição ocupa uma vaga do limitador e cada tentativa consome
+        um token; em 429/5xx o limitador reduz a taxa, e a camada de
+        resiliência repete a requisição com backoff (e falha na hora se o
+        circuito do host estiver aberto).
+        
+        Args:
+            url: URL a buscar.
+            headers: Headers extras (ex: condicionais).
+        
+        Returns:
+            Resposta HTTP bem-sucedida (ou 304).
+        """
+        async def send_once() -> httpx.Response:
+            await self.limiter.throttle()
+            response = await self.client.get(url, headers=headers)
+            self.limiter.on_response(response.status_code, response.headers.get("Retry-After"))
+            return response
+        
+        async with self.limiter.slot():
+            response = await self.resilience.call(url, send_once)
+        
+        if response.status_code != 304:  # raise_for_status() trata 304 como erro
+            response.raise_for_status()
+        return response
+    
+    async def _fetch_page(self, url: str, parsed_version: Optional[int] = None) -> Tuple[Dict[str, Any], Optional[bytes]]:
+        """
+        Baixa uma página revalidando a cópia do cache em disco.
+        
+        Envia If-None-Match/If-Modified-Since quando a URL já foi baixada.
+        Em um 304 o corpo vem do disco, e nem é lido se já existe parsing
+        salvo para `parsed_version`.
+        
+        Args:
+            url: URL da página.
+            parsed_version: Versão do parser cujo resultado salvo basta.
+        
+        Returns:
+            Tupla (entrada do cache, corpo); corpo é None quando o parsing
+            salvo pode ser usado.
+        """
+        entry = self.page_cache.lookup(url)
+        response = await self._get(url, headers=self.page_cache.conditional_headers(entry))
+        
+        if response.status_code == 304 and entry:
+            self.fetch_stats["not_modified"] += 1
+            entry = self.page_cache.revalidated(entry)
+            
+            if parsed_version is not None and self.page_cache.parsed_result(entry, parsed_version) is not None:
+                return entry, None
+            
+            body = self.page_cache.read_body(entry)
+            if body is not None:
+                return entry, body
+            
+            # Corpo sumiu do disco: baixar de novo sem condicionais
+            response = await self._get(url)
+        
+        body = response.content
+        new_entry = self.page_cache.store(
+            url,
+            body,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            encoding=response.encoding,
+            previous=entry
+        )
+        
+        if entry and entry.get("body_hash") == new_entry["body_hash"]:
+            self.fetch_stats["unchanged"] += 1
+        else:
+            self.fetch_stats["downloaded"] += 1
+        self.fetch_stats["bytes_downloaded"] += len(body)
+        
+        if parsed_version is not None and self.page_cache.parsed_result(new_entry, parsed_version) is not None:
+            return new_entry, None
+        
+        return new_entry, body
     
     async def fetch_ranking_list(self, limit: int = 290) -> List[Dict[str, Any]]:
         """
@@ -80,77 +234,27 @@ class DistroWatchService:
         
         Returns:
             Lista de dicionários com {'rank', 'slug', 'name', 'hpd'}
+        
+        Raises:
+            Exception: Falha ao baixar ou interpretar o ranking. Não devolve
+                lista vazia: um ranking vazio viraria um catálogo vazio.
         """
         try:
             logger.info(f"Buscando ranking do DistroWatch (top {limit})...")
             
             # URL da página de ranking completo
-            response = await self.client.get(f"{self.BASE_URL}/dwres.php?resource=popularity")
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            distros = []
-            
-            # Encontrar especificamente a tabela "Last 1 month"
-            target_table = None
-            for th in soup.find_all('th', class_='Invert'):
-                if 'Last 1 month' in th.get_text():
-                    target_table = th.find_parent('table')
-                    break
-            
-            if not target_table:
-                logger.warning("Não encontrou tabela 'Last 1 month'")
-                return []
-            
-            # Encontrar todas as linhas <tr> DESTA tabela específica
-            rows = target_table.find_all('tr')
-            
-            for row in rows:
-                # Buscar células de ranking
-                rank_cell = row.find('th', class_='phr1')
-                name_cell = row.find('td', class_='phr2')
-                hpd_cell = row.find('td', class_='phr3')
-                
-                if rank_cell and name_cell and hpd_cell:
-                    try:
-                        rank = int(rank_cell.get_text(strip=True))
-                        
-                        # Extrair link e slug
-                        link = name_cell.find('a')
-                        if not link:
-                            continue
-                        
-                        name = link.get_text(strip=True)
-                        href = link.get('href', '')
-                        
-                        # Extrair slug do href: "https://distrowatch.com/cachyos" -> "cachyos"
-                        slug = href.split('/')[-1]
-                        
-                        # Extrair HPD (hits per day) - remover caracteres não numéricos
-                        hpd_text = hpd_cell.get_text(strip=True)
-                        hpd_match = re.search(r'(\d+)', hpd_text)
-                        hpd = int(hpd_match.group(1)) if hpd_match else 0
-                        
-                        distros.append({
-                            'rank': rank,
-                            'slug': slug,
-                            'name': name,
-                            'hpd': hpd
-                        })
-                        
-                        if len(distros) >= limit:
-                            break
-                            
-                    except (ValueError, AttributeError) as e:
-                        continue
-            
-            logger.info(f"Encontradas {len(distros)} distribuições no ranking")
-            return distros
+            entry, body = await self._fetch_page(f"{self.base_url}/dwres.php?resource=popularity")
             
+            distros = await self.parser.parse_ranking_page(body, limit, entry.get("encoding"))
         except Exception as e:
-            logger.error(f"Erro ao buscar ranking: {e}")
-            return []
+            logger.error(f"Erro ao buscar ranking: {e!r}")
+            raise
+        
+        if not distros:
+            raise ValueError("Tabela 'Last 1 month' não encontrada no ranking do DistroWatch")
+        
+        logger.info(f"Encontradas {len(distros)} distribuições no ranking")
+        return distros
     
     async def fetch_distro_by_slug(self, slug: str) -> Optional[DistroMetadata]:
         """
@@ -162,8 +266,11 @@ class DistroWatchService:
         Returns:
             Objeto DistroMetadata ou None.
         """
-        url = f"{self.BASE_URL}/table.php?distribution={slug}"
-        return await self.fetch_distro_details(url, slug)
+        return await self.fetch_distro_details(self.distro_url(slug), slug)
+    
+    def distro_url(self, slug: str) -> str:
+        """URL da página de uma distribuição."""
+        return f"{self.base_url}/table.php?distribution={slug}"
     
     async def fetch_distro_details(self, distro_url: str, identifier: str) -> Optional[DistroMetadata]:
         """
@@ -179,48 +286,237 @@ class DistroWatchService:
         try:
             logger.info(f"Buscando detalhes de {identifier}...")
             
-            response = await self.client.get(distro_url)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
             # Extrair dados estruturados
-            data = await self._parse_distro_page(soup)
+            data = await self._parse_distro_page(distro_url)
             
             if not data:
                 logger.warning(f"Não foi possível extrair dados de {identifier}")
                 return None
             
-            # Criar ID slug
-            distro_id = identifier if '/' not in identifier else self._create_slug(identifier)
-            
-            # Construir URL padrão da logo
-            logo_url = f"https://distrowatch.com/images/yvzhuwbpy/{distro_id}.png"
-            
-            return DistroMetadata(
-                id=distro_id,
-                name=data.get('name', identifier.title()),
-                description=data.get('description'),
-                os_type=data.get('os_type'),
-                based_on=data.get('based_on'),
-                family=data.get('family', DistroFamily.INDEPENDENT),
-                origin=data.get('origin'),
-                architecture=data.get('architecture'),
-                desktop=data.get('desktop'),
-                desktop_environments=data.get('desktop_environments', []),
-                category=data.get('category'),
-                status=data.get('status'),
-                ranking=data.get('ranking'),
-                rating=data.get('rating'),
-                homepage=data.get('homepage'),
-                logo=logo_url,
-                last_updated=datetime.utcnow()
-            )
+            return self._build_distro(data, identifier)
             
         except Exception as e:
             logger.warning(f"Erro ao buscar detalhes de {identifier}: {e}")
             return None
     
+    def _build_distro(self, data: Dict[str, Any], identifier: str) -> DistroMetadata:
+        """
+        Monta o registro a partir dos dados extraídos da página.
+        
+        Args:
+            data: Saída de _parse_fetched_page().
+            identifier: Nome ou slug da distribuição.
+        
+        Returns:
+            Objeto DistroMetadata.
+        """
+        # Criar ID slug
+        distro_id = identifier if '/' not in identifier else self._create_slug(identifier)
+        
+        # Logo da própria página (relativa a ela); sem <img>, a URL padrão
+        if data.get('logo'):
+            logo_url = urljoin(self.distro_url(distro_id), data['logo'])
+        else:
+            logo_url = self.LOGO_URL.format(slug=distro_id)
+        
+        return DistroMetadata(
+            id=distro_id,
+            name=data.get('name', identifier.title()),
+            description=data.get('description'),
+            os_type=data.get('os_type'),
+            based_on=data.get('based_on'),
+            family=data.get('family', DistroFamily.INDEPENDENT),
+            origin=data.get('origin'),
+            architecture=data.get('architecture'),
+            desktop=data.get('desktop'),
+            desktop_environments=data.get('desktop_environments', []),
+            category=data.get('category'),
+            status=data.get('status'),
+            ranking=data.get('ranking'),
+            rating=data.get('rating'),
+            homepage=data.get('homepage'),
+            logo=logo_url,
+            last_updated=datetime.utcnow()
+        )
+    
+    async def fetch_ranked_distros(
+        self,
+        ranking_list: List[Dict[str, Any]],
+        on_result: Optional[Callable[[Dict[str, Any], Optional[DistroMetadata]], None]] = None
+    ) -> List[Optional[DistroMetadata]]:
+        """
+        Busca os detalhes das distribuições do ranking em um pipeline.
+        
+        Estágios (cada um com sua fila e seus workers):
+        - fetch: CONCURRENCY downloads simultâneos, sob o limitador de
+          taxa compartilhado (no máximo RATE_LIMIT req/s, backoff em 429/5xx)
+        - parse: PARSE_CONCURRENCY páginas no executor de parsing
+        - build: derivação de família/DEs e validação do registro
+        Downloads seguem enquanto páginas anteriores são parseadas.
+        
+        Args:
+            ranking_list: Itens de fetch_ranking_list() ({'rank', 'slug', ...}).
+            on_result: Chamado com (item, distro ou None) assim que cada
+                distribuição termina (ex: checkpoint em journal).
+        
+        Returns:
+            Lista alinhada com ranking_list (None para as que falharam).
+        """
+        total = len(ranking_list)
+        done = 0
+        
+        async def fetch(item: Dict[str, Any], _) -> Optional[Tuple[Dict[str, Any], Optional[bytes]]]:
+            slug = item.get('slug', '?')
+            try:
+                return await self._fetch_page(self.distro_url(slug), parsed_version=PARSER_VERSION)
+            except Exception as e:
+                logger.warning(f"Erro ao buscar detalhes de {slug}: {e}")
+                return None
+        
+        async def parse(item: Dict[str, Any], page) -> Optional[Dict[str, Any]]:
+            data = await self._parse_fetched_page(*page)
+            if not data:
+                logger.warning(f"Não foi possível extrair dados de {item.get('slug')}")
+                return None
+            return data
+        
+        async def build(item: Dict[str, Any], data: Dict[str, Any]) -> DistroMetadata:
+            distro = self._build_distro(data, item['slug'])
+            # A posição na lista (último mês) prevalece sobre a da página,
+            # igual aos registros atualizados no modo incremental
+            if item.get('rank'):
+                distro.ranking = item['rank']
+            if item.get('hpd') is not None:
+                distro.hits_per_day = item['hpd']
+            return distro
+        
+        def sink(item: Dict[str, Any], distro: Optional[DistroMetadata]):
+            nonlocal done
+            done += 1
+            if distro:
+                logger.info(f"[{done}/{total}] ✓ #{item.get('rank')} {distro.name}")
+            else:
+                logger.warning(f"[{done}/{total}] ✗ Falhou: {item.get('slug', '?')}")
+            
+            if on_result is not None:
+                on_result(item, distro)
+        
+        queue_size = self.QUEUE_SIZE or None
+        pipeline = Pipeline([
+            Stage("fetch", fetch, concurrency=self.limiter.concurrency, queue_size=queue_size),
+            Stage("parse", parse, concurrency=self.PARSE_CONCURRENCY or self.parser.workers, queue_size=queue_size),
+            Stage("build", build, concurrency=1, queue_size=queue_size),
+        ], on_result=sink)
+        
+        return await pipeline.run(ranking_list)
+    
+    def _scrape_reason(self, distro: Optional[DistroMetadata], now: datetime, max_age: int) -> Optional[str]:
+        """
+        Motivo para refazer o scraping de um registro (None se pode ser reaproveitado).
+        
+        - new: slug que não está no catálogo atual
+        - expired: página sem entrada no cache de páginas ou com parsing
+          de outra versão do parser
+        - stale: página baixada (ou revalidada) há mais de max_age
+        
+        A idade vem do fetched_at da página, atualizado a cada scraping
+        mesmo quando o conteúdo não mudou. last_updated não serve: um
+        registro sem mudanças volta ao catálogo como o objeto anterior
+        (CatalogSnapshot reaproveita registros de mesmo conteúdo), com o
+        last_updated antigo. Só sem cache de páginas a idade é a do registro.
+        """
+        if distro is None:
+            return "new"
+        
+        scraped_at = distro.last_updated
+        if self.page_cache.enabled:
+            entry = self.page_cache.lookup(self.distro_url(distro.id))
+            if self.page_cache.parsed_result(entry, PARSER_VERSION) is None:
+                return "expired"
+            if entry.get("fetched_at"):
+                scraped_at = datetime.fromisoformat(entry["fetched_at"])
+        
+        if (now - scraped_at).total_seconds() > max_age:
+            return "stale"
+        
+        return None
+    
+    async def fetch_incremental(
+        self,
+        ranking_list: List[Dict[str, Any]],
+        existing: List[DistroMetadata],
+        max_age: Optional[int] = None,
+        on_result: Optional[Callable[[Dict[str, Any], Optional[DistroMetadata]], None]] = None
+    ) -> Tuple[List[DistroMetadata], Dict[str, int]]:
+        """
+        Atualiza o catálogo a partir do ranking, refazendo o mínimo de scraping.
+        
+        Registros já conhecidos e recentes só têm ranking e hits_per_day
+        atualizados a partir do ranking; páginas de detalhes são buscadas
+        apenas para slugs novos, registros cuja página foi baixada há mais
+        de max_age ou expirou do cache. Se o scraping de um registro conhecido
+        falhar, a versão anterior é mantida.
+        
+        Args:
+            ranking_list: Itens de fetch_ranking_list().
+            existing: Registros do catálogo atual.
+            max_age: Idade máxima da página em segundos (padrão: MAX_RECORD_AGE).
+            on_result: Repassado a fetch_ranked_distros() para cada scraping.
+        
+        Returns:
+            Tupla (distros na ordem do ranking, relatório com contagens
+            ranked/reused/new/stale/expired/scraped/failed).
+        """
+        max_age = self.MAX_RECORD_AGE if max_age is None else max_age
+        now = datetime.utcnow()
+        known = {distro.id: distro for distro in existing}
+        
+        report = {"ranked": len(ranking_list), "reused": 0, "new": 0, "stale": 0,
+                  "expired": 0, "scraped": 0, "failed": 0}
+        
+        to_scrape = []
+        for item in ranking_list:
+            reason = self._scrape_reason(known.get(item['slug']), now, max_age)
+            if reason:
+                report[reason] += 1
+                to_scrape.append(item)
+        
+        logger.info(
+            f"Refresh incremental: {len(ranking_list) - len(to_scrape)} reaproveitadas, "
+            f"{len(to_scrape)} para scraping ({report['new']} novas, {report['stale']} antigas, "
+            f"{report['expired']} expiradas)"
+        )
+        
+        scraped = dict(zip(
+            (item['slug'] for item in to_scrape),
+            await self.fetch_ranked_distros(to_scrape, on_result=on_result)
+        ))
+        
+        distros = []
+        for item in ranking_list:
+            slug = item['slug']
+            distro = scraped.get(slug)
+            
+            if distro is not None:
+                report["scraped"] += 1
+            else:
+                if slug in scraped:
+                    report["failed"] += 1
+                previous = known.get(slug)
+                if previous is None:
+                    continue
+                if slug not in scraped:
+                    report["reused"] += 1
+                # Os registros do snapshot são compartilhados: copiar em vez de alterar
+                distro = previous.model_copy(update={
+                    "ranking": item['rank'],
+                    "hits_per_day": item.get('hpd', previous.hits_per_day),
+                })
+            
+            distros.append(distro)
+        
+        return distros, report
+    
     async def fetch_all_from_ranking(self, limit: Optional[int] = None) -> List[DistroMetadata]:
         """
         Busca todas as distribuições do ranking do DistroWatch.
@@ -229,7 +525,7 @@ class DistroWatchService:
             limit: Limite opcional de quantas distros buscar
         
         Returns:
-            Lista de DistroMetadata
+            Lista de DistroMetadata, na ordem do ranking
         """
         # Primeiro buscar lista do ranking
         ranking_list = await self.fetch_ranking_list()
@@ -237,177 +533,70 @@ class DistroWatchService:
         if limit:
             ranking_list = ranking_list[:limit]
         
-        distros = []
         total = len(ranking_list)
+        logger.info(
+            f"Iniciando busca de {total} distribuições do ranking "
+            f"({self.limiter.concurrency} simultâneas, {self.limiter.rate:.1f} req/s)..."
+        )
         
-        logger.info(f"Iniciando busca de {total} distribuições do ranking...")
-        
-        for i, item in enumerate(ranking_list, 1):
-            try:
-                slug = item['slug']
-                rank = item['rank']
-                
-                logger.info(f"[{i}/{total}] Buscando #{rank} {slug}...")
-                
-                distro = await self.fetch_distro_by_slug(slug)
-                
-                if distro:
-                    # Atualizar ranking se não foi capturado
-                    if not distro.ranking:
-                        distro.ranking = rank
-                    distros.append(distro)
-                    logger.info(f"✓ {distro.name} adicionada")
-                else:
-                    logger.warning(f"✗ Falhou: {slug}")
-                
-                # Rate limiting
-                if i < total:
-                    await asyncio.sleep(1.5)
-                    
-            except Exception as e:
-                logger.error(f"Erro ao buscar {item.get('slug', '?')}: {e}")
-                continue
+        results = await self.fetch_ranked_distros(ranking_list)
+        distros = [distro for distro in results if distro]
         
         logger.info(f"Busca concluída: {len(distros)}/{total} distribuições obtidas")
         return distros
     
-    async def _parse_distro_page(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    async def _parse_distro_page(self, distro_url: str) -> Dict[str, Any]:
         """
-        Faz parsing completo da página de uma distribuição.
-        
-        Extrai campos do DistroWatch:
-        - OS Type, Based on, Origin, Architecture, Desktop, Category, Status
-        - Ranking (Popularity)
-        - Rating (Average visitor rating)
-        - Description
-        - Homepage
+        Baixa e faz parsing completo da página de uma distribuição.
         
         Args:
-            soup: Objeto BeautifulSoup da página.
+            distro_url: URL da página da distribuição.
         
         Returns:
             Dicionário com dados extraídos.
         """
-        data = {}
+        entry, body = await self._fetch_page(distro_url, parsed_version=PARSER_VERSION)
+        return await self._parse_fetched_page(entry, body)
+    
+    async def _parse_fetched_page(self, entry: Dict[str, Any], body: Optional[bytes]) -> Dict[str, Any]:
+        """
+        Faz o parsing de uma página baixada por _fetch_page().
         
-        try:
-            # 1. Encontrar o <ul> que contém os metadados
-            # (está logo após o logo da distribuição)
-            uls = soup.find_all('ul')
-            
-            metadata_ul = None
-            for ul in uls:
-                # Verificar se este <ul> tem <li> com <b>OS Type:</b>
-                first_li = ul.find('li')
-                if first_li and first_li.find('b'):
-                    label_text = first_li.find('b').get_text()
-                    if 'OS Type' in label_text or 'Based on' in label_text:
-                        metadata_ul = ul
-                        break
-            
-            if not metadata_ul:
-                logger.warning("Não encontrou <ul> de metadados")
+        Os campos crus vêm de parse_distro_page(), executado fora do
+        event loop (ou do cache de páginas, se o corpo não mudou); aqui
+        são derivados family (de 'Based on') e desktop_environments
+        (de 'Desktop').
+        
+        Args:
+            entry: Entrada do cache de páginas.
+            body: Corpo a parsear (None se o parsing salvo vale).
+        
+        Returns:
+            Dicionário com dados extraídos.
+        """
+        if body is None:
+            self.fetch_stats["parses_skipped"] += 1
+            data = dict(self.page_cache.parsed_result(entry, PARSER_VERSION))
+        else:
+            try:
+                data = await self.parser.parse_distro_page(body, entry.get("encoding"))
+            except Exception as e:
+                logger.error(f"Erro ao fazer parsing: {e}", exc_info=True)
                 return {}
             
-            # 2. Extrair metadados de cada <li>
-            list_items = metadata_ul.find_all('li')
-            
-            for li in list_items:
-                label_tag = li.find('b')
-                if not label_tag:
-                    continue
-                
-                label = label_tag.get_text(strip=True).replace(':', '').lower()
-                
-                # Extrair valor: pegar links diretos deste LI (sem recursão profunda)
-                # O problema é que os LI podem estar aninhados incorretamente pelo parser
-                # Vamos usar uma abordagem diferente: pegar apenas os <a> que são filhos diretos
-                value_parts = []
-                
-                # Iterar pelos filhos diretos do <li>
-                for child in li.children:
-                    if hasattr(child, 'name'):
-                        if child.name == 'a':
-                            value_parts.append(child.get_text(strip=True))
-                    elif isinstance(child, str):
-                        text = child.strip()
-                        if text and text not in [':', ',']:
-                            value_parts.append(text)
-                
-                if value_parts:
-                    value = ', '.join([p for p in value_parts if p])
-                    # Remover label se estiver no início
-                    label_full = label_tag.get_text(strip=True)
-                    if value.startswith(label_full):
-                        value = value[len(label_full):].strip(' ,:')
-                else:
-                    value = ""
-                
-                # Mapear campos
-                if 'os type' in label:
-                    data['os_type'] = value
-                    
-                elif 'based on' in label:
-                    data['based_on'] = value
-                    data['family'] = self._determine_family(value)
-                    
-                elif 'origin' in label:
-                    data['origin'] = value
-                    
-                elif 'architecture' in label:
-                    data['architecture'] = value
-                    
-                elif 'desktop' in label:
-                    data['desktop'] = value
-                    data['desktop_environments'] = self._parse_desktop_environments(value)
-                    
-                elif 'category' in label:
-                    data['category'] = value
-                    
-                elif 'status' in label:
-                    # Status pode estar dentro de <font> tag
-                    # Extrair texto de qualquer elemento
-                    font_tag = li.find('font')
-                    if font_tag:
-                        data['status'] = font_tag.get_text(strip=True)
-                    else:
-                        data['status'] = value
-                    
-                elif 'popularity' in label:
-                    # Extrair ranking: "1 (4,342 hits per day)" -> ranking = 1
-                    rank_match = re.search(r'^(\d+)', value)
-                    if rank_match:
-                        data['ranking'] = int(rank_match.group(1))
-            
-            # 2. Extrair nome do <h1>
-            h1 = soup.find('h1')
-            if h1:
-                data['name'] = h1.get_text(strip=True)
-            
-            # 3. Extrair rating: buscar "Average visitor rating: 8.1/10"
-            # Procurar por <b> tags que contenham o rating
-            for b_tag in soup.find_all('b'):
-                text = b_tag.get_text()
-                if re.search(r'\d+\.\d+', text) and '/' not in text:
-                    # Verificar se o contexto menciona rating
-                    parent_text = b_tag.parent.get_text() if b_tag.parent else ""
-                    if 'visitor rating' in parent_text.lower():
-                        rating_match = re.search(r'(\d+\.\d+)', text)
-                        if rating_match:
-                            data['rating'] = float(rating_match.group(1))
-                            break
-            
-            # 4. Extrair homepage da tabela Summary
-            data['homepage'] = self._extract_homepage(soup)
-            
-            # 5. Extrair description (parágrafo após os metadados)
-            data['description'] = self._extract_description(soup)
-            
-            return data
-            
-        except Exception as e:
-            logger.error(f"Erro ao fazer parsing: {e}", exc_info=True)
+            if data:
+                self.page_cache.store_parsed(entry, data, PARSER_VERSION)
+        
+        if not data:
+            logger.warning("Não encontrou <ul> de metadados")
             return {}
+        
+        if 'based_on' in data:
+            data['family'] = self._determine_family(data['based_on'])
+        if 'desktop' in data:
+            data['desktop_environments'] = self._parse_desktop_environments(data['desktop'])
+        
+        return data
     
     def _determine_family(self, based_on: str) -> DistroFamily:
         """Determina a família com base no campo 'Based on'."""
@@ -436,107 +625,6 @@ class DistroWatchService:
         
         return envs if envs else [DesktopEnvironment.OTHER]
     
-    def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
-        """
-        Extrai descrição da distribuição.
-        No DistroWatch, a descrição está após o </ul> de metadados,
-        como texto direto antes do <br><br>.
-        
-        Exemplo no HTML:
-        </ul>
-        CachyOS is a Linux distribution based on Arch Linux...
-        <br><br>
-        """
-        try:
-            # Encontrar o UL de metadados
-            uls = soup.find_all('ul')
-            metadata_ul = None
-            
-            for ul in uls:
-                first_li = ul.find('li')
-                if first_li and first_li.find('b'):
-                    label_text = first_li.find('b').get_text()
-                    if 'OS Type' in label_text:
-                        metadata_ul = ul
-                        break
-            
-            if not metadata_ul:
-                return None
-            
-            # Pegar o próximo elemento após o </ul>
-            # A descrição está geralmente como texto direto
-            next_sibling = metadata_ul.next_sibling
-            
-            while next_sibling:
-                if isinstance(next_sibling, str):
-                    text = next_sibling.strip()
-                    # Descrição tem mais de 50 chars e contém palavras-chave
-                    if len(text) > 50 and any(keyword in text.lower() for keyword in ['distribution', 'linux', 'based on', 'operating system', 'focuses on']):
-                        # Limitar a 500 caracteres
-                        if len(text) > 500:
-                            return text[:500] + "..."
-                        return text
-                
-                next_sibling = next_sibling.next_sibling
-                
-                # Parar se encontrar <br><br> ou outra tag relevante
-                if hasattr(next_sibling, 'name') and next_sibling.name in ['br', 'b', 'table']:
-                    break
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Erro ao extrair descrição: {e}")
-            return None
-    
-    def _extract_homepage(self, soup: BeautifulSoup) -> Optional[str]:
-        """
-        Extrai URL da homepage da distribuição.
-        No DistroWatch, está na tabela "Summary" como "Home Page".
-        """
-        try:
-            # Procurar na tabela "Summary"
-            tables = soup.find_all('table', class_='Info')
-            
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    th = row.find('th', class_='Info')
-                    if th and 'home page' in th.get_text().lower():
-                        td = row.find('td', class_='Info')
-                        if td:
-                            link = td.find('a', href=True)
-                            if link:
-                                return link.get('href')
-            
-            return None
-            
-        except Exception:
-            return None
-    
-    def _extract_logo(self, soup: BeautifulSoup) -> Optional[str]:
-        """
-        Extrai URL da logo da distribuição.
-        No DistroWatch, a logo está em uma tag <img> com src começando com 'images/'.
-        """
-        try:
-            # Procurar pela imagem da logo (geralmente está no topo da página)
-            # A logo tem src que começa com "images/yvzhuwbpy/" ou similar
-            for img in soup.find_all('img'):
-                src = img.get('src', '')
-                # Logos das distros ficam em /images/yvzhuwbpy/
-                if 'images/yvzhuwbpy/' in src or (src.startswith('images/') and not src.endswith('.gif')):
-                    # Se for URL relativa, converter para absoluta
-                    if not src.startswith('http'):
-                        src = f"{self.BASE_URL}/{src}"
-                    return src
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Erro ao extrair logo: {e}")
-            return None
-    
     def _create_slug(self, name: str) -> str:
         """Cria um slug a partir do nome."""
         slug = name.lower()
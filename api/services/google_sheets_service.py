@@ -6,18 +6,30 @@ Utiliza API pública sem autenticação (sheets públicas) para leitura.
 Utiliza OAuth 2.0 para escrita (atualização automática).
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import List, Optional, Dict, Any
+import threading
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 import httpx
 import os
 import json
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from ..cache.catalog import CatalogSnapshot, catalog_digest, content_digest
+from ..cache.page_cache import PageCache
+from ..cache.sheets_state import get_sheets_state
 from ..models.distro import DistroMetadata, DistroFamily, DesktopEnvironment
+from .csv_stream import aiter_csv_rows
+from .http_clients import HttpClients, get_http_clients
+from .resilience import get_resilience
+from .sheets_row_plan import SheetRowPlan
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +51,10 @@ class GoogleSheetsService:
     # OAuth 2.0 Scopes
     SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
     
+    # Escrita: ranges por batchUpdate e batchUpdates simultâneos
+    WRITE_CHUNK_SIZE = int(os.getenv("SHEETS_WRITE_CHUNK_SIZE", "500"))
+    WRITE_CONCURRENCY = int(os.getenv("SHEETS_WRITE_CONCURRENCY", "2"))
+    
     # Caminhos para credenciais
     CREDENTIALS_FILE = os.getenv('GOOGLE_CREDENTIALS_FILE', 'credentials.json')
     TOKEN_FILE = os.getenv('GOOGLE_TOKEN_FILE', 'token.json')
@@ -76,18 +92,38 @@ class GoogleSheetsService:
         "sway": DesktopEnvironment.SWAY,
     }
     
-    def __init__(self):
-        """Inicializa o serviço do Google Sheets."""
-        self.client = httpx.AsyncClient(
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        http_clients: Optional[HttpClients] = None
+    ):
+        """
+        Inicializa o serviço do Google Sheets.
+        
+        Args:
+            client: Cliente httpx (padrão: cliente "sheets" de http_clients,
+                com conexões reaproveitadas entre chamadas).
+            http_clients: Clientes HTTP da aplicação ou do job (padrão:
+                get_http_clients()).
+        """
+        self.client = client or (http_clients or get_http_clients()).client(
+            "sheets",
             timeout=self.TIMEOUT,
             headers={"User-Agent": self.USER_AGENT},
             follow_redirects=True,
         )
         self._sheets_service = None
+        self._credentials = None
+        self._sheets_lock = threading.Lock()  # Criação do serviço (threads do executor)
+        self._thread_local = threading.local()  # AuthorizedHttp por thread
     
     async def close(self):
-        """Fecha o cliente HTTP."""
-        await self.client.aclose()
+        """
+        Libera o serviço.
+        
+        O cliente HTTP é compartilhado (ou do chamador) e continua aberto;
+        ele é fechado no encerramento da aplicação.
+        """
     
     def _get_credentials(self) -> Optional[Credentials]:
         """
@@ -143,15 +179,22 @@ class GoogleSheetsService:
         Returns:
             Serviço do Google Sheets API.
         """
-        if not self._sheets_service:
-            creds = self._get_credentials()
-            if not creds:
-                raise ValueError("Credenciais OAuth não configuradas. Configure credentials.json")
-            
-            self._sheets_service = build('sheets', 'v4', credentials=creds)
+        with self._sheets_lock:
+            if not self._sheets_service:
+                creds = self._get_credentials()
+                if not creds:
+                    raise ValueError("Credenciais OAuth não configuradas. Configure credentials.json")
+                
+                self._credentials = creds
+                self._sheets_service = build('sheets', 'v4', credentials=creds)
         
         return self._sheets_service
     
+    @property
+    def csv_url(self) -> str:
+        """URL do export CSV da planilha (gviz)."""
+        return f"https://docs.google.com/spreadsheets/d/{self.SHEET_ID}/gviz/tq?tqx=out:csv&sheet={self.SHEET_NAME}"
+    
     async def fetch_all_distros(self) -> List[DistroMetadata]:
         """
         Busca todas as distribuições do Google Sheets.
@@ -159,147 +202,182 @@ class GoogleSheetsService:
         Returns:
             Lista de DistroMetadata.
         """
+        return await self.fetch_updated_distros()
+    
+    async def fetch_updated_distros(self, catalog: Optional[CatalogSnapshot] = None) -> Optional[List[DistroMetadata]]:
+        """
+        Busca as distribuições do Google Sheets, reaproveitando o catálogo atual.
+        
+        Com o estado da leitura anterior (SheetsState):
+        - a requisição é condicional (If-None-Match / If-Modified-Since)
+          quando o catálogo ainda é o gerado por aquela leitura; um 304
+          dispensa download e parsing
+        - linhas cujo hash não mudou reaproveitam o registro do catálogo
+          (conferido pelo hash de conteúdo) e não são convertidas nem
+          validadas de novo; só as linhas alteradas ou novas passam pelo
+          plano de conversão
+        
+        Args:
+            catalog: Catálogo atual (None = converter todas as linhas).
+        
+        Returns:
+            Lista de DistroMetadata, ou None se a planilha é a mesma que
+            gerou `catalog` (basta estender a validade do catálogo).
+        """
         try:
             logger.info(f"Buscando dados de Google Sheets (ID: {self.SHEET_ID}, Sheet: {self.SHEET_NAME})...")
             
             # Usar exportação CSV do Google Sheets (mais simples que API)
-            csv_url = f"https://docs.google.com/spreadsheets/d/{self.SHEET_ID}/gviz/tq?tqx=out:csv&sheet={self.SHEET_NAME}"
+            csv_url = self.csv_url
+            sheets_state = get_sheets_state()
+            state = sheets_state.load(csv_url) if catalog is not None else {}
             
-            response = await self.client.get(csv_url)
-            response.raise_for_status()
+            # Validadores só valem se o catálogo atual saiu daquela leitura
+            in_sync = bool(state) and state.get("content_version") == catalog.content_version
+            request_headers = PageCache.conditional_headers(state) if in_sync else {}
             
-            # Parse CSV
-            lines = response.text.strip().split('\n')
+            plan = None
+            header_hash = None
+            reusable: Dict[str, Tuple[DistroMetadata, str]] = {}
+            distros = []
+            digests = []
+            rows = {}
+            converted = 0
+            body_hash = hashlib.blake2b(digest_size=16)
+            
+            async def hashed(chunks):
+                async for chunk in chunks:
+                    body_hash.update(chunk.encode("utf-8"))
+                    yield chunk
+            
+            # CSV lido em streaming: registros saem à medida que os pedaços chegam
+            async with get_resilience().stream(self.client, csv_url, headers=request_headers) as response:
+                if response.status_code == 304 and in_sync:
+                    logger.info("Google Sheets sem alterações (304)")
+                    sheets_state.save(dict(state, fetched_at=datetime.utcnow().isoformat()))
+                    return None
+                response.raise_for_status()
+                
+                async for row_data in aiter_csv_rows(hashed(response.aiter_text())):
+                    # Primeira linha são headers: compilados uma vez só
+                    if plan is None:
+                        plan = self.compile_row_plan(row_data)
+                        header_hash = self._row_hash(row_data)
+                        if catalog is not None and state.get("header_hash") == header_hash:
+                            reusable = self._reusable_records(catalog, state.get("rows", {}))
+                        continue
+                    
+                    try:
+                        row_hash = self._row_hash(row_data)
+                        reused = reusable.get(row_hash)
+                        if reused is not None:
+                            distro, digest = reused
+                        else:
+                            # Mapear dados da linha para DistroMetadata
+                            distro = plan.convert(row_data)
+                            if not distro:
+                                continue
+                            digest = content_digest(distro)
+                            converted += 1
+                        
+                        distros.append(distro)
+                        digests.append(digest)
+                        rows[row_hash] = [distro.id, digest]
+                            
+                    except Exception as e:
+                        logger.warning(f"Erro ao processar linha do Sheets: {e}")
+                        continue
+                
+                etag = response.headers.get("etag")
+                last_modified = response.headers.get("last-modified")
             
-            if len(lines) < 2:
+            if plan is None:
                 logger.warning("Google Sheets retornou dados vazios")
                 return []
             
-            # Primeira linha são headers
-            headers = self._parse_csv_line(lines[0])
+            new_state = {
+                "url": csv_url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "body_hash": body_hash.hexdigest(),
+                "header_hash": header_hash,
+                "content_version": catalog_digest(digests),
+                "rows": rows,
+                "fetched_at": datetime.utcnow().isoformat(),
+            }
+            sheets_state.save(new_state)
             
-            distros = []
+            logger.info(
+                f"Total de {len(distros)} distribuições processadas do Google Sheets "
+                f"({len(distros) - converted} reaproveitadas, {converted} convertidas)"
+            )
             
-            # Processar cada linha (exceto header)
-            for line in lines[1:]:
-                if not line.strip():
-                    continue
-                
-                try:
-                    row_data = self._parse_csv_line(line)
-                    
-                    # Mapear dados da linha para DistroMetadata
-                    distro = self._parse_distro_row(headers, row_data)
-                    
-                    if distro:
-                        distros.append(distro)
-                        
-                except Exception as e:
-                    logger.warning(f"Erro ao processar linha do Sheets: {e}")
-                    continue
+            if (
+                catalog is not None
+                and converted == 0
+                and new_state["body_hash"] == state.get("body_hash")
+                and new_state["content_version"] == catalog.content_version
+            ):
+                logger.info("Google Sheets sem alterações (mesmo conteúdo)")
+                return None
             
-            logger.info(f"Total de {len(distros)} distribuições processadas do Google Sheets")
             return distros
             
         except Exception as e:
             logger.error(f"Erro ao buscar dados do Google Sheets: {e}", exc_info=True)
             raise
     
-    def _parse_csv_line(self, line: str) -> List[str]:
+    @staticmethod
+    def _row_hash(row_data: List[str]) -> str:
+        """Hash das células de uma linha (ou do cabeçalho)."""
+        return hashlib.blake2b("\x1f".join(row_data).encode("utf-8"), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _reusable_records(
+        catalog: CatalogSnapshot,
+        rows: Dict[str, List[str]]
+    ) -> Dict[str, Tuple[DistroMetadata, str]]:
         """
-        Parse de linha CSV com suporte a aspas.
+        Registros do catálogo que podem ser reaproveitados por hash de linha.
         
         Args:
-            line: Linha CSV.
+            catalog: Catálogo atual.
+            rows: Linhas da leitura anterior (hash -> [id, content_digest]).
         
         Returns:
-            Lista de valores.
-        """
-        values = []
-        current = ""
-        in_quotes = False
-        
-        for char in line:
-            if char == '"':
-                in_quotes = not in_quotes
-            elif char == ',' and not in_quotes:
-                values.append(current.strip().strip('"'))
-                current = ""
-            else:
-                current += char
-        
-        values.append(current.strip().strip('"'))
-        return values
+            Hash da linha -> (registro, content_digest), só para registros
+            que ainda estão no catálogo com o mesmo conteúdo.
+        """
+        reusable = {}
+        for row_hash, (distro_id, digest) in rows.items():
+            position = catalog.find(distro_id)
+            if position is not None and catalog.record_digest(position) == digest:
+                reusable[row_hash] = (catalog.distros[position], digest)
+        return reusable
     
-    def _parse_distro_row(self, headers: List[str], row_data: List[str]) -> Optional[DistroMetadata]:
+    def compile_row_plan(self, headers: List[str]) -> SheetRowPlan:
         """
-        Converte uma linha do Sheets em DistroMetadata.
+        Compila o cabeçalho da planilha em um plano de conversão de linhas.
         
         Args:
             headers: Lista de nomes de colunas.
-            row_data: Dados da linha.
         
         Returns:
-            DistroMetadata ou None se inválido.
+            SheetRowPlan com os conversores deste serviço.
         """
-        try:
-            # Criar dicionário de dados
-            data = {}
-            for i, header in enumerate(headers):
-                if i < len(row_data):
-                    data[header.lower().strip()] = row_data[i].strip()
-            
-            # Extrair campos obrigatórios
-            name = data.get("name", "").strip()
-            if not name:
-                return None
-            
-            # ID: usar nome normalizado
-            distro_id = data.get("distro id", "").strip() or self._normalize_id(name)
-            
-            # Family/Base
-            base = data.get("base", "").strip() or data.get("os type", "").strip()
-            family = self._map_family(base)
-            
-            # Desktop Environments
-            desktop_str = data.get("desktop", "").strip()
-            desktop_environments = self._parse_desktop_environments(desktop_str)
-            
-            # Data de lançamento
-            release_date_str = data.get("release date", "").strip()
-            release_date = self._parse_date(release_date_str)
-            
-            # Criar objeto com todos os campos do Google Sheets
-            distro = DistroMetadata(
-                id=distro_id,
-                name=name,
-                summary=data.get("description", "").strip() or None,
-                description=data.get("description", "").strip() or None,
-                logo=data.get("logo", "").strip() or None,
-                logo_url=data.get("logo url", "").strip() or None,
-                os_type=data.get("os type", "").strip() or None,
-                family=family,
-                based_on=base or None,
-                origin=data.get("origin", "").strip() or None,
-                desktop=desktop_str or None,
-                desktop_environments=desktop_environments,
-                category=data.get("category", "").strip() or None,
-                status=data.get("status", "").strip() or None,
-                idle_ram_usage=data.get("idle ram usage", "").strip() or None,
-                image_size=data.get("image size", "").strip() or None,
-                office_suite=data.get("office suite", "").strip() or None,
-                price=data.get("price (r$)", "").strip() or None,
-                latest_release_date=release_date,
-                homepage=data.get("website", "").strip() or None,
-                package_manager=data.get("package management", "").strip() or None,
-                architecture=data.get("architecture", "").strip() or None,
-            )
-            
-            return distro
-            
-        except Exception as e:
-            logger.warning(f"Erro ao parsear linha de distro: {e}")
-            return None
+        plan = SheetRowPlan(headers, {
+            "date": self._parse_date,
+            "desktop_environments": self._parse_desktop_environments,
+            "family": self._map_family,
+            "id": self._normalize_id,
+        })
+        
+        if plan.name_index is None:
+            logger.warning("Planilha sem coluna 'Name': nenhuma linha será importada")
+        if plan.unknown:
+            logger.debug(f"Colunas ignoradas do Sheets: {', '.join(plan.unknown)}")
+        
+        return plan
     
     def _normalize_id(self, name: str) -> str:
         """
@@ -426,10 +504,95 @@ class GoogleSheetsService:
         
         return 0.0
     
-    def update_distro_data(self, enriched_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _thread_http(self) -> AuthorizedHttp:
+        """
+        Conexão autenticada da thread atual.
+        
+        httplib2 não é thread-safe: cada thread do executor usa o seu
+        próprio AuthorizedHttp (criado uma vez e reaproveitado).
+        """
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = AuthorizedHttp(self._credentials, http=httplib2.Http(timeout=self.TIMEOUT))
+            self._thread_local.http = http
+        return http
+    
+    def _execute(self, request) -> Dict[str, Any]:
+        """
+        Executa uma requisição da API na thread atual.
+        
+        429/5xx são repetidos com backoff exponencial pelo próprio
+        googleapiclient (num_retries).
+        """
+        return request.execute(http=self._thread_http(), num_retries=get_resilience().max_attempts - 1)
+    
+    def _read_sheet_layout(self) -> Optional[Tuple[List[str], Dict[str, int]]]:
+        """
+        Lê o cabeçalho e a coluna de nomes (bloqueante, roda no executor).
+        
+        Só as colunas necessárias são lidas, sem limite fixo de linhas
+        ou colunas.
+        
+        Returns:
+            (headers em minúsculas, nome em minúsculas -> número da linha)
+            ou None se a planilha está vazia. Sem coluna 'name', o mapa
+            fica vazio.
+        """
+        values = self._get_sheets_service().spreadsheets().values()
+        
+        header_rows = self._execute(values.get(
+            spreadsheetId=self.SHEET_ID,
+            range=f"{self.SHEET_NAME}!1:1"
+        )).get('values', [])
+        
+        if not header_rows:
+            return None
+        
+        headers = [h.lower().strip() for h in header_rows[0]]
+        if 'name' not in headers:
+            return headers, {}
+        name_letter = self._col_number_to_letter(headers.index('name') + 1)
+        
+        name_rows = self._execute(values.get(
+            spreadsheetId=self.SHEET_ID,
+            range=f"{self.SHEET_NAME}!{name_letter}2:{name_letter}"
+        )).get('values', [])
+        
+        # Criar mapa de nome -> índice de linha
+        name_to_row = {}
+        for i, row in enumerate(name_rows, start=2):  # Começa em 2 (linha 1 é header)
+            if row:
+                name_to_row[row[0].strip().lower()] = i
+        
+        return headers, name_to_row
+    
+    def _batch_update(self, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Envia um lote de atualizações (bloqueante, roda no executor).
+        
+        Args:
+            updates: Ranges e valores do lote.
+        
+        Returns:
+            Resposta do batchUpdate.
+        """
+        body = {
+            'valueInputOption': 'USER_ENTERED',
+            'data': updates
+        }
+        return self._execute(self._get_sheets_service().spreadsheets().values().batchUpdate(
+            spreadsheetId=self.SHEET_ID,
+            body=body
+        ))
+    
+    async def update_distro_data(self, enriched_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Atualiza dados enriquecidos no Google Sheets.
         
+        As chamadas ao googleapiclient (síncronas) rodam em threads, fora do
+        event loop. As atualizações são enviadas em lotes de até
+        WRITE_CHUNK_SIZE ranges, com até WRITE_CONCURRENCY lotes em paralelo.
+        
         Args:
             enriched_data: Lista de dados enriquecidos pelo GROQ.
                           Cada item deve ter: name, ram_idle, cpu_score, io_score, requisitos
@@ -438,25 +601,17 @@ class GoogleSheetsService:
             Dicionário com resultado da operação.
         """
         try:
-            service = self._get_sheets_service()
-            
-            # Primeiro, buscar os headers e dados atuais
-            result = service.spreadsheets().values().get(
-                spreadsheetId=self.SHEET_ID,
-                range=f"{self.SHEET_NAME}!A1:Z1000"
-            ).execute()
+            # Primeiro, buscar os headers e a coluna de nomes
+            layout = await asyncio.to_thread(self._read_sheet_layout)
             
-            values = result.get('values', [])
-            
-            if not values:
+            if layout is None:
                 return {"error": "Planilha vazia"}
             
-            # Headers na primeira linha
-            headers = [h.lower().strip() for h in values[0]]
+            headers, name_to_row = layout
             
             # Encontrar índices das colunas que precisamos atualizar
             try:
-                name_col = headers.index('name')
+                headers.index('name')
                 ram_col = headers.index('idle ram usage')
                 cpu_col = headers.index('cpu score') if 'cpu score' in headers else None
                 io_col = headers.index('i/o score') if 'i/o score' in headers else None
@@ -464,12 +619,6 @@ class GoogleSheetsService:
             except ValueError as e:
                 return {"error": f"Coluna não encontrada: {e}"}
             
-            # Criar mapa de nome -> índice de linha
-            name_to_row = {}
-            for i, row in enumerate(values[1:], start=2):  # Começa em 2 (linha 1 é header)
-                if len(row) > name_col:
-                    name_to_row[row[name_col].strip().lower()] = i
-            
             # Preparar atualizações em batch
             updates = []
             updated_count = 0
@@ -530,24 +679,38 @@ class GoogleSheetsService:
                 
                 updated_count += 1
             
-            # Executar todas as atualizações em batch
+            # Executar as atualizações em lotes, com paralelismo limitado
+            chunk_size = max(1, self.WRITE_CHUNK_SIZE)
+            chunks = [updates[i:i + chunk_size] for i in range(0, len(updates), chunk_size)]
+            semaphore = asyncio.Semaphore(max(1, self.WRITE_CONCURRENCY))
+            
+            async def send(chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await asyncio.to_thread(self._batch_update, chunk)
+            
+            results = await asyncio.gather(*(send(chunk) for chunk in chunks), return_exceptions=True)
+            
+            total_cells = 0
+            failed_chunks = 0
+            for index, result in enumerate(results, start=1):
+                if isinstance(result, Exception):
+                    failed_chunks += 1
+                    logger.error(f"Erro no lote {index}/{len(chunks)} do Google Sheets: {result}")
+                    errors.append(f"lote {index}/{len(chunks)}: {result}")
+                else:
+                    total_cells += result.get('totalUpdatedCells', 0)
+            
             if updates:
-                body = {
-                    'valueInputOption': 'USER_ENTERED',
-                    'data': updates
-                }
-                
-                result = service.spreadsheets().values().batchUpdate(
-                    spreadsheetId=self.SHEET_ID,
-                    body=body
-                ).execute()
-                
-                logger.info(f"Google Sheets atualizado: {updated_count} distros, {result.get('totalUpdatedCells', 0)} células")
+                logger.info(
+                    f"Google Sheets atualizado: {updated_count} distros, {total_cells} células "
+                    f"({len(chunks)} lote(s), {failed_chunks} com erro)"
+                )
             
             return {
-                "success": True,
+                "success": failed_chunks == 0,
                 "updated": updated_count,
-                "total_cells": result.get('totalUpdatedCells', 0) if updates else 0,
+                "total_cells": total_cells,
+                "chunks": len(chunks),
                 "errors": errors if errors else None
             }
             
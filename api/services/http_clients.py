@@ -0,0 +1,183 @@
+"""
+Clientes HTTP compartilhados para as fontes externas.
+
+Cada fonte (Google Sheets, DistroWatch, hosts de logos) usa um único
+httpx.AsyncClient durante toda a vida da aplicação, e as conexões
+(TCP + TLS) ficam abertas entre requisições e refreshes.
+
+O registro é criado por quem controla o ciclo de vida e repassado aos
+serviços: o lifespan do FastAPI (app.state.http_clients, que as rotas
+entregam aos serviços) e o job de atualização, cada um fechando o seu
+no encerramento. get_http_clients() é o registro padrão de quem não
+recebe um (scripts, benchmarks). Os clientes são criados sob demanda,
+no event loop em que são usados.
+
+Configuração (por cliente):
+- HTTP_MAX_CONNECTIONS: conexões simultâneas
+- HTTP_MAX_KEEPALIVE: conexões ociosas mantidas abertas
+- HTTP_KEEPALIVE_EXPIRY: segundos até fechar uma conexão ociosa
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from typing import Any, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClients:
+    """
+    Registro de clientes httpx por fonte.
+
+    Uso:
+        http_clients = HttpClients()
+        service = GoogleSheetsService(http_clients=http_clients)
+        ...
+        await http_clients.aclose()
+
+    As opções de um cliente (timeout, headers, ...) são as da primeira
+    chamada; os limites do pool são os mesmos para todos.
+    """
+
+    MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+    MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "10"))
+    KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+
+    def __init__(self, limits: Optional[httpx.Limits] = None):
+        """
+        Inicializa o registro.
+
+        Args:
+            limits: Limites do pool de conexões (padrão: variáveis de ambiente).
+        """
+        self.limits = limits or httpx.Limits(
+            max_connections=self.MAX_CONNECTIONS,
+            max_keepalive_connections=self.MAX_KEEPALIVE,
+            keepalive_expiry=self.KEEPALIVE_EXPIRY
+        )
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def client(self, name: str, **options: Any) -> httpx.AsyncClient:
+        """
+        Cliente compartilhado de uma fonte, criado na primeira chamada.
+
+        Args:
+            name: Nome da fonte (ex: "sheets", "distrowatch", "logos").
+            options: Opções do httpx.AsyncClient (timeout, headers, ...).
+
+        Returns:
+            Cliente httpx.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        # Conexões pertencem ao loop em que foram abertas: outro loop
+        # (ex: um asyncio.run() novo) recebe clientes novos, e os antigos
+        # são fechados antes de serem descartados
+        if loop is not None and self._loop is not None and loop is not self._loop and self._clients:
+            if not self._loop.is_closed():
+                logger.warning("Clientes HTTP usados em outro event loop; criando novos")
+            self._retire(self._clients, self._loop)
+            self._clients = {}
+        if loop is not None:
+            self._loop = loop
+
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=self.limits, **options)
+            self._clients[name] = client
+            logger.info(f"Cliente HTTP '{name}' criado")
+        return client
+
+    def _retire(self, clients: Dict[str, httpx.AsyncClient], loop: asyncio.AbstractEventLoop):
+        """
+        Fecha clientes criados em outro event loop.
+
+        Se o loop ainda roda (em outra thread), aclose() é agendado nele.
+        Se já parou ou foi fechado, aclose() não tem onde rodar: os sockets
+        do pool são fechados diretamente.
+
+        Args:
+            clients: Clientes por nome.
+            loop: Loop em que foram criados.
+        """
+        for name, client in clients.items():
+            if client.is_closed:
+                continue
+            if not loop.is_closed() and loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+                continue
+            try:
+                closed = self._close_sockets(client)
+                if closed:
+                    logger.info(f"Cliente HTTP '{name}' de um event loop encerrado: {closed} conexão(ões) fechada(s)")
+            except Exception as e:
+                logger.warning(f"Erro ao fechar conexões do cliente HTTP '{name}': {e}")
+
+    @staticmethod
+    def _close_sockets(client: httpx.AsyncClient) -> int:
+        """
+        Fecha os sockets das conexões abertas de um cliente, sem event loop.
+
+        Args:
+            client: Cliente httpx com o transporte padrão (pool do httpcore).
+
+        Returns:
+            Número de sockets fechados.
+        """
+        pool = getattr(client._transport, "_pool", None)
+        closed = 0
+        for connection in list(getattr(pool, "_connections", [])):
+            stream = getattr(getattr(connection, "_connection", None), "_network_stream", None)
+            sock = stream.get_extra_info("socket") if stream is not None else None
+            if sock is None or sock.fileno() == -1:
+                continue
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass  # Conexão já encerrada pelo servidor
+            # O asyncio entrega um TransportSocket, sem close(): fechar o socket real
+            getattr(sock, "_sock", sock).close()
+            closed += 1
+        return closed
+
+    async def aclose(self):
+        """Fecha todos os clientes (e suas conexões)."""
+        clients, self._clients = self._clients, {}
+        if self._loop is not None and self._loop is not asyncio.get_running_loop():
+            # Criados em outro event loop: não podem ser aguardados neste
+            self._retire(clients, self._loop)
+            clients = {}
+        for name, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Erro ao fechar cliente HTTP '{name}': {e}")
+        if clients:
+            logger.info(f"{len(clients)} cliente(s) HTTP fechado(s)")
+
+
+# Instância global dos clientes HTTP
+_http_clients: Optional[HttpClients] = None
+
+
+def get_http_clients() -> HttpClients:
+    """
+    Retorna a instância global dos clientes HTTP.
+
+    Returns:
+        Instância do HttpClients.
+    """
+    global _http_clients
+
+    if _http_clients is None:
+        _http_clients = HttpClients()
+
+    return _http_clients
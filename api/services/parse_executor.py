@@ -0,0 +1,152 @@
+"""
+Executor de parsing de HTML fora do event loop.
+
+O parsing das páginas do DistroWatch é CPU-bound; rodando no loop ele
+atrasa as requisições da API enquanto um refresh acontece em background.
+Aqui ele roda em um pool de processos (ou threads): entram os bytes crus
+da resposta, saem os dicionários de parse_distro_page/parse_ranking_page.
+
+Configuração:
+- PARSE_EXECUTOR: "process" (padrão) ou "thread"
+- PARSE_WORKERS: número de workers (padrão: min(4, CPUs))
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+from .distrowatch_parser import parse_distro_page, parse_ranking_page
+
+logger = logging.getLogger(__name__)
+
+
+class ParseExecutor:
+    """
+    Pool de workers para parsing de HTML.
+
+    O pool é criado sob demanda na primeira chamada. Se o ambiente não
+    suporta processos (ex: sem /dev/shm em funções serverless), cai para
+    um pool de threads; o lxml libera o GIL durante o parsing.
+    """
+
+    MODES = ("process", "thread")
+    DEFAULT_MODE = os.getenv("PARSE_EXECUTOR", "process").lower()
+    DEFAULT_WORKERS = int(os.getenv("PARSE_WORKERS", "0")) or min(4, os.cpu_count() or 1)
+
+    def __init__(self, mode: Optional[str] = None, workers: Optional[int] = None):
+        """
+        Inicializa o executor.
+
+        Args:
+            mode: "process" ou "thread" (padrão: PARSE_EXECUTOR).
+            workers: Número de workers (padrão: PARSE_WORKERS).
+        """
+        mode = (mode or self.DEFAULT_MODE).lower()
+        if mode not in self.MODES:
+            logger.warning(f"PARSE_EXECUTOR inválido: {mode!r}, usando 'process'")
+            mode = "process"
+
+        self.mode = mode
+        self.workers = max(1, workers or self.DEFAULT_WORKERS)
+        self._pool: Optional[Executor] = None
+
+    def _get_pool(self) -> Executor:
+        """Cria o pool na primeira utilização."""
+        if self._pool is not None:
+            return self._pool
+
+        if self.mode == "process":
+            try:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            except (OSError, NotImplementedError, ImportError) as e:
+                logger.warning(f"Pool de processos indisponível ({e}), usando threads")
+                self.mode = "thread"
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="html-parse")
+
+        logger.info(f"Executor de parsing: {self.workers} worker(s) ({self.mode})")
+        return self._pool
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Executa uma função pura no pool.
+
+        Args:
+            func: Função de módulo (precisa ser serializável por pickle).
+            args: Argumentos (idem).
+
+        Returns:
+            Resultado da função.
+        """
+        loop = asyncio.get_running_loop()
+        call = partial(func, *args)
+
+        try:
+            return await loop.run_in_executor(self._get_pool(), call)
+        except BrokenProcessPool:
+            # Um worker morreu (ex: OOM): recriar o pool e tentar de novo
+            logger.warning("Pool de parsing quebrado, recriando...")
+            self.shutdown(wait=False)
+            return await loop.run_in_executor(self._get_pool(), call)
+
+    async def parse_distro_page(self, html: bytes, encoding: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Faz parsing da página de uma distribuição no pool.
+
+        Args:
+            html: Corpo bruto da resposta.
+            encoding: Encoding do corpo.
+
+        Returns:
+            Dicionário de parse_distro_page().
+        """
+        return await self.run(parse_distro_page, html, encoding)
+
+    async def parse_ranking_page(
+        self,
+        html: bytes,
+        limit: Optional[int] = None,
+        encoding: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Faz parsing da página de ranking no pool.
+
+        Args:
+            html: Corpo bruto da resposta.
+            limit: Número máximo de distribuições.
+            encoding: Encoding do corpo.
+
+        Returns:
+            Lista de parse_ranking_page().
+        """
+        return await self.run(parse_ranking_page, html, limit, encoding)
+
+    def shutdown(self, wait: bool = True):
+        """Encerra o pool (ele é recriado se o executor for usado de novo)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+
+# Instância global do executor
+_parse_executor: Optional[ParseExecutor] = None
+
+
+def get_parse_executor() -> ParseExecutor:
+    """
+    Retorna a instância global do executor de parsing.
+
+    Returns:
+        Instância do ParseExecutor.
+    """
+    global _parse_executor
+
+    if _parse_executor is None:
+        _parse_executor = ParseExecutor()
+
+    return _parse_executor
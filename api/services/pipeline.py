@@ -0,0 +1,155 @@
+"""
+Pipeline assíncrono em estágios (produtor/consumidor).
+
+Cada estágio tem sua própria fila (com profundidade limitada) e seu
+próprio número de workers, então trabalho de rede de um item se
+sobrepõe ao trabalho de CPU de outro e um estágio lento segura os
+anteriores por backpressure em vez de acumular itens na memória.
+
+    produtor -> [fila] estágio 1 (N workers) -> [fila] estágio 2 ... -> sink
+
+Um item que falha (exceção ou None) em qualquer estágio sai do fluxo e
+vai direto para o sink como falha; os demais seguem normalmente.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Marca de fim de fluxo entre estágios
+_DONE = object()
+
+
+class Stage:
+    """Um estágio do pipeline."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Any, Any], Awaitable[Any]],
+        concurrency: int = 1,
+        queue_size: Optional[int] = None
+    ):
+        """
+        Define o estágio.
+
+        Args:
+            name: Nome (aparece nos logs e nas estatísticas).
+            func: Corrotina func(item, valor) -> novo valor. O item é o
+                original da entrada; o valor é a saída do estágio anterior
+                (no primeiro estágio, o próprio item). None descarta o item.
+            concurrency: Workers simultâneos do estágio.
+            queue_size: Profundidade da fila de entrada (padrão: 2x concurrency).
+        """
+        self.name = name
+        self.func = func
+        self.concurrency = max(1, concurrency)
+        self.queue_size = queue_size or 2 * self.concurrency
+
+
+class Pipeline:
+    """
+    Executa itens por uma sequência de estágios.
+
+    Uso:
+        pipeline = Pipeline([
+            Stage("fetch", fetch, concurrency=4),
+            Stage("parse", parse, concurrency=2),
+        ], on_result=callback)
+        results = await pipeline.run(items)
+    """
+
+    def __init__(
+        self,
+        stages: List[Stage],
+        on_result: Optional[Callable[[Any, Any], None]] = None
+    ):
+        """
+        Monta o pipeline.
+
+        Args:
+            stages: Estágios, na ordem.
+            on_result: Sink chamado com (item, resultado ou None) assim que
+                cada item termina ou falha, na ordem de conclusão.
+        """
+        if not stages:
+            raise ValueError("Pipeline precisa de ao menos um estágio")
+
+        self.stages = stages
+        self.on_result = on_result
+        self.stats = {stage.name: {"done": 0, "failed": 0} for stage in stages}
+
+    async def run(self, items: Iterable[Any]) -> List[Any]:
+        """
+        Processa todos os itens.
+
+        Args:
+            items: Itens de entrada.
+
+        Returns:
+            Resultados alinhados com a entrada (None para os que falharam).
+        """
+        items = list(items)
+        results: List[Any] = [None] * len(items)
+        queues = [asyncio.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        sink: asyncio.Queue = asyncio.Queue()
+
+        async def produce():
+            for index, item in enumerate(items):
+                await queues[0].put((index, item))
+            for _ in range(self.stages[0].concurrency):
+                await queues[0].put(_DONE)
+
+        async def work(position: int):
+            stage = self.stages[position]
+            inbox = queues[position]
+            outbox = queues[position + 1] if position + 1 < len(queues) else sink
+
+            while True:
+                job = await inbox.get()
+                if job is _DONE:
+                    return
+
+                index, value = job
+                try:
+                    value = await stage.func(items[index], value)
+                except Exception as e:
+                    logger.warning(f"Estágio {stage.name} falhou: {e!r}")
+                    value = None
+
+                if value is None:
+                    self.stats[stage.name]["failed"] += 1
+                    await sink.put((index, None))
+                else:
+                    self.stats[stage.name]["done"] += 1
+                    await outbox.put((index, value))
+
+        async def run_stage(position: int):
+            await asyncio.gather(*(work(position) for _ in range(self.stages[position].concurrency)))
+            # Estágio esgotado: encerrar os workers do próximo
+            if position + 1 < len(queues):
+                for _ in range(self.stages[position + 1].concurrency):
+                    await queues[position + 1].put(_DONE)
+
+        async def drain():
+            for _ in range(len(items)):
+                index, value = await sink.get()
+                results[index] = value
+                if self.on_result is not None:
+                    try:
+                        self.on_result(items[index], value)
+                    except Exception as e:
+                        logger.warning(f"Erro no sink do pipeline: {e!r}")
+
+        tasks = [asyncio.ensure_future(produce()), asyncio.ensure_future(drain())]
+        tasks += [asyncio.ensure_future(run_stage(position)) for position in range(len(self.stages))]
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return results
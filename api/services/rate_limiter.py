@@ -0,0 +1,158 @@
+"""
+Controle de taxa para scraping educado.
+
+Combina um semáforo (requisições simultâneas) com um token bucket
+(requisições por segundo) que reduz a taxa quando o servidor responde
+429 ou 5xx e volta a aumentá-la aos poucos quando as respostas normalizam.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket assíncrono.
+
+    Cada acquire() consome um token; os tokens são repostos a `rate` por
+    segundo, até `capacity`. Quem chega sem token espera a reposição,
+    em ordem de chegada.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Inicializa o bucket.
+
+        Args:
+            rate: Tokens repostos por segundo.
+            capacity: Máximo de tokens acumulados (rajada). Padrão: 1.
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else 1.0
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self):
+        """Aguarda e consome um token."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AdaptiveRateLimiter:
+    """
+    Limita concorrência e taxa de requisições a um servidor.
+
+    - concurrency: máximo de requisições em andamento (semáforo)
+    - rate: requisições iniciadas por segundo (token bucket)
+
+    Ao receber 429/5xx a taxa cai pela metade (até min_rate) e novas
+    requisições são pausadas por `Retry-After` (ou backoff_seconds);
+    cada resposta bem-sucedida devolve um pouco da taxa, até max_rate.
+    """
+
+    BACKOFF_STATUS = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        max_rate: float,
+        concurrency: int,
+        min_rate: float = 0.2,
+        recovery_step: float = 0.1,
+        backoff_seconds: float = 5.0
+    ):
+        """
+        Inicializa o limitador.
+
+        Args:
+            max_rate: Taxa máxima (requisições por segundo).
+            concurrency: Máximo de requisições simultâneas.
+            min_rate: Taxa mínima após backoffs sucessivos.
+            recovery_step: Aumento da taxa a cada resposta bem-sucedida.
+            backoff_seconds: Pausa padrão quando não há Retry-After.
+        """
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.recovery_step = recovery_step
+        self.backoff_seconds = backoff_seconds
+        self.concurrency = concurrency
+
+        self._bucket = TokenBucket(max_rate)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._paused_until = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Taxa atual (requisições por segundo)."""
+        return self._bucket.rate
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        Reserva uma das vagas de requisição simultânea.
+
+        A vaga vale para a requisição inteira, incluindo novas tentativas;
+        cada tentativa ainda precisa passar por throttle().
+
+        Uso:
+            async with limiter.slot():
+                await limiter.throttle()
+                response = await client.get(url)
+        """
+        async with self._semaphore:
+            yield
+
+    async def throttle(self):
+        """Aguarda a pausa de backoff (se houver) e um token do bucket."""
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await self._bucket.acquire()
+
+    def on_response(self, status_code: int, retry_after: Optional[str] = None) -> bool:
+        """
+        Ajusta a taxa conforme a resposta do servidor.
+
+        Args:
+            status_code: Status HTTP recebido.
+            retry_after: Valor do header Retry-After, se houver.
+
+        Returns:
+            True se a resposta pediu backoff (429/5xx).
+        """
+        if status_code in self.BACKOFF_STATUS:
+            self._bucket.rate = max(self.min_rate, self._bucket.rate / 2)
+
+            pause = self.backoff_seconds
+            if retry_after:
+                try:
+                    pause = max(0.0, float(retry_after))
+                except ValueError:
+                    pass
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+
+            logger.warning(
+                f"Servidor respondeu {status_code}, reduzindo taxa para "
+                f"{self._bucket.rate:.2f} req/s e pausando {pause:.1f}s"
+            )
+            return True
+
+        if self._bucket.rate < self.max_rate:
+            self._bucket.rate = min(self.max_rate, self._bucket.rate + self.recovery_step)
+
+        return False
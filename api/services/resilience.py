@@ -0,0 +1,345 @@
+"""
+Camada de resiliência para chamadas HTTP às fontes externas.
+
+Usada por todas as requisições de saída (DistroWatch, Google Sheets):
+- retries com backoff exponencial e jitter ("full jitter") para erros
+  de rede, timeouts e respostas 429/5xx, respeitando Retry-After
+- circuit breaker por host: depois de falhas seguidas, as chamadas para
+  aquele host falham na hora por um tempo, em vez de acumular timeouts
+- deadline por requisição: orçamento total de tempo somando todas as
+  tentativas e esperas
+
+Configuração (variáveis de ambiente):
+- UPSTREAM_MAX_ATTEMPTS (padrão: 3)
+- UPSTREAM_DEADLINE em segundos (padrão: 60)
+- UPSTREAM_BREAKER_THRESHOLD falhas seguidas para abrir (padrão: 5)
+- UPSTREAM_BREAKER_RESET segundos até testar o host de novo (padrão: 30)
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """O circuito do host está aberto; a chamada nem foi tentada."""
+
+
+class DeadlineExceededError(TimeoutError):
+    """O orçamento de tempo da requisição acabou antes de uma resposta útil."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker de um host.
+
+    - closed: chamadas passam; FAILURE_THRESHOLD falhas seguidas abrem
+    - open: chamadas falham na hora até passar reset_timeout
+    - half-open: uma chamada de teste passa; sucesso fecha, falha reabre
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """
+        Inicializa o breaker.
+
+        Args:
+            failure_threshold: Falhas seguidas para abrir o circuito.
+            reset_timeout: Segundos com o circuito aberto antes do teste.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """Estado atual: closed, open ou half-open."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Indica se uma chamada pode ser feita agora."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self):
+        """Registra sucesso (fecha o circuito)."""
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self):
+        """Registra falha (abre o circuito no limite ou se o teste falhou)."""
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    def record_aborted(self):
+        """
+        Registra uma chamada interrompida sem resultado (ex: cancelada).
+
+        Se era a chamada de teste, conta como falha: o circuito reabre e
+        um novo teste é liberado depois de reset_timeout, em vez de o
+        breaker ficar esperando para sempre por um teste que não volta.
+        """
+        if self._probing:
+            self.record_failure()
+
+
+class Resilience:
+    """
+    Retries, circuit breakers por host e deadlines para httpx.
+
+    Uso:
+        response = await get_resilience().get(client, url)
+
+    ou, quando cada tentativa precisa de lógica própria (ex: limitador
+    de taxa):
+        response = await get_resilience().call(url, send_once)
+    """
+
+    RETRY_STATUS = {429, 500, 502, 503, 504}
+    # Falhas do servidor contam para o breaker; 429 é só "vá mais devagar"
+    BREAKER_STATUS = {500, 502, 503, 504}
+
+    MAX_ATTEMPTS = int(os.getenv("UPSTREAM_MAX_ATTEMPTS", "3"))
+    DEADLINE = float(os.getenv("UPSTREAM_DEADLINE", "60"))
+    BASE_DELAY = 0.5
+    MAX_DELAY = 10.0
+    BREAKER_THRESHOLD = int(os.getenv("UPSTREAM_BREAKER_THRESHOLD", "5"))
+    BREAKER_RESET = float(os.getenv("UPSTREAM_BREAKER_RESET", "30"))
+
+    def __init__(
+        self,
+        max_attempts: Optional[int] = None,
+        deadline: Optional[float] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        breaker_threshold: Optional[int] = None,
+        breaker_reset: Optional[float] = None
+    ):
+        """
+        Inicializa a política.
+
+        Args:
+            max_attempts: Tentativas por requisição (padrão: MAX_ATTEMPTS).
+            deadline: Orçamento em segundos por requisição (padrão: DEADLINE).
+            base_delay: Espera base do backoff (padrão: BASE_DELAY).
+            max_delay: Espera máxima entre tentativas (padrão: MAX_DELAY).
+            breaker_threshold: Falhas seguidas para abrir o circuito.
+            breaker_reset: Segundos com o circuito aberto.
+        """
+        self.max_attempts = max(1, max_attempts or self.MAX_ATTEMPTS)
+        self.deadline = deadline or self.DEADLINE
+        self.base_delay = self.BASE_DELAY if base_delay is None else base_delay
+        self.max_delay = self.MAX_DELAY if max_delay is None else max_delay
+        self.breaker_threshold = breaker_threshold or self.BREAKER_THRESHOLD
+        self.breaker_reset = self.BREAKER_RESET if breaker_reset is None else breaker_reset
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        """
+        Circuit breaker do host da URL.
+
+        Args:
+            url: URL da requisição.
+
+        Returns:
+            Breaker compartilhado por todas as chamadas ao host.
+        """
+        host = urlsplit(url).netloc.lower()
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(self.breaker_threshold, self.breaker_reset)
+        return breaker
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Espera antes da próxima tentativa (full jitter).
+
+        Args:
+            attempt: Número da tentativa que falhou (1 = primeira).
+            retry_after: Header Retry-After (em segundos), se houver.
+
+        Returns:
+            Segundos a esperar.
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+        return delay
+
+    async def call(
+        self,
+        url: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+        deadline: Optional[float] = None
+    ) -> httpx.Response:
+        """
+        Executa uma requisição com retries, breaker e deadline.
+
+        Args:
+            url: URL (identifica o host do breaker e aparece nos logs).
+            send: Faz uma tentativa e devolve a resposta.
+            deadline: Orçamento em segundos (padrão: self.deadline).
+
+        Returns:
+            Última resposta recebida (pode ser 429/5xx se as tentativas
+            acabaram; o chamador decide com raise_for_status()).
+
+        Raises:
+            CircuitOpenError: Host com circuito aberto.
+            DeadlineExceededError: Orçamento de tempo esgotado.
+            httpx.RequestError: Erro de rede/protocolo na última tentativa.
+        """
+        breaker = self.breaker(url)
+        expires_at = time.monotonic() + (deadline or self.deadline)
+        attempt = 0
+
+        while True:
+            attempt += 1
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuito aberto para {urlsplit(url).netloc}")
+
+            remaining = expires_at - time.monotonic()
+            if remaining <= 0:
+                raise DeadlineExceededError(f"Deadline esgotado para {url}")
+
+            response = None
+            try:
+                response = await asyncio.wait_for(send(), timeout=remaining)
+            except (httpx.RequestError, asyncio.TimeoutError) as e:
+                breaker.record_failure()
+                if isinstance(e, asyncio.TimeoutError):
+                    e = DeadlineExceededError(f"Deadline esgotado para {url}")
+                if attempt == self.max_attempts:
+                    raise e
+                logger.warning(f"Falha ao buscar {url} (tentativa {attempt}/{self.max_attempts}): {e!r}")
+                error = e
+            except BaseException:
+                # Cancelamento (shutdown, cliente desconectado) ou erro
+                # inesperado: liberar o teste do half-open antes de propagar
+                breaker.record_aborted()
+                raise
+            else:
+                if response.status_code not in self.RETRY_STATUS:
+                    breaker.record_success()
+                    return response
+
+                if response.status_code in self.BREAKER_STATUS:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()  # 429: o host está de pé
+                if attempt == self.max_attempts:
+                    return response
+
+                # Resposta em streaming descartada: liberar a conexão
+                await response.aclose()
+                logger.warning(
+                    f"{url} respondeu {response.status_code} "
+                    f"(tentativa {attempt}/{self.max_attempts})"
+                )
+
+            delay = self.backoff_delay(attempt, response.headers.get("Retry-After") if response else None)
+            if time.monotonic() + delay >= expires_at:
+                # Não dá tempo de outra tentativa: devolver o que temos
+                # (o corpo de uma resposta já lida continua disponível)
+                if response is not None:
+                    return response
+                raise error
+            await asyncio.sleep(delay)
+
+    async def get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        deadline: Optional[float] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        GET com retries, breaker e deadline.
+
+        Args:
+            client: Cliente httpx.
+            url: URL a buscar.
+            deadline: Orçamento em segundos (padrão: self.deadline).
+            kwargs: Repassados a client.get().
+
+        Returns:
+            Resposta recebida.
+        """
+        return await self.call(url, lambda: client.get(url, **kwargs), deadline=deadline)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        deadline: Optional[float] = None,
+        **kwargs
+    ):
+        """
+        GET em streaming com retries, breaker e deadline.
+
+        Os retries valem até a chegada dos headers; o corpo é lido pelo
+        chamador (ex: response.aiter_text()) e a conexão é liberada na
+        saída do bloco.
+
+        Uso:
+            async with get_resilience().stream(client, url) as response:
+                async for chunk in response.aiter_text():
+                    ...
+
+        Args:
+            client: Cliente httpx.
+            url: URL a buscar.
+            deadline: Orçamento em segundos (padrão: self.deadline).
+            kwargs: Repassados a client.build_request().
+        """
+        request = client.build_request("GET", url, **kwargs)
+        response = await self.call(url, lambda: client.send(request, stream=True), deadline=deadline)
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+
+# Instância global (breakers compartilhados entre serviços)
+_resilience: Optional[Resilience] = None
+
+
+def get_resilience() -> Resilience:
+    """
+    Retorna a instância global da camada de resiliência.
+
+    Returns:
+        Instância do Resilience.
+    """
+    global _resilience
+
+    if _resilience is None:
+        _resilience = Resilience()
+
+    return _resilience
@@ -0,0 +1,131 @@
+"""
+Conversão compilada das linhas da planilha em DistroMetadata.
+
+O cabeçalho é compilado uma única vez em um plano: para cada coluna
+conhecida, a posição dela na linha, o campo do modelo e o conversor
+(data, família, ambientes gráficos...). Cada linha é então convertida
+num laço direto sobre o plano, sem dict intermediário por nome de
+coluna nem strip() repetido.
+
+O registro é criado com model_validate() sobre os valores já
+convertidos: com todos os tipos prontos, a validação do pydantic-core
+(em Rust) sai mais barata que DistroMetadata(**kwargs) e que
+model_construct(), que no pydantic 2 percorre os campos em Python.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..models.distro import DistroMetadata
+
+# Coluna (minúsculas) -> [(campo do modelo, conversor)]
+# Conversor None: texto sem espaços nas pontas, vazio vira None
+COLUMNS: Dict[str, List[Tuple[str, Optional[str]]]] = {
+    "distro id": [("id", None)],
+    "name": [("name", None)],
+    "description": [("summary", None), ("description", None)],
+    "logo": [("logo", None)],
+    "logo url": [("logo_url", None)],
+    "os type": [("os_type", None)],
+    "base": [("based_on", None)],
+    "origin": [("origin", None)],
+    "desktop": [("desktop", None), ("desktop_environments", "desktop_environments")],
+    "category": [("category", None)],
+    "status": [("status", None)],
+    "idle ram usage": [("idle_ram_usage", None)],
+    "image size": [("image_size", None)],
+    "office suite": [("office_suite", None)],
+    "price (r$)": [("price", None)],
+    "release date": [("latest_release_date", "date")],
+    "website": [("homepage", None)],
+    "package management": [("package_manager", None)],
+    "architecture": [("architecture", None)],
+}
+
+# Campos preenchidos pela planilha (os demais ficam com o padrão do modelo)
+FIELDS = [field for targets in COLUMNS.values() for field, _ in targets] + ["family"]
+
+
+class SheetRowPlan:
+    """
+    Plano de conversão de um cabeçalho da planilha.
+
+    Uso:
+        plan = SheetRowPlan(headers, converters)
+        distro = plan.convert(row)
+    """
+
+    def __init__(self, headers: List[str], converters: Dict[str, Callable[[str], Any]]):
+        """
+        Compila o plano.
+
+        Args:
+            headers: Cabeçalho da planilha (ordem das colunas).
+            converters: Conversores por nome: 'date', 'desktop_environments',
+                'family' (de based_on) e 'id' (de name, quando não há
+                'Distro ID').
+        """
+        self._converters = converters
+
+        # Coluna repetida: vale a última, como no dict que era montado por linha
+        positions = {header.lower().strip(): index for index, header in enumerate(headers)}
+
+        self.steps: List[Tuple[int, str, Optional[Callable[[str], Any]]]] = []
+        for column, targets in COLUMNS.items():
+            index = positions.get(column)
+            if index is None:
+                continue
+            for field, converter in targets:
+                self.steps.append((index, field, self._memoized(converter) if converter else None))
+
+        self.name_index = positions.get("name")
+        self.os_type_index = positions.get("os type")
+        self._family = self._memoized("family")
+        self._normalize_id = converters["id"]
+        self.unknown = [header for header in headers if header.lower().strip() not in COLUMNS]
+
+    def _memoized(self, name: str) -> Callable[[str], Any]:
+        """Conversor com cache por valor (datas e DEs se repetem muito)."""
+        convert = self._converters[name]
+        cache: Dict[str, Any] = {}
+
+        def converter(value: str) -> Any:
+            try:
+                result = cache[value]
+            except KeyError:
+                result = cache[value] = convert(value)
+            # Listas não podem ser compartilhadas entre registros
+            return list(result) if isinstance(result, list) else result
+
+        return converter
+
+    def convert(self, row: List[str]) -> Optional[DistroMetadata]:
+        """
+        Converte uma linha.
+
+        Args:
+            row: Células da linha (pode ser mais curta que o cabeçalho).
+
+        Returns:
+            DistroMetadata ou None se a linha não tem nome.
+        """
+        size = len(row)
+        if self.name_index is None or self.name_index >= size:
+            return None
+        name = row[self.name_index].strip()
+        if not name:
+            return None
+
+        values: Dict[str, Any] = dict.fromkeys(FIELDS)
+        values["desktop_environments"] = []
+        for index, field, converter in self.steps:
+            value = row[index].strip() if index < size else ""
+            values[field] = converter(value) if converter is not None else (value or None)
+
+        values["id"] = values["id"] or self._normalize_id(name)
+
+        # Sem 'Base', a família sai de 'OS Type'
+        if not values["based_on"] and self.os_type_index is not None and self.os_type_index < size:
+            values["based_on"] = row[self.os_type_index].strip() or None
+        values["family"] = self._family(values["based_on"] or "")
+
+        return DistroMetadata.model_validate(values)
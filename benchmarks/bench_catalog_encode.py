@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark da codificação JSON de /distros.
+
+Compara o custo por requisição de montar uma página do catálogo:
+- model: DistroListResponse(...) + model_dump_json() (caminho do FastAPI
+  com response_model)
+- jsonable: jsonable_encoder + json.dumps (caminho antigo do FastAPI)
+- fragments: CatalogSnapshot.render_page() com o JSON pré-codificado
+
+Também confere que "fragments" gera exatamente os mesmos bytes que "model".
+
+Execute: python benchmarks/bench_catalog_encode.py [--size 290] [--page-size 100]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Adicionar API ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.encoders import jsonable_encoder
+
+from api.cache.catalog import CatalogSnapshot
+from api.models.distro import DistroMetadata, DistroListResponse, DistroFamily, DesktopEnvironment
+
+
+def build_catalog(size: int) -> CatalogSnapshot:
+    """Cria um catálogo sintético com campos preenchidos."""
+    families = list(DistroFamily)
+    desktops = list(DesktopEnvironment)
+    distros = [
+        DistroMetadata(
+            id=f"distro-{i}",
+            name=f"Distro {i} Edição",
+            description="Distribuição Linux de exemplo com uma descrição razoavelmente longa. " * 4,
+            summary="Distribuição Linux de exemplo",
+            os_type="Linux",
+            based_on="Debian",
+            family=families[i % len(families)],
+            origin="Brasil",
+            architecture="x86_64, aarch64",
+            desktop="GNOME, KDE Plasma",
+            desktop_environments=[desktops[i % len(desktops)], desktops[(i + 3) % len(desktops)]],
+            category="Desktop, Live Medium",
+            status="Active",
+            ranking=i + 1,
+            rating=round(5 + (i % 50) / 10, 1),
+            homepage=f"https://distro-{i}.example.org/",
+            logo_url=f"https://example.org/logos/{i}.png",
+            price="R$ 0,00",
+            package_manager="apt",
+            latest_release_date=datetime(2024, 1, 1) + timedelta(days=i),
+        )
+        for i in range(size)
+    ]
+    return CatalogSnapshot(distros, timestamp=datetime.utcnow(), ttl_seconds=86400)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=290, help="Número de distros no catálogo")
+    parser.add_argument("--page-size", type=int, default=100, help="Itens por página")
+    parser.add_argument("--number", type=int, default=500, help="Repetições por medição")
+    args = parser.parse_args()
+
+    catalog = build_catalog(args.size)
+    positions = list(range(min(args.page_size, len(catalog))))
+    page_distros = [catalog.distros[i] for i in positions]
+
+    def encode_model() -> bytes:
+        return DistroListResponse(
+            distros=page_distros,
+            total=len(catalog),
+            page=1,
+            page_size=args.page_size,
+            cache_timestamp=catalog.timestamp
+        ).model_dump_json().encode("utf-8")
+
+    def encode_jsonable() -> bytes:
+        content = jsonable_encoder(DistroListResponse(
+            distros=page_distros,
+            total=len(catalog),
+            page=1,
+            page_size=args.page_size,
+            cache_timestamp=catalog.timestamp
+        ))
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def encode_fragments() -> bytes:
+        return catalog.render_page(positions, total=len(catalog), page=1, page_size=args.page_size)
+
+    assert encode_fragments() == encode_model(), "render_page() diverge de model_dump_json()"
+
+    print(f"Catálogo: {len(catalog)} distros, página de {len(positions)} itens, {args.number} repetições")
+    print()
+
+    baseline = None
+    for label, func in (("model", encode_model), ("jsonable", encode_jsonable), ("fragments", encode_fragments)):
+        elapsed = min(timeit.repeat(func, number=args.number, repeat=5)) / args.number
+        baseline = baseline or elapsed
+        print(f"  {label:<10} {elapsed * 1e6:10.1f} µs/req   ({baseline / elapsed:5.1f}x)")
+
+    print()
+    print("✅ Saída de render_page() idêntica à do DistroListResponse")
+
+
+if __name__ == "__main__":
+    main()
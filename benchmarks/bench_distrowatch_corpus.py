@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Corpus de regressão e benchmark do scraping do DistroWatch.
+
+O corpus fica em benchmarks/fixtures/distrowatch/: páginas sintéticas
+no formato das do DistroWatch (ranking e páginas de distribuições,
+incluindo uma em ISO-8859-1 sem descrição, homepage, nota ou posição no
+ranking). Páginas reais não são versionadas: o conteúdo é do DistroWatch
+e não tem licença para redistribuição.
+
+O resultado esperado de cada página está em expected.json. Os campos
+extraídos das páginas ("pages" e "ranking") vêm do parser antigo
+(BeautifulSoup + html.parser, em bench_distrowatch_parse.py), e não do
+parser lxml que está sendo testado; os registros montados pelo serviço
+("distros" e "service_ranking") foram revisados à mão.
+
+1. Regressão: confere campo a campo
+   - parse_distro_page() / parse_ranking_page() de cada página
+   - o registro montado pelo DistroWatchService (família, DEs, logo...)
+     e fetch_ranking_list(), servindo o corpus via httpx.MockTransport
+2. Benchmark: tempo de parsing por página, pico de memória alocada por
+   parsing (tracemalloc; só alocações Python, a árvore do libxml2 fica
+   de fora) e tempo total de um refresh do ranking completo
+   (ranking + páginas de detalhes, via serviço, sem rede)
+
+Sai com código 1 se alguma página não bate com o esperado.
+
+Execute: python benchmarks/bench_distrowatch_corpus.py [--number 20] [--pages 290]
+         python benchmarks/bench_distrowatch_corpus.py --check-only
+         python benchmarks/bench_distrowatch_corpus.py --update  (regrava expected.json;
+             revise o diff dos registros do serviço antes de versionar)
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from pathlib import Path
+
+import httpx
+
+# Adicionar API ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench_distrowatch_parse import legacy_parse_distro_page, legacy_parse_ranking_page
+
+from api.cache.page_cache import PageCache
+from api.services.distrowatch_parser import parse_distro_page, parse_ranking_page
+from api.services.distrowatch_service import DistroWatchService
+from api.services.parse_executor import ParseExecutor
+
+FIXTURES = Path(__file__).parent / "fixtures" / "distrowatch"
+EXPECTED = FIXTURES / "expected.json"
+RANKING_PAGE = "popularity"
+
+# Charset declarado pelo "servidor" para cada página (padrão: UTF-8)
+CHARSETS = {"solida": "ISO-8859-1"}
+
+
+def load_corpus() -> dict:
+    """Páginas do corpus: {nome: bytes}."""
+    return {path.stem: path.read_bytes() for path in sorted(FIXTURES.glob("*.html"))}
+
+
+def distro_pages(corpus: dict) -> dict:
+    """Somente as páginas de distribuições."""
+    return {name: body for name, body in corpus.items() if name != RANKING_PAGE}
+
+
+def make_transport(corpus: dict) -> httpx.MockTransport:
+    """
+    Serve o corpus como se fosse o DistroWatch.
+
+    Slugs fora do corpus (ranking completo) recebem as páginas do corpus
+    em rodízio.
+    """
+    pages = distro_pages(corpus)
+    names = sorted(pages)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/dwres.php":
+            name = RANKING_PAGE
+        else:
+            slug = request.url.params.get("distribution", "")
+            name = slug if slug in pages else names[sum(map(ord, slug)) % len(names)]
+        charset = CHARSETS.get(name, "UTF-8")
+        return httpx.Response(200, content=corpus[name], headers={"Content-Type": f"text/html; charset={charset}"})
+
+    return httpx.MockTransport(handler)
+
+
+def make_service(corpus: dict, cache_dir: str, executor: ParseExecutor) -> DistroWatchService:
+    return DistroWatchService(
+        base_url="http://distrowatch.test",
+        rate_limit=10000.0,
+        transport=make_transport(corpus),
+        parse_executor=executor,
+        page_cache=PageCache(Path(cache_dir))
+    )
+
+
+def reference_results(corpus: dict) -> dict:
+    """Campos das páginas segundo o parser antigo (referência independente)."""
+    return {
+        "pages": {
+            name: legacy_parse_distro_page(body.decode(CHARSETS.get(name, "utf-8")))
+            for name, body in distro_pages(corpus).items()
+        },
+        "ranking": legacy_parse_ranking_page(corpus[RANKING_PAGE].decode("utf-8"), None),
+    }
+
+
+async def collect_results(corpus: dict) -> dict:
+    """Saída atual do parser e do serviço para todo o corpus."""
+    pages = distro_pages(corpus)
+    results = {
+        "pages": {
+            name: parse_distro_page(body, CHARSETS.get(name, "utf-8"))
+            for name, body in pages.items()
+        },
+        "ranking": parse_ranking_page(corpus[RANKING_PAGE], None, "utf-8"),
+        "distros": {},
+    }
+
+    executor = ParseExecutor(mode="thread", workers=1)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        service = make_service(corpus, cache_dir, executor)
+        try:
+            results["service_ranking"] = await service.fetch_ranking_list()
+            for name in pages:
+                distro = await service.fetch_distro_by_slug(name)
+                results["distros"][name] = (
+                    distro.model_dump(mode="json", exclude={"last_updated"}) if distro else None
+                )
+        finally:
+            await service.close()
+            executor.shutdown()
+
+    return results
+
+
+def diff(expected, actual, path: str = "") -> list:
+    """Diferenças campo a campo entre esperado e obtido."""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        problems = []
+        for key in sorted(set(expected) | set(actual)):
+            if key not in actual:
+                problems.append(f"{path}.{key}: ausente (esperado {expected[key]!r})")
+            elif key not in expected:
+                problems.append(f"{path}.{key}: inesperado ({actual[key]!r})")
+            else:
+                problems += diff(expected[key], actual[key], f"{path}.{key}")
+        return problems
+
+    if isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            return [f"{path}: {len(actual)} itens (esperado {len(expected)})"]
+        problems = []
+        for index, (left, right) in enumerate(zip(expected, actual)):
+            problems += diff(left, right, f"{path}[{index}]")
+        return problems
+
+    return [] if expected == actual else [f"{path}: {actual!r} (esperado {expected!r})"]
+
+
+def check(corpus: dict) -> bool:
+    """Compara o corpus com expected.json."""
+    expected = json.loads(EXPECTED.read_text(encoding="utf-8"))
+    actual = json.loads(json.dumps(asyncio.run(collect_results(corpus))))
+
+    # expected.json não pode se afastar da referência (ex: --update feito
+    # com o parser lxml já errado)
+    reference = reference_results(corpus)
+    problems = [
+        f"{problem} [referência]"
+        for key in ("pages", "ranking")
+        for problem in diff(reference[key], expected[key], f".{key}")
+    ]
+    problems += diff(expected, actual)
+    checked = len(actual["pages"]) + len(actual["distros"]) + 2
+
+    if problems:
+        print(f"✗ Regressão: {len(problems)} diferença(s)")
+        for problem in problems[:50]:
+            print(f"  {problem}")
+        return False
+
+    print(f"✓ Regressão: {checked} resultados conferem com {EXPECTED.name} "
+          f"({len(actual['ranking'])} itens no ranking)")
+    return True
+
+
+def update(corpus: dict):
+    """Regrava expected.json: páginas pela referência, registros pelo serviço."""
+    results = asyncio.run(collect_results(corpus))
+    results.update(reference_results(corpus))
+    EXPECTED.write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"{EXPECTED} atualizado")
+
+
+def peak_allocation(func) -> int:
+    """Pico de memória alocada (bytes) durante uma chamada."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+async def full_refresh(corpus: dict, pages: int, mode: str) -> tuple:
+    """Refresh completo (cache de páginas frio e depois quente)."""
+    executor = ParseExecutor(mode=mode)
+    timings = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for _ in range(2):
+            service = make_service(corpus, cache_dir, executor)
+            try:
+                start = time.perf_counter()
+                distros = await service.fetch_all_from_ranking(limit=pages)
+                timings.append(time.perf_counter() - start)
+            finally:
+                await service.close()
+            assert len(distros) == pages, f"{len(distros)}/{pages} distribuições"
+    executor.shutdown()
+    return timings
+
+
+def benchmark(corpus: dict, number: int, pages: int):
+    print()
+    print(f"Parsing por página (mediana de {number} execuções):")
+    for name, body in corpus.items():
+        if name == RANKING_PAGE:
+            run = lambda: parse_ranking_page(body, None, "utf-8")
+        else:
+            run = lambda: parse_distro_page(body, CHARSETS.get(name, "utf-8"))
+        times = timeit.repeat(run, number=1, repeat=number)
+        peak = peak_allocation(run)
+        print(f"  {name:<12} {len(body) / 1024:6.0f} KiB  {statistics.median(times) * 1e3:7.2f} ms  "
+              f"pico alocado (Python) {peak / 1024:6.0f} KiB")
+
+    print()
+    print(f"Refresh do ranking completo ({pages} páginas de detalhes, sem rede):")
+    for mode in ("thread", "process"):
+        cold, warm = asyncio.run(full_refresh(corpus, pages, mode))
+        print(f"  {mode:<8} frio {cold:6.2f} s ({pages / cold:6.0f} páginas/s)   "
+              f"cache quente {warm:6.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20, help="Execuções por página")
+    parser.add_argument("--pages", type=int, default=290, help="Páginas de detalhes no refresh completo")
+    parser.add_argument("--check-only", action="store_true", help="Só a regressão, sem benchmark")
+    parser.add_argument("--update", action="store_true", help="Regravar expected.json")
+    args = parser.parse_args()
+
+    # Logs do serviço atrapalham a leitura
+    logging.disable(logging.WARNING)
+
+    corpus = load_corpus()
+
+    if args.update:
+        update(corpus)
+        return
+
+    if not check(corpus):
+        sys.exit(1)
+
+    if not args.check_only:
+        benchmark(corpus, args.number, args.pages)
+
+
+if __name__ == "__main__":
+    main()
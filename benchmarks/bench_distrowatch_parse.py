@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Benchmark do parsing das páginas do DistroWatch.
+
+Compara, sobre as fixtures em benchmarks/fixtures/distrowatch/:
+- legacy: BeautifulSoup com html.parser e buscas repetidas (find_all('ul')
+  duas vezes, varredura de todos os <b>), como o serviço fazia antes
+- lxml: api.services.distrowatch_parser (árvore lxml, uma travessia)
+
+Também confere que os dois caminhos extraem os mesmos campos.
+
+Execute: python benchmarks/bench_distrowatch_parse.py [--number 20]
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+from typing import Optional
+
+# Adicionar API ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+
+from api.services.distrowatch_parser import parse_distro_page, parse_ranking_page
+
+FIXTURES = Path(__file__).parent / "fixtures" / "distrowatch"
+CHARSETS = {"solida": "iso-8859-1"}  # demais fixtures em UTF-8
+
+
+def _legacy_metadata_ul(soup, labels):
+    for ul in soup.find_all('ul'):
+        first_li = ul.find('li')
+        if first_li and first_li.find('b'):
+            label_text = first_li.find('b').get_text()
+            if any(label in label_text for label in labels):
+                return ul
+    return None
+
+
+def legacy_parse_distro_page(html: str) -> dict:
+    """Parsing antigo do DistroWatchService (BeautifulSoup + html.parser)."""
+    soup = BeautifulSoup(html, 'html.parser')
+    data = {}
+
+    metadata_ul = _legacy_metadata_ul(soup, ('OS Type', 'Based on'))
+    if not metadata_ul:
+        return {}
+
+    for li in metadata_ul.find_all('li'):
+        label_tag = li.find('b')
+        if not label_tag:
+            continue
+        label = label_tag.get_text(strip=True).replace(':', '').lower()
+        value = ', '.join(
+            child.get_text(strip=True) for child in li.children
+            if getattr(child, 'name', None) == 'a' and child.get_text(strip=True)
+        )
+        for key in ('os type', 'based on', 'origin', 'architecture', 'desktop', 'category'):
+            if key in label:
+                data[key.replace(' ', '_')] = value
+                break
+        else:
+            if 'status' in label:
+                font_tag = li.find('font')
+                data['status'] = font_tag.get_text(strip=True) if font_tag else value
+            elif 'popularity' in label:
+                rank_match = re.search(r'^(\d+)', value)
+                if rank_match:
+                    data['ranking'] = int(rank_match.group(1))
+
+    h1 = soup.find('h1')
+    if h1:
+        data['name'] = h1.get_text(strip=True)
+
+    for b_tag in soup.find_all('b'):
+        text = b_tag.get_text()
+        if re.search(r'\d+\.\d+', text) and '/' not in text:
+            parent_text = b_tag.parent.get_text() if b_tag.parent else ""
+            if 'visitor rating' in parent_text.lower():
+                data['rating'] = float(re.search(r'(\d+\.\d+)', text).group(1))
+                break
+
+    data['homepage'] = None
+    for table in soup.find_all('table', class_='Info'):
+        for row in table.find_all('tr'):
+            th = row.find('th', class_='Info')
+            td = row.find('td', class_='Info')
+            if th and 'home page' in th.get_text().lower() and td and td.find('a', href=True):
+                data['homepage'] = td.find('a', href=True).get('href')
+                break
+        if data['homepage']:
+            break
+
+    data['description'] = None
+    description_ul = _legacy_metadata_ul(soup, ('OS Type',))
+    node = description_ul.next_sibling if description_ul else None
+    while node:
+        if isinstance(node, str):
+            text = node.strip()
+            if len(text) > 50 and any(k in text.lower() for k in ['distribution', 'linux', 'based on', 'operating system', 'focuses on']):
+                data['description'] = text[:500] + "..." if len(text) > 500 else text
+                break
+        node = node.next_sibling
+        if getattr(node, 'name', None) in ['br', 'b', 'table']:
+            break
+
+    data['logo'] = None
+    for img in soup.find_all('img'):
+        src = img.get('src', '')
+        if 'images/yvzhuwbpy/' in src or (src.startswith('images/') and not src.endswith('.gif')):
+            data['logo'] = src
+            break
+
+    return data
+
+
+def legacy_parse_ranking_page(html: str, limit: Optional[int]) -> list:
+    """Parsing antigo do ranking (BeautifulSoup + html.parser)."""
+    soup = BeautifulSoup(html, 'html.parser')
+    target_table = None
+    for th in soup.find_all('th', class_='Invert'):
+        if 'Last 1 month' in th.get_text():
+            target_table = th.find_parent('table')
+            break
+
+    distros = []
+    for row in target_table.find_all('tr') if target_table else []:
+        rank_cell = row.find('th', class_='phr1')
+        name_cell = row.find('td', class_='phr2')
+        hpd_cell = row.find('td', class_='phr3')
+        if rank_cell and name_cell and hpd_cell and name_cell.find('a'):
+            link = name_cell.find('a')
+            hpd_match = re.search(r'(\d+)', hpd_cell.get_text(strip=True))
+            distros.append({
+                'rank': int(rank_cell.get_text(strip=True)),
+                'slug': link.get('href', '').split('/')[-1],
+                'name': link.get_text(strip=True),
+                'hpd': int(hpd_match.group(1)) if hpd_match else 0,
+            })
+            if limit is not None and len(distros) >= limit:
+                break
+    return distros
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20, help="Repetições por medição")
+    parser.add_argument("--limit", type=int, default=290, help="Limite do ranking")
+    args = parser.parse_args()
+
+    distro_pages = {
+        path.stem: path.read_text(encoding=CHARSETS.get(path.stem, "utf-8"))
+        for path in sorted(FIXTURES.glob("*.html"))
+        if path.stem != "popularity"
+    }
+    ranking_page = (FIXTURES / "popularity.html").read_text(encoding="utf-8")
+
+    for slug, html in distro_pages.items():
+        expected = legacy_parse_distro_page(html)
+        assert parse_distro_page(html) == expected, f"{slug}: campos divergem do parser antigo"
+    assert parse_ranking_page(ranking_page, args.limit) == legacy_parse_ranking_page(ranking_page, args.limit), \
+        "ranking diverge do parser antigo"
+
+    page_bytes = sum(len(html) for html in distro_pages.values()) // len(distro_pages)
+    print(f"Fixtures: {len(distro_pages)} páginas de distro (~{page_bytes // 1024} KiB), "
+          f"ranking de {len(ranking_page) // 1024} KiB, {args.number} repetições")
+    print()
+
+    cases = (
+        ("distro", lambda: [legacy_parse_distro_page(h) for h in distro_pages.values()],
+                   lambda: [parse_distro_page(h) for h in distro_pages.values()], len(distro_pages)),
+        ("ranking", lambda: legacy_parse_ranking_page(ranking_page, args.limit),
+                    lambda: parse_ranking_page(ranking_page, args.limit), 1),
+    )
+    for label, legacy, current, pages in cases:
+        legacy_time = min(timeit.repeat(legacy, number=args.number, repeat=3)) / args.number / pages
+        current_time = min(timeit.repeat(current, number=args.number, repeat=3)) / args.number / pages
+        print(f"  {label:<8} legacy {legacy_time * 1e3:8.2f} ms/página   "
+              f"lxml {current_time * 1e3:8.2f} ms/página   ({legacy_time / current_time:5.1f}x)")
+
+    print()
+    print("✅ Campos extraídos idênticos aos do parser antigo")
+
+
+if __name__ == "__main__":
+    main()
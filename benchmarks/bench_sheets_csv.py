@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark da leitura do CSV exportado pelo Google Sheets.
+
+Compara, sobre uma planilha sintética no formato do export gviz (todas
+as células entre aspas, descrições com vírgulas, aspas escapadas e
+quebras de linha):
+- legacy: texto inteiro + split('\\n') + parser caractere a caractere,
+  como GoogleSheetsService fazia antes
+- stream: api.services.csv_stream.iter_csv_rows em pedaços de 64 KiB
+  (como chegam de response.aiter_text())
+
+Confere que "stream" produz exatamente os registros do csv.reader sobre
+o texto inteiro, e conta quantos registros do caminho antigo saem
+quebrados (aspas escapadas, quebras de linha em células).
+
+Execute: python benchmarks/bench_sheets_csv.py [--rows 20000] [--number 3]
+"""
+
+import argparse
+import csv
+import io
+import random
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+# Adicionar API ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.services.csv_stream import iter_csv_rows
+
+CHUNK_SIZE = 64 * 1024
+
+HEADERS = [
+    "Distro ID", "Name", "Description", "Logo", "Logo URL", "OS Type", "Base",
+    "Origin", "Desktop", "Category", "Status", "Idle RAM Usage", "Image Size",
+    "Office Suite", "Price (R$)", "Release Date", "Website", "Package Management",
+    "Architecture",
+]
+
+
+def build_sheet(rows: int) -> str:
+    """Gera o CSV sintético (gviz: todas as células entre aspas)."""
+    rng = random.Random(42)
+    words = "linux kernel desktop rolling release stable pacote leve servidor gamer".split()
+
+    def quote(value: str) -> str:
+        return '"' + value.replace('"', '""') + '"'
+
+    lines = [",".join(quote(header) for header in HEADERS)]
+    for i in range(rows):
+        description = " ".join(rng.choice(words) for _ in range(rng.randint(10, 60)))
+        if i % 5 == 0:
+            description += ', com "aspas"'
+        if i % 7 == 0:
+            description += "\nSegunda linha da descrição."
+        cells = [
+            f"distro-{i}", f"Distro {i}", description, "", f"https://example.org/{i}.png",
+            "Linux", rng.choice(["Debian", "Arch", "Fedora", "Ubuntu", "Independent"]),
+            "Brasil", rng.choice(["GNOME", "KDE Plasma, Xfce", "Cinnamon"]), "Desktop",
+            "Active", f"{rng.randint(300, 1500)} MB", f"{rng.randint(1, 5)}.{rng.randint(0, 9)} GB",
+            "LibreOffice", "R$ 0,00", f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/2024",
+            f"https://distro-{i}.example.org", "apt", "x86_64",
+        ]
+        lines.append(",".join(quote(cell) for cell in cells))
+    return "\n".join(lines) + "\n"
+
+
+def legacy_parse_csv_line(line: str) -> list:
+    values = []
+    current = ""
+    in_quotes = False
+
+    for char in line:
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == ',' and not in_quotes:
+            values.append(current.strip().strip('"'))
+            current = ""
+        else:
+            current += char
+
+    values.append(current.strip().strip('"'))
+    return values
+
+
+def legacy_rows(text: str) -> list:
+    lines = text.strip().split('\n')
+    return [legacy_parse_csv_line(line) for line in lines if line.strip()]
+
+
+def stream_rows(text: str) -> list:
+    chunks = (text[i:i + CHUNK_SIZE] for i in range(0, len(text), CHUNK_SIZE))
+    return list(iter_csv_rows(chunks))
+
+
+def stream_count(text: str) -> int:
+    """Consome os registros sem guardá-los (uso real: um por vez)."""
+    chunks = (text[i:i + CHUNK_SIZE] for i in range(0, len(text), CHUNK_SIZE))
+    return sum(1 for _ in iter_csv_rows(chunks))
+
+
+def legacy_count(text: str) -> int:
+    count = 0
+    for line in text.strip().split('\n'):
+        if line.strip():
+            legacy_parse_csv_line(line)
+            count += 1
+    return count
+
+
+def peak_allocation(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000, help="Linhas da planilha")
+    parser.add_argument("--number", type=int, default=3, help="Repetições por medição")
+    args = parser.parse_args()
+
+    text = build_sheet(args.rows)
+    expected = list(csv.reader(io.StringIO(text)))
+
+    assert stream_rows(text) == expected, "stream diverge do csv.reader"
+    legacy = legacy_rows(text)
+    expected_set = {tuple(row) for row in expected}
+    corrupted = sum(1 for row in legacy if tuple(row) not in expected_set)
+
+    size_mb = len(text.encode("utf-8")) / 1e6
+    print(f"Planilha: {args.rows} linhas, {len(HEADERS)} colunas, {size_mb:.1f} MB")
+    print(f"  legacy: {len(legacy)} registros, {corrupted} que não existem no csv.reader")
+    print(f"  stream: {len(expected)} registros, idênticos ao csv.reader")
+    print()
+
+    for label, func in (("legacy", legacy_count), ("stream", stream_count)):
+        elapsed = min(timeit.repeat(lambda: func(text), number=1, repeat=args.number))
+        peak = peak_allocation(lambda: func(text))
+        print(f"  {label:<8} {elapsed * 1e3:8.1f} ms  {size_mb / elapsed:6.1f} MB/s  "
+              f"{args.rows / elapsed:9.0f} linhas/s  pico alocado {peak / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
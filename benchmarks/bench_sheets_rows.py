@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark da conversão das linhas do Google Sheets em DistroMetadata.
+
+Compara, sobre a planilha sintética de bench_sheets_csv.py:
+- legacy: dict por linha montado a partir do cabeçalho, ~20 buscas por
+  nome de coluna e DistroMetadata(...) com validação completa, como
+  GoogleSheetsService._parse_distro_row fazia antes
+- plan: cabeçalho compilado uma vez (GoogleSheetsService.compile_row_plan)
+  e linhas convertidas por posição com model_validate()
+
+Confere que os dois caminhos produzem os mesmos registros (exceto
+last_updated), inclusive com linhas curtas, colunas repetidas e
+planilha sem 'Base'/'Distro ID'.
+
+Execute: python benchmarks/bench_sheets_rows.py [--rows 20000] [--number 3]
+"""
+
+import argparse
+import csv
+import io
+import logging
+import sys
+import timeit
+from pathlib import Path
+
+# Adicionar API ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench_sheets_csv import HEADERS, build_sheet
+
+from api.models.distro import DistroMetadata
+from api.services.google_sheets_service import GoogleSheetsService
+
+
+def legacy_parse_distro_row(service, headers, row_data):
+    data = {}
+    for i, header in enumerate(headers):
+        if i < len(row_data):
+            data[header.lower().strip()] = row_data[i].strip()
+
+    name = data.get("name", "").strip()
+    if not name:
+        return None
+
+    distro_id = data.get("distro id", "").strip() or service._normalize_id(name)
+    base = data.get("base", "").strip() or data.get("os type", "").strip()
+    desktop_str = data.get("desktop", "").strip()
+
+    return DistroMetadata(
+        id=distro_id,
+        name=name,
+        summary=data.get("description", "").strip() or None,
+        description=data.get("description", "").strip() or None,
+        logo=data.get("logo", "").strip() or None,
+        logo_url=data.get("logo url", "").strip() or None,
+        os_type=data.get("os type", "").strip() or None,
+        family=service._map_family(base),
+        based_on=base or None,
+        origin=data.get("origin", "").strip() or None,
+        desktop=desktop_str or None,
+        desktop_environments=service._parse_desktop_environments(desktop_str),
+        category=data.get("category", "").strip() or None,
+        status=data.get("status", "").strip() or None,
+        idle_ram_usage=data.get("idle ram usage", "").strip() or None,
+        image_size=data.get("image size", "").strip() or None,
+        office_suite=data.get("office suite", "").strip() or None,
+        price=data.get("price (r$)", "").strip() or None,
+        latest_release_date=service._parse_date(data.get("release date", "").strip()),
+        homepage=data.get("website", "").strip() or None,
+        package_manager=data.get("package management", "").strip() or None,
+        architecture=data.get("architecture", "").strip() or None,
+    )
+
+
+def legacy_rows(service, headers, rows):
+    return [legacy_parse_distro_row(service, headers, row) for row in rows]
+
+
+def plan_rows(service, headers, rows):
+    plan = service.compile_row_plan(headers)
+    return [plan.convert(row) for row in rows]
+
+
+def dump(distros):
+    return [
+        (distro.model_dump(exclude={"last_updated"}), sorted(distro.model_fields_set)) if distro else None
+        for distro in distros
+    ]
+
+
+def check(service, headers, rows, label):
+    expected = dump(legacy_rows(service, headers, rows))
+    actual = dump(plan_rows(service, headers, rows))
+    assert actual == expected, f"plan diverge do caminho antigo ({label})"
+
+
+def edge_cases(service, headers, rows):
+    """Variações de cabeçalho e linhas que o caminho antigo aceitava."""
+    sample = rows[:200]
+    check(service, headers, sample, "planilha completa")
+
+    # Linhas curtas, nome vazio, espaços nas pontas
+    ragged = [row[:i % len(row)] for i, row in enumerate(sample)]
+    ragged += [[" " + cell + " " for cell in row] for row in sample[:20]]
+    ragged.append(["x", "   "] + sample[0][2:])
+    check(service, headers, ragged, "linhas curtas")
+
+    # Sem 'Distro ID' e sem 'Base' (família sai de 'OS Type')
+    keep = [i for i, header in enumerate(headers) if header not in ("Distro ID", "Base")]
+    check(service, [headers[i] for i in keep], [[row[i] for i in keep] for row in sample], "sem id/base")
+
+    # Coluna repetida (vale a última) e colunas desconhecidas
+    check(service, headers + [" NAME ", "Extra"], [row + [f"Outro {i}", "?"] for i, row in enumerate(sample)],
+          "colunas repetidas")
+
+    # Sem coluna 'Name'
+    check(service, ["Foo"] + headers[2:], [row[:1] + row[2:] for row in sample], "sem nome")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000, help="Linhas da planilha")
+    parser.add_argument("--number", type=int, default=3, help="Repetições por medição")
+    args = parser.parse_args()
+
+    # Avisos do serviço (planilha sem 'Name') atrapalham a leitura
+    logging.disable(logging.WARNING)
+
+    service = GoogleSheetsService()
+    headers, *rows = list(csv.reader(io.StringIO(build_sheet(args.rows))))
+    assert headers == HEADERS
+
+    edge_cases(service, headers, rows)
+    print(f"Planilha: {len(rows)} linhas, {len(headers)} colunas")
+    print("  plan produz os mesmos registros que o caminho antigo")
+    print()
+
+    for label, func in (("legacy", legacy_rows), ("plan", plan_rows)):
+        elapsed = min(timeit.repeat(lambda: func(service, headers, rows), number=1, repeat=args.number))
+        print(f"  {label:<8} {elapsed * 1e3:8.1f} ms  {len(rows) / elapsed:9.0f} linhas/s  "
+              f"{elapsed / len(rows) * 1e6:6.2f} µs/linha")
+
+
+if __name__ == "__main__":
+    main()
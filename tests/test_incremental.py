@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Teste do refresh incremental do DistroWatch (sem rede).
+
+Serve as páginas de benchmarks/fixtures/distrowatch/ via
+httpx.MockTransport e confere que um registro antigo, refeito sem
+mudanças e publicado no catálogo, não volta a ser refeito na execução
+seguinte.
+
+Execute: python tests/test_incremental.py
+"""
+
+import asyncio
+import logging
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import httpx
+
+# Adicionar API ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.cache.cache_manager import CacheManager
+from api.cache.page_cache import PageCache
+from api.services.distrowatch_service import DistroWatchService
+from api.services.parse_executor import ParseExecutor
+
+FIXTURES = Path(__file__).parent.parent / "benchmarks" / "fixtures" / "distrowatch"
+SLUGS = ["cachyos", "mint", "slackware"]
+MAX_AGE = 3600
+
+
+def make_service(directory: Path, executor: ParseExecutor) -> DistroWatchService:
+    pages = {slug: (FIXTURES / f"{slug}.html").read_bytes() for slug in SLUGS}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = pages[request.url.params["distribution"]]
+        return httpx.Response(200, content=body, headers={"Content-Type": "text/html; charset=UTF-8"})
+
+    return DistroWatchService(
+        base_url="http://distrowatch.test",
+        rate_limit=1000.0,
+        transport=httpx.MockTransport(handler),
+        parse_executor=executor,
+        page_cache=PageCache(directory / "pages")
+    )
+
+
+def backdate(service: DistroWatchService, distros: list, age: timedelta) -> list:
+    """Envelhece páginas do cache e registros, como se o scraping fosse antigo."""
+    old = (datetime.utcnow() - age).isoformat()
+    for distro in distros:
+        entry = service.page_cache.lookup(service.distro_url(distro.id))
+        service.page_cache._write_entry(dict(entry, fetched_at=old))
+    return [distro.model_copy(update={"last_updated": datetime.fromisoformat(old)}) for distro in distros]
+
+
+async def run_stale_records_not_rescraped():
+    ranking = [{"rank": rank, "slug": slug, "name": slug, "hpd": 100 - rank}
+               for rank, slug in enumerate(SLUGS, 1)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        executor = ParseExecutor(mode="thread", workers=1)
+        service = make_service(directory, executor)
+
+        class TempCacheManager(CacheManager):
+            CACHE_DIR = directory / "cache"
+
+        cache_manager = TempCacheManager()
+        try:
+            # Catálogo inicial, com scraping de mais de max_age atrás
+            initial = await service.fetch_ranked_distros(ranking)
+            cache_manager.publish_catalog(backdate(service, initial, timedelta(seconds=MAX_AGE * 2)))
+
+            # 1ª execução: tudo antigo, páginas refeitas (sem mudanças)
+            existing = list(cache_manager.last_catalog().distros)
+            distros, report = await service.fetch_incremental(ranking, existing, max_age=MAX_AGE)
+            print(f"  1ª execução: {report}")
+            assert report["stale"] == len(SLUGS) and report["scraped"] == len(SLUGS), report
+
+            # O snapshot reaproveita os registros anteriores (last_updated antigo)
+            catalog = cache_manager.publish_catalog(distros)
+            assert all(a is b for a, b in zip(catalog.distros, existing))
+
+            # 2ª execução: as páginas acabaram de ser baixadas, nada a refazer
+            distros, report = await service.fetch_incremental(ranking, list(catalog.distros), max_age=MAX_AGE)
+            print(f"  2ª execução: {report}")
+            assert report["scraped"] == 0 and report["reused"] == len(SLUGS), report
+            assert [distro.id for distro in distros] == SLUGS
+        finally:
+            await service.close()
+            executor.shutdown()
+
+
+def test_stale_records_not_rescraped():
+    asyncio.run(run_stale_records_not_rescraped())
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    print("🔍 Testando refresh incremental...")
+    test_stale_records_not_rescraped()
+    print("✅ Registro refeito sem mudanças não é refeito de novo")
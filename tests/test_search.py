@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Teste da busca textual de GET /distros (sem rede).
+
+Publica um catálogo local no cache e confere que uma busca sem nenhum
+termo (só espaços ou pontuação) não filtra nada, em vez de devolver
+zero resultados.
+
+Execute: python tests/test_search.py
+"""
+
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+# Adicionar API ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.testclient import TestClient
+
+from api.cache.cache_manager import CacheManager, get_cache_manager
+from api.main import app
+from api.models.distro import DistroMetadata
+
+NAMES = ["Linux Mint", "Ubuntu", "Fedora", "Debian", "Arch Linux"]
+
+
+def make_client(directory: str) -> TestClient:
+    CacheManager.CACHE_DIR = Path(directory)
+    get_cache_manager().publish_catalog([
+        DistroMetadata(id=name.lower().replace(" ", "-"), name=name) for name in NAMES
+    ])
+    return TestClient(app)
+
+
+def test_empty_search_is_no_filter():
+    with tempfile.TemporaryDirectory() as directory:
+        client = make_client(directory)
+
+        unfiltered = client.get("/distros").json()
+        assert unfiltered["total"] == len(NAMES)
+
+        for query in ["   ", "!!!", "-", "?!.,"]:
+            response = client.get("/distros", params={"search": query})
+            assert response.status_code == 200, response.text
+            body = response.json()
+            print(f"  search={query!r}: {body['total']} resultados")
+            assert body == unfiltered, query
+
+        # Com termos, a busca continua filtrando
+        body = client.get("/distros", params={"search": " linux! "}).json()
+        assert sorted(distro["name"] for distro in body["distros"]) == ["Arch Linux", "Linux Mint"]
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    print("🔍 Testando busca textual...")
+    test_empty_search_is_no_filter()
+    print("✅ Busca sem termos não filtra o catálogo")